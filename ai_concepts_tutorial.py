@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Arrow, Circle, Text, VGroup,
+    DrawBorderThenFill, FadeIn, LaggedStart, Write,
+    BOLD, DOWN, LEFT, PI, RIGHT, UP,
+    BLUE, GREEN, WHITE, YELLOW
+)
 
 class AIConceptsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Dot, Line, Polygon, Rectangle, RoundedRectangle, Square, Text,
+    Triangle, VGroup,
+    Create, FadeIn, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GOLD_E, GRAY, GREEN, ORANGE, PURPLE_E, RED, TEAL, TEAL_E, WHITE, YELLOW
+)
 
 class AlgorithmsTutorial(Scene):
     def construct(self):
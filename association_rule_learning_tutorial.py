@@ -1,46 +1,32 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, VGroup,
+    LaggedStart, ReplacementTransform, Write,
+    BOLD, DOWN, LEFT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
+from glyph_cache import Text
+from sectioned_scene import SectionedScene
+
+class AssociationRuleLearningTutorial(SectionedScene, Scene):
+    sections = (
+        "scene1_intro_part1",
+        "scene1_intro_part2",
+        "scene1_intro_part3",
+        "scene2_terminologies_part1",
+        "scene2_terminologies_part2",
+        "scene2_terminologies_part3",
+        "scene3_apriori_part1",
+        "scene3_apriori_part2",
+        "scene3_apriori_part3",
+        "scene4_eclat_part1",
+        "scene4_eclat_part2",
+        "scene4_eclat_part3",
+        "scene5_applications_part1",
+        "scene5_applications_part2",
+        "scene5_applications_part3",
+    )
 
-class AssociationRuleLearningTutorial(Scene):
-    def construct(self):
-        # Part 1: Introduction (3 scenes)
-        self.scene1_intro_part1()
-        self.clear()
-        self.scene1_intro_part2()
-        self.clear()
-        self.scene1_intro_part3()
-        self.clear()
-        
-        # Part 2: Key Terminologies (3 scenes)
-        self.scene2_terminologies_part1()
-        self.clear()
-        self.scene2_terminologies_part2()
-        self.clear()
-        self.scene2_terminologies_part3()
-        self.clear()
-        
-        # Part 3: Apriori Algorithm (3 scenes)
-        self.scene3_apriori_part1()
-        self.clear()
-        self.scene3_apriori_part2()
-        self.clear()
-        self.scene3_apriori_part3()
-        self.clear()
-        
-        # Part 4: Eclat Algorithm (3 scenes)
-        self.scene4_eclat_part1()
-        self.clear()
-        self.scene4_eclat_part2()
-        self.clear()
-        self.scene4_eclat_part3()
-        self.clear()
-        
-        # Part 5: Real-World Applications (3 scenes)
-        self.scene5_applications_part1()
-        self.clear()
-        self.scene5_applications_part2()
-        self.clear()
-        self.scene5_applications_part3()
-    
     def scene1_intro_part1(self):
         # Title
         title = Text("Association Rule Learning", font_size=48, color=BLUE)
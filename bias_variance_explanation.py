@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Dot, Line, Text, VGroup,
+    Create, FadeIn, FadeOut,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, GREY, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
 
 class BiasVarianceExplanation(Scene):
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Dot, Line, Rectangle, RoundedRectangle, Square, Text, VGroup,
+    VMobject,
+    Create, FadeIn, GrowArrow, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE, BLUE_E, GRAY, GRAY_A, GREEN, ORANGE, PINK, PURPLE, PURPLE_E, RED, TEAL,
+    TEAL_E, WHITE, YELLOW
+)
 import numpy as np
 
 class BinaryDataRepresentationTutorial(Scene):
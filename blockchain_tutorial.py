@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Circle, Line, Text, VGroup,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
+import numpy as np
 
 class BlockchainTutorial(Scene):
     def construct(self):
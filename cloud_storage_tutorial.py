@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, Arrow, Circle, Dot, Line, Mobject, Polygon, Rectangle, RoundedRectangle,
+    Square, Text, VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GREEN, GREEN_E, PURPLE_E, TEAL_E, WHITE, YELLOW
+)
+from components import server_icon
 
 class CloudStorageTutorial(Scene):
     def construct(self):
@@ -75,7 +83,7 @@ class CloudStorageTutorial(Scene):
         # Flowchart: computer → internet → cloud server → phone/tablet
         computer = self._node_box("Computer", self._icon_computer())
         internet = self._node_box("Internet", self._icon_internet())
-        server = self._node_box("Cloud Server", self._icon_server())
+        server = self._node_box("Cloud Server", server_icon())
         phone = self._node_box("Phone", self._icon_phone())
         tablet = self._node_box("Tablet", self._icon_tablet())
 
@@ -160,16 +168,6 @@ class CloudStorageTutorial(Scene):
         lon = VGroup(Arc(radius=0.35, start_angle=-PI/2, angle=PI, color=WHITE), Arc(radius=0.35, start_angle=PI/2, angle=PI, color=WHITE))
         return VGroup(globe, lat, lon)
 
-    def _icon_server(self) -> VGroup:
-        rack = VGroup(
-            RoundedRectangle(width=0.8, height=1.2, corner_radius=0.06, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(UP*0.25),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(DOWN*0.25)
-        )
-        leds = VGroup(*[Dot(radius=0.03, color=GREEN).shift(DOWN*0.4 + RIGHT*(i*0.08 - 0.2)) for i in range(5)])
-        return VGroup(rack, leds)
-
     def _icon_person(self) -> VGroup:
         head = Circle(radius=0.12, color=WHITE)
         body = Line(ORIGIN, DOWN*0.35, color=WHITE)
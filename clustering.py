@@ -0,0 +1,582 @@
+"""Vectorized clustering engines used by the clustering scenes.
+
+The functions here are plain NumPy and return every intermediate step, so
+a scene can animate the algorithm iteration by iteration instead of faking
+the result.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components, minimum_spanning_tree
+from scipy.special import logsumexp
+from scipy.spatial import cKDTree
+
+
+def squared_distances(points, centers):
+    """(N, K) matrix of squared Euclidean distances, computed by broadcasting."""
+    d2 = (
+        np.einsum("ij,ij->i", points, points)[:, None]
+        - 2.0 * points @ centers.T
+        + np.einsum("ij,ij->i", centers, centers)[None, :]
+    )
+    return np.maximum(d2, 0.0)
+
+
+def replay_indices(n_steps, head=3, count=8):
+    """Trace indices worth animating: the first ``head``, then ``count``
+    geometrically spaced ones, always ending with the last step."""
+    if n_steps <= head + count:
+        return list(range(n_steps))
+    spaced = np.geomspace(head, n_steps - 1, count).round().astype(int)
+    return sorted(set(range(head)) | set(spaced.tolist()) | {n_steps - 1})
+
+
+@dataclass
+class KMeansStep:
+    centroids: np.ndarray
+    labels: np.ndarray
+    inertia: float
+
+
+@dataclass
+class KMeansResult:
+    centroids: np.ndarray
+    labels: np.ndarray
+    inertia: float
+    n_iter: int
+    converged: bool
+    trace: list = field(default_factory=list)
+
+
+def kmeans_plus_plus(points, k, rng):
+    """Pick ``k`` initial centroids with the k-means++ seeding rule."""
+    n = len(points)
+    centroids = np.empty((k, points.shape[1]))
+    centroids[0] = points[rng.integers(n)]
+    closest = squared_distances(points, centroids[:1])[:, 0]
+    for i in range(1, k):
+        total = closest.sum()
+        if total == 0:
+            centroids[i:] = centroids[0]
+            break
+        centroids[i] = points[rng.choice(n, p=closest / total)]
+        closest = np.minimum(closest, squared_distances(points, centroids[i:i + 1])[:, 0])
+    return centroids
+
+
+def kmeans(points, k, init="k-means++", max_iter=100, tol=1e-4, seed=None):
+    """Lloyd's K-means with a recorded trace.
+
+    ``init`` is ``"k-means++"``, ``"random"`` or an explicit (k, d) array of
+    starting centroids. Iteration stops when no centroid moves more than
+    ``tol`` (relative to the data scale) or after ``max_iter`` iterations.
+    ``trace[i]`` holds the centroids the points were assigned to in iteration
+    ``i``, those labels and the resulting inertia, so ``trace[0]`` is the
+    initial assignment and ``trace[-1]`` the final one.
+    """
+    points = np.asarray(points, dtype=float)
+    rng = np.random.default_rng(seed)
+    if isinstance(init, str):
+        if init == "k-means++":
+            centroids = kmeans_plus_plus(points, k, rng)
+        elif init == "random":
+            centroids = points[rng.choice(len(points), k, replace=False)].copy()
+        else:
+            raise ValueError(f"Unknown init {init!r}")
+    else:
+        centroids = np.array(init, dtype=float)
+        if centroids.shape != (k, points.shape[1]):
+            raise ValueError(f"init must have shape {(k, points.shape[1])}, got {centroids.shape}")
+
+    threshold = tol * np.mean(np.var(points, axis=0))
+    trace = []
+    converged = False
+    for n_iter in range(1, max_iter + 1):
+        d2 = squared_distances(points, centroids)
+        labels = d2.argmin(axis=1)
+        inertia = float(d2[np.arange(len(points)), labels].sum())
+        trace.append(KMeansStep(centroids.copy(), labels, inertia))
+
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack([np.bincount(labels, weights=points[:, j], minlength=k) for j in range(points.shape[1])], axis=1)
+        new_centroids = centroids.copy()
+        filled = counts > 0
+        new_centroids[filled] = sums[filled] / counts[filled, None]
+        empty = np.flatnonzero(~filled)
+        if len(empty):
+            # Re-seed empty clusters on the points that are worst served now.
+            farthest = np.argsort(d2[np.arange(len(points)), labels])[::-1][:len(empty)]
+            new_centroids[empty] = points[farthest]
+
+        shift = np.sum((new_centroids - centroids) ** 2, axis=1).max()
+        centroids = new_centroids
+        if shift <= threshold:
+            converged = True
+            break
+
+    d2 = squared_distances(points, centroids)
+    labels = d2.argmin(axis=1)
+    inertia = float(d2[np.arange(len(points)), labels].sum())
+    if not np.array_equal(labels, trace[-1].labels) or shift > 0:
+        trace.append(KMeansStep(centroids.copy(), labels, inertia))
+    return KMeansResult(centroids, labels, inertia, n_iter, converged, trace)
+
+
+@dataclass
+class DensityResult:
+    labels: np.ndarray
+    core: np.ndarray
+    n_clusters: int
+    probabilities: np.ndarray = None
+
+
+def dbscan(points, eps, min_samples=5):
+    """DBSCAN on a KD-tree neighbour index.
+
+    ``min_samples`` counts the point itself, as in scikit-learn. Noise gets
+    label -1; ``core`` flags the core points. Border points join the cluster
+    of their first core neighbour.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    pairs = cKDTree(points).query_pairs(eps, output_type="ndarray")
+    counts = np.bincount(pairs.ravel(), minlength=n) + 1
+    core = counts >= min_samples
+
+    labels = np.full(n, -1)
+    both = core[pairs[:, 0]] & core[pairs[:, 1]]
+    core_pairs = pairs[both]
+    graph = coo_matrix((np.ones(len(core_pairs)), (core_pairs[:, 0], core_pairs[:, 1])), shape=(n, n))
+    _, components = connected_components(graph, directed=False)
+    core_idx = np.flatnonzero(core)
+    # Renumber the components that contain core points as 0..n_clusters-1
+    _, cluster_of_core = np.unique(components[core_idx], return_inverse=True)
+    labels[core_idx] = cluster_of_core
+    n_clusters = int(cluster_of_core.max() + 1) if len(core_idx) else 0
+
+    # Border points: non-core points within eps of a core point
+    mixed = pairs[core[pairs[:, 0]] != core[pairs[:, 1]]]
+    if len(mixed):
+        core_end = np.where(core[mixed[:, 0]], mixed[:, 0], mixed[:, 1])
+        border_end = np.where(core[mixed[:, 0]], mixed[:, 1], mixed[:, 0])
+        # Keep the first core neighbour of each border point
+        border, first = np.unique(border_end, return_index=True)
+        labels[border] = labels[core_end[first]]
+    return DensityResult(labels, core, n_clusters)
+
+
+def core_distances(points, min_samples):
+    """Distance from each point to its ``min_samples``-th neighbour (itself included)."""
+    k = min(min_samples, len(points))
+    dist, _ = cKDTree(points).query(points, k=k)
+    return dist if dist.ndim == 1 else dist[:, -1]
+
+
+def _cheapest_edges(tree, points, core, component, n_neighbors):
+    """For every component, its cheapest mutual-reachability edge to another one.
+
+    Returns ``(i, j, weight)`` arrays with ``i`` inside the component. Points
+    of components with up to ``n / 16`` members query growing neighbour lists
+    until nothing unseen could beat the best edge found. Larger components
+    get a KD-tree of the points outside them, and only their points that are
+    closer to the outside than the best edge so far are searched.
+    """
+    n = len(points)
+    n_components = component.max() + 1
+    sizes = np.bincount(component)
+    best_w = np.full(n, np.inf)
+    best_j = np.full(n, -1)
+    component_best = np.full(n_components, np.inf)
+
+    # Components up to this size are searched through the shared tree
+    large = max(n_neighbors, n // 16)
+    todo = np.flatnonzero(sizes[component] <= large)
+    k = min(2 * n_neighbors, n)
+    while len(todo):
+        dist, idx = tree.query(points[todo], k=k)
+        w = np.maximum(dist, np.maximum(core[todo, None], core[idx]))
+        w[component[idx] == component[todo, None]] = np.inf
+        pick = w.argmin(axis=1)
+        best_w[todo] = w[np.arange(len(todo)), pick]
+        best_j[todo] = idx[np.arange(len(todo)), pick]
+        np.minimum.at(component_best, component[todo], best_w[todo])
+        if k == n:
+            break
+        # Anything not seen yet is farther than the last neighbour
+        unseen = np.maximum(dist[:, -1], core[todo])
+        todo = todo[unseen < component_best[component[todo]]]
+        k = min(2 * k, n)
+
+    for c in np.flatnonzero(sizes > large):
+        inside = np.flatnonzero(component == c)
+        outside = np.flatnonzero(component != c)
+        outside_tree = cKDTree(points[outside])
+        d, j = outside_tree.query(points[inside])
+        w = np.maximum(d, np.maximum(core[inside], core[outside[j]]))
+        best = w.argmin()
+        best_w[inside[best]], best_j[inside[best]] = w[best], outside[j[best]]
+        # Only points nearer the outside than that edge can beat it
+        near = inside[np.maximum(d, core[inside]) < w[best]]
+        if len(near):
+            hits = outside_tree.query_ball_point(points[near], w[best])
+            a = np.repeat(near, [len(h) for h in hits])
+            if len(a):
+                b = outside[np.concatenate(hits).astype(int)]
+                w = np.maximum(np.linalg.norm(points[a] - points[b], axis=1), np.maximum(core[a], core[b]))
+                best = w.argmin()
+                if w[best] < best_w[a[best]] or w[best] < component_best[c]:
+                    best_w[a[best]], best_j[a[best]] = w[best], b[best]
+        component_best[c] = best_w[inside].min()
+
+    # One edge per component: its member with the cheapest edge
+    order = np.lexsort((best_w, component))
+    _, first = np.unique(component[order], return_index=True)
+    i = order[first]
+    return i, best_j[i], best_w[i]
+
+
+def mutual_reachability_mst(points, min_samples=5):
+    """Minimum spanning tree of the mutual-reachability graph (Boruvka's algorithm).
+
+    Returns an (N-1, 3) array of ``(i, j, weight)`` edges sorted by weight and
+    the core distances. The dense graph is never materialised: every round
+    joins each component to its nearest one through KD-tree queries, and
+    scipy's ``minimum_spanning_tree`` drops the cycles that equal weights can
+    leave behind.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    tree = cKDTree(points)
+    core = core_distances(points, min_samples)
+    n_neighbors = max(2 * min_samples, 8)
+    # csgraph treats explicit zeros as missing edges
+    tiny = np.finfo(float).tiny
+    rows, cols, weights = [], [], []
+    component = np.arange(n)
+    while component.max() > 0:
+        i, j, w = _cheapest_edges(tree, points, core, component, n_neighbors)
+        rows.append(i)
+        cols.append(j)
+        weights.append(np.maximum(w, tiny))
+        graph = coo_matrix((np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n))
+        _, component = connected_components(graph, directed=False)
+    mst = minimum_spanning_tree(graph.tocsr()).tocoo()
+    edges = np.column_stack([mst.row, mst.col, np.where(mst.data == tiny, 0.0, mst.data)])
+    return edges[np.argsort(edges[:, 2], kind="stable")], core
+
+
+def _single_linkage(edges, n):
+    """Scipy-style linkage rows (left, right, distance, size) from sorted MST edges."""
+    parent = np.arange(2 * n - 1)
+    size = np.ones(2 * n - 1, dtype=int)
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    linkage = np.empty((n - 1, 4))
+    for i, (a, b, w) in enumerate(edges):
+        ra, rb = find(int(a)), find(int(b))
+        node = n + i
+        parent[ra] = parent[rb] = node
+        size[node] = size[ra] + size[rb]
+        linkage[i] = ra, rb, w, size[node]
+    return linkage
+
+
+def _condense(linkage, n, min_cluster_size):
+    """Condensed cluster tree rows (parent, child, lambda, child_size)."""
+    def leaves(node):
+        stack, out = [node], []
+        while stack:
+            x = stack.pop()
+            if x < n:
+                out.append(x)
+            else:
+                left, right = linkage[x - n, :2].astype(int)
+                stack.extend((left, right))
+        return out
+
+    def size(node):
+        return 1 if node < n else int(linkage[node - n, 3])
+
+    root = 2 * n - 2
+    rows = []
+    next_label = n + 1
+    stack = [(root, n)]
+    while stack:
+        node, label = stack.pop()
+        left, right, dist, _ = linkage[node - n]
+        left, right = int(left), int(right)
+        lam = 1.0 / dist if dist > 0 else np.inf
+        big = [child for child in (left, right) if size(child) >= min_cluster_size]
+        for child in (left, right):
+            if len(big) == 2:
+                rows.append((label, next_label, lam, size(child)))
+                if child >= n:
+                    stack.append((child, next_label))
+                next_label += 1
+            elif child in big:
+                # The cluster just shrinks: keep following it under the same label
+                if child >= n:
+                    stack.append((child, label))
+                else:
+                    rows.append((label, child, lam, 1))
+            else:
+                rows.extend((label, leaf, lam, 1) for leaf in leaves(child))
+    return np.array(rows, dtype=float).reshape(-1, 4)
+
+
+def hdbscan(points, min_cluster_size=5, min_samples=None):
+    """HDBSCAN-style clustering from the mutual-reachability MST.
+
+    Builds the single-linkage hierarchy of the MST, condenses it with
+    ``min_cluster_size`` and keeps the clusters with the largest excess of
+    mass. ``probabilities`` is how long each point stays in its cluster
+    relative to the cluster's densest member; ``core`` marks points that are
+    core points (in the DBSCAN sense) at the density where their cluster
+    appears.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    min_samples = min_samples or min_cluster_size
+    labels = np.full(n, -1)
+    if n < 2:
+        return DensityResult(labels, np.zeros(n, dtype=bool), 0, np.zeros(n))
+    edges, core_dist = mutual_reachability_mst(points, min_samples)
+    tree = _condense(_single_linkage(edges, n), n, min_cluster_size)
+    parents, children, lambdas, sizes = tree[:, 0].astype(int), tree[:, 1].astype(int), tree[:, 2], tree[:, 3]
+
+    root = n
+    is_cluster = children >= n
+    cluster_ids = np.unique(np.concatenate([[root], children[is_cluster]]))
+    n_clusters = int(cluster_ids.max()) - n + 1
+    # Per-cluster arrays are indexed by ``cluster - n``
+    birth = np.zeros(n_clusters)
+    birth[children[is_cluster] - n] = lambdas[is_cluster]
+    cluster_parent = np.full(n_clusters, -1)
+    cluster_parent[children[is_cluster] - n] = parents[is_cluster]
+    # Children of every cluster from one sort of the parent column
+    order = np.argsort(parents[is_cluster], kind="stable")
+    sorted_parents = parents[is_cluster][order]
+    sorted_children = children[is_cluster][order]
+    lo = np.searchsorted(sorted_parents, cluster_ids, side="left")
+    hi = np.searchsorted(sorted_parents, cluster_ids, side="right")
+    kids = {c: sorted_children[a:b] for c, a, b in zip(cluster_ids.tolist(), lo, hi)}
+
+    finite = np.where(np.isinf(lambdas), 0.0, lambdas)
+    max_lambda = lambdas[np.isfinite(lambdas)].max() if np.isfinite(lambdas).any() else 1.0
+    finite[np.isinf(lambdas)] = max_lambda
+    stability = np.zeros(n_clusters)
+    np.add.at(stability, parents - n, (finite - birth[parents - n]) * sizes)
+
+    # Excess of mass: walk from the leaves up, the root is never selected.
+    # Children always have larger ids than their parent.
+    selected = np.zeros(n_clusters, dtype=bool)
+    for c in cluster_ids[::-1].tolist():
+        if c == root:
+            continue
+        subtree = stability[kids[c] - n].sum()
+        if len(kids[c]) and subtree > stability[c - n]:
+            stability[c - n] = subtree
+        else:
+            selected[c - n] = True
+            stack = kids[c].tolist()
+            while stack:
+                k = stack.pop()
+                selected[k - n] = False
+                stack.extend(kids[k].tolist())
+
+    chosen = np.flatnonzero(selected) + n
+    number = np.full(n_clusters, -1)
+    number[chosen - n] = np.arange(len(chosen))
+    # Selected ancestor (or the cluster itself) of every cluster, top down
+    owner = np.full(n_clusters, -1)
+    for c in cluster_ids.tolist():
+        if selected[c - n]:
+            owner[c - n] = c
+        elif c != root:
+            owner[c - n] = owner[cluster_parent[c - n] - n]
+    point_rows = ~is_cluster
+    point, cluster, lam = children[point_rows], owner[parents[point_rows] - n], finite[point_rows]
+    inside = cluster >= 0
+    point, cluster, lam = point[inside], cluster[inside], lam[inside]
+    # Number the clusters by their lowest point index, so the labels do not
+    # depend on the order the spanning tree was built in
+    first_point = np.full(len(chosen), n)
+    np.minimum.at(first_point, number[cluster - n], point)
+    number[chosen - n] = np.argsort(np.argsort(first_point))
+    labels[point] = number[cluster - n]
+    point_lambda = np.zeros(n)
+    point_lambda[point] = lam
+    core = np.zeros(n, dtype=bool)
+    cluster_birth = birth[cluster - n]
+    core[point] = np.where(cluster_birth > 0, core_dist[point] <= 1.0 / np.where(cluster_birth > 0, cluster_birth, 1.0), True)
+    probabilities = np.zeros(n)
+    clustered = labels >= 0
+    if clustered.any():
+        peak = np.zeros(len(chosen))
+        np.maximum.at(peak, labels[clustered], point_lambda[clustered])
+        probabilities[clustered] = np.minimum(point_lambda[clustered] / np.where(peak > 0, peak, 1.0)[labels[clustered]], 1.0)
+    return DensityResult(labels, core, len(chosen), probabilities)
+
+
+@dataclass
+class FuzzyCMeansStep:
+    centroids: np.ndarray
+    memberships: np.ndarray
+    objective: float
+
+
+@dataclass
+class FuzzyCMeansResult:
+    centroids: np.ndarray
+    memberships: np.ndarray
+    objective: float
+    n_iter: int
+    converged: bool
+    trace: list = field(default_factory=list)
+
+
+def fuzzy_memberships(points, centroids, m=2.0):
+    """(N, C) membership matrix for fixed centroids; every row sums to 1."""
+    d2 = np.maximum(squared_distances(points, centroids), np.finfo(float).tiny)
+    # u_ij = 1 / sum_k (d_ij / d_ik)^(2/(m-1)), written on squared distances
+    inv = d2 ** (-1.0 / (m - 1.0))
+    return inv / inv.sum(axis=1, keepdims=True)
+
+
+def fuzzy_cmeans(points, c, m=2.0, init=None, max_iter=150, tol=1e-5, seed=None):
+    """Fuzzy C-means with a recorded trace.
+
+    ``m`` is the fuzzifier (> 1; larger means softer memberships). ``init`` is
+    ``None`` for random Dirichlet memberships or an explicit (c, d) array of
+    starting centroids. Iteration stops when no membership changes by more
+    than ``tol`` or after ``max_iter`` iterations. ``trace[i]`` holds the
+    centroids, the (N, c) membership matrix and the objective after
+    iteration ``i``.
+    """
+    if m <= 1:
+        raise ValueError(f"m must be greater than 1, got {m}")
+    points = np.asarray(points, dtype=float)
+    rng = np.random.default_rng(seed)
+    if init is None:
+        u = rng.dirichlet(np.ones(c), len(points))
+    else:
+        centroids = np.array(init, dtype=float)
+        if centroids.shape != (c, points.shape[1]):
+            raise ValueError(f"init must have shape {(c, points.shape[1])}, got {centroids.shape}")
+        u = fuzzy_memberships(points, centroids, m)
+
+    trace = []
+    converged = False
+    for n_iter in range(1, max_iter + 1):
+        um = u ** m
+        centroids = (um.T @ points) / um.sum(axis=0)[:, None]
+        new_u = fuzzy_memberships(points, centroids, m)
+        objective = float(np.sum(new_u ** m * squared_distances(points, centroids)))
+        trace.append(FuzzyCMeansStep(centroids, new_u, objective))
+        change = np.abs(new_u - u).max()
+        u = new_u
+        if change <= tol:
+            converged = True
+            break
+    return FuzzyCMeansResult(centroids, u, objective, n_iter, converged, trace)
+
+
+@dataclass
+class GMMStep:
+    means: np.ndarray
+    covariances: np.ndarray
+    weights: np.ndarray
+    log_likelihood: float
+
+
+@dataclass
+class GMMResult:
+    means: np.ndarray
+    covariances: np.ndarray
+    weights: np.ndarray
+    responsibilities: np.ndarray
+    log_likelihood: float
+    n_iter: int
+    converged: bool
+    trace: list = field(default_factory=list)
+
+
+def gaussian_log_densities(points, means, covariances):
+    """(N, K) matrix of log N(x_n | mu_k, Sigma_k) using one batched Cholesky."""
+    points = np.asarray(points, dtype=float).reshape(len(points), -1)
+    chol = np.linalg.cholesky(covariances)
+    chol_inv = np.linalg.inv(chol)
+    # Whitened residuals z_kn = L_k^-1 (x_n - mu_k), as one (K, N, d) batched matmul
+    z = (points[None, :, :] - means[:, None, :]) @ chol_inv.transpose(0, 2, 1)
+    log_det = 2.0 * np.log(np.diagonal(chol, axis1=1, axis2=2)).sum(axis=1)
+    d = points.shape[1]
+    return -0.5 * (np.sum(z * z, axis=2).T + log_det + d * np.log(2 * np.pi))
+
+
+def mixture_densities(x, means, covariances, weights):
+    """(N, K) weighted component densities pi_k N(x | mu_k, Sigma_k); sum over K for the mixture."""
+    return np.exp(gaussian_log_densities(x, means, covariances) + np.log(weights))
+
+
+def gaussian_mixture(points, k, init="k-means", max_iter=200, tol=1e-6, reg_covar=1e-6, seed=None):
+    """Full-covariance Gaussian mixture fitted by EM, with a recorded trace.
+
+    ``points`` is (N,) or (N, d). ``init`` is ``"k-means"`` (start from a
+    K-means labelling), ``"random"`` or an explicit (k, d) array of starting
+    means. Responsibilities are normalised in log space with log-sum-exp,
+    so far-away points never underflow. Iteration stops when the mean
+    log-likelihood per point improves by less than ``tol``. ``trace[i]``
+    holds the parameters used in E-step ``i`` and the log-likelihood they
+    give, so ``trace[0]`` is the initial guess.
+    """
+    points = np.asarray(points, dtype=float)
+    points = points.reshape(len(points), -1)
+    n, d = points.shape
+    rng = np.random.default_rng(seed)
+    if isinstance(init, str):
+        if init == "k-means":
+            labels = kmeans(points, k, seed=seed).labels
+        elif init == "random":
+            labels = rng.integers(k, size=n)
+        else:
+            raise ValueError(f"Unknown init {init!r}")
+        resp = np.zeros((n, k))
+        resp[np.arange(n), labels] = 1.0
+    else:
+        means = np.array(init, dtype=float).reshape(k, -1)
+        if means.shape != (k, d):
+            raise ValueError(f"init must have shape {(k, d)}, got {means.shape}")
+        resp = np.zeros((n, k))
+        resp[np.arange(n), squared_distances(points, means).argmin(axis=1)] = 1.0
+
+    eye = reg_covar * np.eye(d)
+    trace = []
+    converged = False
+    previous = -np.inf
+    for n_iter in range(1, max_iter + 1):
+        # M-step: weighted means and covariances for every component at once
+        counts = resp.sum(axis=0) + 10 * np.finfo(float).eps
+        weights = counts / n
+        means = (resp.T @ points) / counts[:, None]
+        diff = points[None, :, :] - means[:, None, :]
+        covariances = (resp.T[:, :, None] * diff).transpose(0, 2, 1) @ diff / counts[:, None, None] + eye
+
+        # E-step in log space
+        log_prob = gaussian_log_densities(points, means, covariances) + np.log(weights)
+        log_norm = logsumexp(log_prob, axis=1)
+        resp = np.exp(log_prob - log_norm[:, None])
+        log_likelihood = float(log_norm.sum())
+        trace.append(GMMStep(means, covariances, weights, log_likelihood))
+        if log_likelihood / n - previous / n < tol:
+            converged = True
+            break
+        previous = log_likelihood
+    return GMMResult(means, covariances, weights, resp, log_likelihood, n_iter, converged, trace)
@@ -0,0 +1,162 @@
+"""Recurring characters and icons, built once per process and handed out as copies.
+
+The server rack, browser window and padlock icons appeared as identical
+private helpers in several tutorials, and the thought bubble and stick
+figures lived in the module that first needed them. Each is defined once
+here. The first call builds a template; every later call returns
+``template.copy()``, which duplicates the finished point arrays instead of
+running the arc and bezier maths of every circle, rounded corner and tip
+again. Calling a class with arguments builds a fresh instance.
+
+``python components.py`` prints the cost of building each component against
+copying its template.
+
+Usage:
+    from components import ThoughtBubble, server_icon, lock_icon
+"""
+import functools
+import sys
+import timeit
+
+from manim import (
+    ArcBetweenPoints, Circle, Dot, Ellipse, Line, Rectangle, RoundedRectangle, VGroup,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, GREEN, RED, WHITE, YELLOW
+)
+from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
+
+_templates = {}
+
+
+class _PrebuiltMeta(ConvertToOpenGL):
+    def __call__(cls, *args, **kwargs):
+        if args or kwargs:
+            return super().__call__(*args, **kwargs)
+        template = _templates.get(cls)
+        if template is None:
+            template = _templates[cls] = super().__call__()
+        return template.copy()
+
+    def fresh(cls):
+        """A freshly constructed instance, bypassing the template."""
+        return super().__call__()
+
+
+def prebuilt(build):
+    """Decorator: run ``build()`` once and return a copy of its result on every call."""
+
+    @functools.wraps(build)
+    def copy():
+        template = _templates.get(build)
+        if template is None:
+            template = _templates[build] = build()
+        return template.copy()
+
+    copy.fresh = build
+    return copy
+
+
+class ThoughtBubble(VGroup, metaclass=_PrebuiltMeta):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.width = 3
+        self.height = 2
+
+        # Create thought bubble shape
+        bubble = Ellipse(
+            width=self.width,
+            height=self.height,
+            fill_opacity=0.8,
+            stroke_width=2,
+            fill_color=BLACK,
+            stroke_color=WHITE
+        )
+
+        # Add some small circles for the thought bubble tail
+        tail1 = Dot(radius=0.1, color=WHITE, fill_opacity=0.8).move_to([-1, -0.5, 0])
+        tail2 = Dot(radius=0.08, color=WHITE, fill_opacity=0.8).move_to([-1.3, -0.7, 0])
+        tail3 = Dot(radius=0.06, color=WHITE, fill_opacity=0.8).move_to([-1.6, -0.9, 0])
+
+        self.bubble = bubble
+        self.add(bubble, tail1, tail2, tail3)
+        self.content = None
+
+    def add_content(self, content):
+        self.content = content
+        self.content.move_to(self.bubble.get_center())
+        self.add(self.content)
+        return self
+
+    def pin_to(self, mobject):
+        self.next_to(mobject, RIGHT, buff=0.5)
+        return self
+
+
+class Teacher(VGroup, metaclass=_PrebuiltMeta):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Head
+        head = Circle(radius=0.5, color=BLUE, fill_opacity=0.5)
+        # Body
+        body = Rectangle(height=1, width=0.8, color=BLUE, fill_opacity=0.5).next_to(head, DOWN, buff=0)
+        # Pointer (hand)
+        pointer = Line(ORIGIN, RIGHT*1.5, color=RED, stroke_width=8, tip_length=0.2).add_tip()
+        pointer.next_to(body, RIGHT, buff=0.1)
+
+        self.add(head, body, pointer)
+
+
+# For the person SVG (fallback if not available)
+class Person(Circle, metaclass=_PrebuiltMeta):
+    def __init__(self, **kwargs):
+        super().__init__(radius=0.5, color=WHITE, fill_opacity=1, **kwargs)
+
+
+@prebuilt
+def server_icon():
+    rack = VGroup(
+        RoundedRectangle(width=0.8, height=1.2, corner_radius=0.06, color=WHITE),
+        Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(UP*0.25),
+        Line(LEFT*0.25, RIGHT*0.25, color=WHITE),
+        Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(DOWN*0.25)
+    )
+    leds = VGroup(*[Dot(radius=0.03, color=GREEN).shift(DOWN*0.4 + RIGHT*(i*0.08 - 0.2)) for i in range(5)])
+    return VGroup(rack, leds)
+
+
+@prebuilt
+def browser_icon():
+    window = RoundedRectangle(width=1.6, height=1.0, corner_radius=0.08, color=WHITE)
+    tab = Rectangle(width=0.6, height=0.15, color=WHITE).next_to(window, UP, buff=0)
+    buttons = VGroup(*[Dot(radius=0.04, color=c) for c in (RED, YELLOW, GREEN)]).arrange(RIGHT, buff=0.06).next_to(window.get_top(), DOWN, buff=0.02)
+    return VGroup(window, tab, buttons)
+
+
+@prebuilt
+def lock_icon():
+    return VGroup(
+        RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
+        ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
+        Dot(radius=0.05, color=WHITE)
+    )
+
+
+def bench(number=200):
+    """Microseconds per call: fresh construction against a template copy."""
+    results = {}
+    for component in (ThoughtBubble, Teacher, Person, server_icon, browser_icon, lock_icon):
+        component()  # build the template outside the timing
+        results[component.__name__] = tuple(
+            timeit.timeit(f, number=number) / number * 1e6 for f in (component.fresh, component)
+        )
+    return results
+
+
+def main(argv=None):
+    for name, (built, copied) in bench().items():
+        print(f"{name:<14} build {built:8.0f} us  copy {copied:8.0f} us  ({built / copied:4.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
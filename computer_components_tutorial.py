@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Dot, Line, Mobject, Rectangle, RoundedRectangle, Square, Text,
+    VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GRAY_A, GREEN, GREEN_E, MAROON_E, ORANGE, PURPLE_E,
+    TEAL_E, WHITE, YELLOW, YELLOW_E
+)
 
 class ComputerComponentsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Text,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, UP,
+    BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
+from data_table import Table
 
 class ConfusionMatrixMetricsScene(Scene):
     def construct(self):
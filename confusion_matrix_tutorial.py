@@ -1,5 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Line, MathTex, Square, Text, VGroup,
+    Create, FadeIn, FadeOut, LaggedStart, Write,
+    DL, DOWN, DR, LEFT, ORIGIN, RIGHT, UL, UP, UR,
+    BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
+from components import ThoughtBubble
 import numpy as np
+from data_table import Table
 
 class ConfusionMatrixTutorial(Scene):
     def construct(self):
@@ -346,39 +354,3 @@ class ConfusionMatrixTutorial(Scene):
         
         self.play(Write(final_msg), run_time=1.5)
         self.wait(2)
-
-# Helper class for thought bubble
-class ThoughtBubble(VGroup):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.width = 3
-        self.height = 2
-        
-        # Create thought bubble shape
-        bubble = Ellipse(
-            width=self.width,
-            height=self.height,
-            fill_opacity=0.8,
-            stroke_width=2,
-            fill_color=BLACK,
-            stroke_color=WHITE
-        )
-        
-        # Add some small circles for the thought bubble tail
-        tail1 = Dot(radius=0.1, color=WHITE, fill_opacity=0.8).move_to([-1, -0.5, 0])
-        tail2 = Dot(radius=0.08, color=WHITE, fill_opacity=0.8).move_to([-1.3, -0.7, 0])
-        tail3 = Dot(radius=0.06, color=WHITE, fill_opacity=0.8).move_to([-1.6, -0.9, 0])
-        
-        self.bubble = bubble
-        self.add(bubble, tail1, tail2, tail3)
-        self.content = None
-    
-    def add_content(self, content):
-        self.content = content
-        self.content.move_to(self.bubble.get_center())
-        self.add(self.content)
-        return self
-    
-    def pin_to(self, mobject):
-        self.next_to(mobject, RIGHT, buff=0.5)
-        return self
@@ -0,0 +1,68 @@
+"""Batch conversion between axis coordinates and scene points.
+
+``axes.c2p(x, y)`` inside a comprehension walks Manim's argument-shape
+checks and every axis's ``number_to_point`` once per point. On linear axes
+the mapping is affine, so ``coords_to_points`` measures it once (the origin
+and one step along each axis) and maps a whole ``(N, 2)`` or ``(N, 3)`` array
+with a single matrix product; ``points_to_coords`` inverts it. Axes with a
+logarithmic or other non-linear scaling fall back to Manim's own vectorised
+``c2p``/``p2c``.
+
+Example:
+    dots = Scatter(points, axes)                                   # uses coords_to_points
+    residuals = segments(axes, np.c_[x, y], np.c_[x, y_hat], line_class=DashedLine, color=RED)
+"""
+import numpy as np
+from manim import Line, VGroup
+from manim.mobject.graphing.scale import LinearBase
+
+
+def _is_linear(axes):
+    return all(isinstance(axis.scaling, LinearBase) for axis in axes.get_axes())
+
+
+def _affine(axes, dims):
+    """Origin point and one row per axis: ``point = origin + coords @ basis``."""
+    origin = np.asarray(axes.c2p(*np.zeros(dims)), dtype=float)
+    basis = np.array([np.asarray(axes.c2p(*row), dtype=float) - origin for row in np.eye(dims)])
+    return origin, basis
+
+
+def coords_to_points(axes, coords):
+    """Map one coordinate tuple to a point, or an ``(N, dims)`` array to ``(N, 3)`` points."""
+    coords = np.asarray(coords, dtype=float)
+    single = coords.ndim == 1
+    coords = np.atleast_2d(coords)
+    dims = coords.shape[1]
+    if dims > len(axes.get_axes()):
+        raise ValueError(f"{dims}-dimensional coordinates for {len(axes.get_axes())} axes")
+    if len(coords) == 0:
+        points = np.zeros((0, 3))
+    elif _is_linear(axes):
+        origin, basis = _affine(axes, dims)
+        points = origin + coords @ basis
+    else:
+        points = np.asarray(axes.c2p(*coords.T), dtype=float).reshape(3, -1).T
+    return points[0] if single else points
+
+
+def points_to_coords(axes, points):
+    """Inverse of ``coords_to_points`` for points lying in the axes' plane (or space)."""
+    points = np.asarray(points, dtype=float)
+    single = points.ndim == 1
+    points = np.atleast_2d(points)
+    dims = len(axes.get_axes())
+    if _is_linear(axes):
+        origin, basis = _affine(axes, dims)
+        coords = np.linalg.lstsq(basis.T, (points - origin).T, rcond=None)[0].T
+    else:
+        coords = np.asarray(axes.p2c(points), dtype=float).reshape(-1, dims)
+    return coords[0] if single else coords
+
+
+def segments(axes, starts, ends, line_class=Line, **kwargs):
+    """One line per row from ``starts[i]`` to ``ends[i]`` (axis coordinates), mapped in two batches."""
+    return VGroup(*[
+        line_class(start, end, **kwargs)
+        for start, end in zip(coords_to_points(axes, starts), coords_to_points(axes, ends))
+    ])
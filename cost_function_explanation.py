@@ -1,5 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, DashedLine, MathTex, Text,
+    Create, FadeIn, LaggedStart, ReplacementTransform, Transform, Write,
+    DEGREES, DOWN, LEFT, UP
+)
 import numpy as np
+from coordinates import segments
+from scatter import Scatter
 
 # Color palette
 BLUE = '#58C4DD'
@@ -23,7 +30,7 @@ class CostFunctionExplanation(Scene):
         # Sample data
         x_vals = np.array([1, 2, 3, 4, 5])
         y_vals = np.array([1, 3, 2, 3, 5])
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=YELLOW) for x, y in zip(x_vals, y_vals)])
+        dots = Scatter(np.column_stack([x_vals, y_vals]), axes, colors=YELLOW)
         self.play(LaggedStart(*[FadeIn(dot, scale=0.5) for dot in dots], lag_ratio=0.15))
         self.wait(0.5)
 
@@ -34,16 +41,14 @@ class CostFunctionExplanation(Scene):
         self.play(Create(line_init), Write(eqn_init))
 
         # 3. Show errors (residuals)
-        error_lines = VGroup()
-        for x, y in zip(x_vals, y_vals):
-            y_pred = w_init * x + b_init
-            error = DashedLine(
-                start=axes.c2p(x, y),
-                end=axes.c2p(x, y_pred),
-                color=RED,
-                stroke_width=2
-            )
-            error_lines.add(error)
+        error_lines = segments(
+            axes,
+            np.column_stack([x_vals, y_vals]),
+            np.column_stack([x_vals, w_init * x_vals + b_init]),
+            line_class=DashedLine,
+            color=RED,
+            stroke_width=2
+        )
         self.play(LaggedStart(*[Create(line) for line in error_lines], lag_ratio=0.1))
         self.wait(0.5)
 
@@ -63,16 +68,14 @@ class CostFunctionExplanation(Scene):
         self.wait(0.5)
 
         # 6. Show new (smaller) errors
-        new_error_lines = VGroup()
-        for x, y in zip(x_vals, y_vals):
-            y_pred = w_opt * x + b_opt
-            error = DashedLine(
-                start=axes.c2p(x, y),
-                end=axes.c2p(x, y_pred),
-                color=GREEN,
-                stroke_width=2
-            )
-            new_error_lines.add(error)
+        new_error_lines = segments(
+            axes,
+            np.column_stack([x_vals, y_vals]),
+            np.column_stack([x_vals, w_opt * x_vals + b_opt]),
+            line_class=DashedLine,
+            color=GREEN,
+            stroke_width=2
+        )
         self.play(ReplacementTransform(error_lines, new_error_lines))
         self.wait(1)
 
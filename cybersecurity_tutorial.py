@@ -1,4 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Arrow, Circle, Line, Mobject, Polygon, Rectangle,
+    RoundedRectangle, Square, Star, Text, VGroup,
+    FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, GREEN, MAROON_E, ORANGE, PURPLE_E, RED, TEAL_E, WHITE, YELLOW,
+    YELLOW_E
+)
+from components import lock_icon
 
 class CybersecurityTutorial(Scene):
     def construct(self):
@@ -58,7 +67,7 @@ class CybersecurityTutorial(Scene):
         self.play(Write(example))
 
         https_note = Text("HTTPS = your data is encrypted in transit", font_size=24, color=YELLOW).next_to(example, DOWN, buff=0.6)
-        lock = self._icon_lock().next_to(https_note, RIGHT, buff=0.4)
+        lock = lock_icon().next_to(https_note, RIGHT, buff=0.4)
         self.play(Write(https_note), FadeIn(lock, shift=UP))
         self.wait(1.5)
 
@@ -124,17 +133,9 @@ class CybersecurityTutorial(Scene):
         stand = VGroup(Rectangle(width=0.2, height=0.3, color=WHITE).next_to(screen, DOWN, buff=0.05), Rectangle(width=0.9, height=0.08, color=WHITE).next_to(screen, DOWN, buff=0.25))
         return VGroup(screen, stand)
 
-    def _icon_lock(self) -> VGroup:
-        lock = VGroup(
-            RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
-            ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
-            Dot(radius=0.05, color=WHITE)
-        )
-        return lock
-
     def _icon_keylock(self) -> VGroup:
         key = VGroup(Line(LEFT*0.25, RIGHT*0.25, color=WHITE), Circle(radius=0.08, color=WHITE).next_to(ORIGIN, LEFT, buff=0)).arrange(RIGHT, buff=0.05)
-        lock = self._icon_lock().scale(0.7)
+        lock = lock_icon().scale(0.7)
         return VGroup(key, lock)
 
     def _icon_firewall(self) -> VGroup:
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Circle, Line, Mobject, Rectangle, RoundedRectangle, Text, VGroup,
+    VMobject,
+    Create, FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GREEN, TEAL_E, WHITE, YELLOW, YELLOW_E
+)
+import numpy as np
 
 class DataInformationKnowledgeTutorial(Scene):
     def construct(self):
@@ -0,0 +1,110 @@
+"""Drop-in ``Table`` for the data tables in the tutorials.
+
+Manim's ``Table`` builds a ``Paragraph`` per cell and, while drawing the
+grid, rebuilds a ``VGroup`` of every row (or column) several times for each
+line, which grows quadratically with the table. This ``Table``:
+
+- builds single-line cells with the cached ``Text`` from ``glyph_cache``, so
+  a value that appears in many cells (``"Yes"``, ``"Sunny"``) is shaped once;
+- measures every cell's bounding box in one pass and places all grid lines
+  from those arrays;
+- memoises whole tables in the glyph cache (in memory and in
+  ``.glyph_cache/``), so the same table in another scene or a later render
+  is a copy. Tables with Mobject entries or labels are built every time.
+
+Usage (after the ``from manim import ...`` list):
+    from data_table import Table
+"""
+import manim
+import numpy as np
+from manim import Line, Mobject, Paragraph, VGroup
+
+from glyph_cache import Text, _GlyphCacheMeta, _init_signature
+
+
+def cell(item, **config):
+    """Table entry: cached ``Text`` for one-line values, ``Paragraph`` for the rest."""
+    if isinstance(item, Mobject):
+        return item
+    text = str(item)
+    if not text or "\n" in text:
+        return Paragraph(text, **config)
+    return Text(text, **config)
+
+
+def _with_default(signature, name, default):
+    return signature.replace(parameters=[
+        p.replace(default=default) if p.name == name else p for p in signature.parameters.values()
+    ])
+
+
+class Table(manim.Table, metaclass=_GlyphCacheMeta):
+    _signature = _with_default(_init_signature(manim.Table.__init__), "element_to_mobject", cell)
+
+    def __init__(self, table, *args, element_to_mobject=cell, **kwargs):
+        super().__init__(table, *args, element_to_mobject=element_to_mobject, **kwargs)
+
+    @staticmethod
+    def _cacheable(params):
+        entries = [item for row in params["table"] for item in row]
+        entries += list(params["row_labels"] or []) + list(params["col_labels"] or [])
+        entries.append(params["top_left_entry"])
+        return not any(isinstance(entry, Mobject) for entry in entries)
+
+    @staticmethod
+    def _recolorable(params):
+        return False
+
+    def _cell_bounds(self):
+        """``(rows, cols, 4)`` array of x min, x max, y min, y max per cell (NaN when empty)."""
+        bounds = np.full((len(self.mob_table), len(self.mob_table[0]), 4), np.nan)
+        for i, row in enumerate(self.mob_table):
+            for j, mob in enumerate(row):
+                points = mob.get_all_points()
+                if len(points):
+                    (x_min, y_min), (x_max, y_max) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+                    bounds[i, j] = x_min, x_max, y_min, y_max
+        return bounds
+
+    def _lines(self, starts, ends):
+        lines = VGroup(*[Line(start, end, **self.line_config) for start, end in zip(starts, ends)])
+        self.add(*lines)
+        return lines
+
+    def _add_horizontal_lines(self):
+        self._bounds = self._cell_bounds()
+        tops = np.nanmax(self._bounds[:, :, 3], axis=1)
+        bottoms = np.nanmin(self._bounds[:, :, 2], axis=1)
+        ys = []
+        if self.include_outer_lines:
+            ys += [tops[0] + 0.5 * self.v_buff, bottoms[-1] - 0.5 * self.v_buff]
+        if self.include_inner_lines:
+            ys += list(tops[1:] + 0.5 * (bottoms[:-1] - tops[1:]))
+        ys = np.array(ys, dtype=float)
+        left = np.full_like(ys, self.get_left()[0] - 0.5 * self.h_buff)
+        right = np.full_like(ys, self.get_right()[0] + 0.5 * self.h_buff)
+        self.horizontal_lines = self._lines(
+            np.column_stack([left, ys, np.zeros_like(ys)]),
+            np.column_stack([right, ys, np.zeros_like(ys)]),
+        )
+        return self
+
+    def _add_vertical_lines(self):
+        lefts = np.nanmin(self._bounds[:, :, 0], axis=0)
+        rights = np.nanmax(self._bounds[:, :, 1], axis=0)
+        top = np.nanmax(self._bounds[:, :, 3]) + 0.5 * self.v_buff
+        bottom = np.nanmin(self._bounds[:, :, 2]) - 0.5 * self.v_buff
+        del self._bounds
+        # (x, y_start, y_end): outer lines are drawn downwards, inner ones upwards, as in Manim
+        spans = []
+        if self.include_outer_lines:
+            spans += [(lefts[0] - 0.5 * self.h_buff, top, bottom), (rights[-1] + 0.5 * self.h_buff, top, bottom)]
+        if self.include_inner_lines:
+            spans += [(x, bottom, top) for x in lefts[1:] + 0.5 * (rights[:-1] - lefts[1:])]
+        spans = np.array(spans).reshape(-1, 3)
+        zeros = np.zeros(len(spans))
+        self.vertical_lines = self._lines(
+            np.column_stack([spans[:, 0], spans[:, 1], zeros]),
+            np.column_stack([spans[:, 0], spans[:, 2], zeros]),
+        )
+        return self
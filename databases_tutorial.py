@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Arrow, Circle, Dot, Ellipse, Line, Mobject, Rectangle,
+    RoundedRectangle, Square, Text, Triangle, VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, PURPLE_E, TEAL_E, WHITE, YELLOW, YELLOW_E
+)
+from components import server_icon
 
 class DatabasesTutorial(Scene):
     def construct(self):
@@ -56,7 +64,7 @@ class DatabasesTutorial(Scene):
         camera = self._badge("Cameras", self._icon_cam(), GRAY)
         sources = VGroup(phone, sensor, camera).arrange(RIGHT, buff=0.6)
 
-        servers = VGroup(*[self._icon_server() for _ in range(3)]).arrange(RIGHT, buff=0.4)
+        servers = VGroup(*[server_icon() for _ in range(3)]).arrange(RIGHT, buff=0.4)
         cloud = self._badge("Cloud", self._icon_cloud(), PURPLE_E)
 
         flow = VGroup(sources, servers, cloud).arrange(DOWN, buff=0.8).next_to(vs, DOWN, buff=0.8)
@@ -135,16 +143,6 @@ class DatabasesTutorial(Scene):
         lens = Circle(radius=0.08, color=WHITE).move_to(body.get_center())
         return VGroup(body, lens)
 
-    def _icon_server(self) -> VGroup:
-        rack = VGroup(
-            RoundedRectangle(width=0.8, height=1.2, corner_radius=0.06, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(UP*0.25),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(DOWN*0.25)
-        )
-        leds = VGroup(*[Dot(radius=0.03, color=GREEN).shift(DOWN*0.4 + RIGHT*(i*0.08 - 0.2)) for i in range(5)])
-        return VGroup(rack, leds)
-
     def _icon_cloud(self) -> VGroup:
         puffs = VGroup(Circle(radius=0.25, color=WHITE), Circle(radius=0.3, color=WHITE), Circle(radius=0.22, color=WHITE))
         puffs.arrange(RIGHT, buff=-0.1)
@@ -1,5 +1,22 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Dot, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut, Transform,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GOLD, GREEN, MAROON, ORANGE, PINK, PURPLE, RED, TEAL, WHITE, YELLOW
+)
 import numpy as np
+from clustering import dbscan, hdbscan
+from data_table import Table
+from scatter import Scatter
+from tutorial_animations import StaggeredRecolor
+
+CLUSTER_COLORS = [YELLOW, BLUE, GREEN, PURPLE, ORANGE, TEAL, PINK, GOLD, MAROON]
+
+
+def cluster_colors(labels, noise_color=RED, palette=CLUSTER_COLORS):
+    return [noise_color if label < 0 else palette[label % len(palette)] for label in labels]
+
 
 class DBSCANHDBSCANClusteringExplanation(Scene):
     def construct(self):
@@ -29,7 +46,7 @@ class DBSCANHDBSCANClusteringExplanation(Scene):
             np.random.normal([1.5, 2], 0.4, (7, 2)),
             np.random.normal([8, 7], 0.2, (4, 2))
         ])
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=WHITE, radius=0.09) for x, y in points])
+        dots = Scatter(points, axes, colors=WHITE, radius=0.09)
         self.play(Create(axes), FadeIn(dots))
         self.wait(1.2)
         self.play(FadeOut(sec2))
@@ -37,16 +54,13 @@ class DBSCANHDBSCANClusteringExplanation(Scene):
         # 3. Core, Border, Noise
         sec3 = Text("3. DBSCAN: Core, Border, Noise", font_size=32, color=PURPLE).next_to(title, DOWN, buff=0.5)
         self.play(FadeIn(sec3))
-        # Example: highlight core, border, noise
-        core = [0, 1, 2, 3, 10, 19, 22, 28]
-        border = [4, 11, 12, 20, 24, 27]
-        noise = [5, 7, 29, 30, 32]
-        for i in core:
-            dots[i].set_color(GREEN)
-        for i in border:
-            dots[i].set_color(YELLOW)
-        for i in noise:
-            dots[i].set_color(RED)
+        # Run DBSCAN and highlight core, border, noise
+        eps, min_samples = 0.6, 5
+        result = dbscan(points, eps, min_samples)
+        kinds = np.where(result.core, 0, np.where(result.labels >= 0, 1, 2))
+        self.play(StaggeredRecolor(dots, [[GREEN, YELLOW, RED][k] for k in kinds], per_element_delay=0.02))
+        params = MathTex(rf"\varepsilon = {eps},\ \text{{MinPts}} = {min_samples}", font_size=28).next_to(axes, UP, buff=0.1)
+        self.play(FadeIn(params))
         legend = VGroup(
             Dot(color=GREEN), Text("Core", font_size=22, color=GREEN),
             Dot(color=YELLOW), Text("Border", font_size=22, color=YELLOW),
@@ -54,7 +68,7 @@ class DBSCANHDBSCANClusteringExplanation(Scene):
         ).arrange(RIGHT, buff=0.3).next_to(axes, DOWN, buff=0.2)
         self.play(FadeIn(legend))
         self.wait(2)
-        self.play(FadeOut(sec3), FadeOut(legend), FadeOut(axes), FadeOut(dots))
+        self.play(FadeOut(sec3), FadeOut(legend), FadeOut(params), FadeOut(axes), FadeOut(dots))
 
         # 4. DBSCAN Steps
         sec4 = Text("4. How DBSCAN Works", font_size=32, color=BLUE).next_to(title, DOWN, buff=0.5)
@@ -152,26 +166,35 @@ class DBSCANHDBSCANClusteringExplanation(Scene):
         axes2.next_to(sec11, DOWN, buff=0.6)
         # Simulate GPS data with tight and loose clusters
         np.random.seed(7)
-        tight = np.random.normal([2, 6], 0.3, (15, 2))
-        loose = np.random.normal([7, 2], 1.0, (15, 2))
-        noise = np.random.uniform([0,0], [10,8], (6,2))
-        allpts = np.vstack([tight, loose, noise])
-        # DBSCAN coloring: can't separate loose cluster well
-        dbscan_colors = [YELLOW]*15 + [BLUE]*15 + [RED]*6
-        dbscan_dots = VGroup(*[Dot(axes2.c2p(x, y), color=col, radius=0.11) for (x, y), col in zip(allpts, dbscan_colors)])
-        self.play(Create(axes2), FadeIn(dbscan_dots))
+        tight = np.random.normal([2, 6], 0.3, (600, 2))
+        loose = np.random.normal([7, 2], 1.0, (600, 2))
+        noise = np.random.uniform([0,0], [10,8], (150,2))
+        allpts = np.clip(np.vstack([tight, loose, noise]), [0, 0], [10, 8])
+        gps_dots = Scatter(allpts, axes2, colors=WHITE, radius=0.035)
+        self.play(Create(axes2), FadeIn(gps_dots))
+        # DBSCAN with a single epsilon: too small splits the loose cluster, larger merges noise
         db_label = Text("DBSCAN: struggles with varying density", font_size=24, color=YELLOW).next_to(axes2, DOWN, buff=0.2)
         self.play(FadeIn(db_label))
-        self.wait(1.5)
-        self.play(FadeOut(dbscan_dots), FadeOut(db_label))
-        # HDBSCAN coloring: can adapt
-        hdbscan_colors = [GREEN]*15 + [PURPLE]*15 + [RED]*6
-        hdbscan_dots = VGroup(*[Dot(axes2.c2p(x, y), color=col, radius=0.11) for (x, y), col in zip(allpts, hdbscan_colors)])
-        self.play(FadeIn(hdbscan_dots))
+        sweep_label = None
+        for eps in [0.15, 0.25, 0.4]:
+            result = dbscan(allpts, eps, min_samples=10)
+            label = Text(f"eps = {eps}: {result.n_clusters} clusters, {np.sum(result.labels < 0)} noise points", font_size=22).next_to(axes2, UP, buff=0.1)
+            recolor = gps_dots.animate(run_time=0.8).set_colors(cluster_colors(result.labels))
+            if sweep_label is None:
+                self.play(recolor, FadeIn(label))
+            else:
+                self.play(recolor, Transform(sweep_label, label))
+            sweep_label = sweep_label or label
+            self.wait(1)
+        self.play(FadeOut(db_label), FadeOut(sweep_label))
+        # HDBSCAN: no epsilon, adapts to both densities
+        result = hdbscan(allpts, min_cluster_size=25, min_samples=10)
+        hdbscan_colors = cluster_colors(result.labels, palette=[GREEN, PURPLE] + CLUSTER_COLORS[2:])
+        self.play(gps_dots.animate.set_colors(hdbscan_colors), run_time=0.8)
         hdb_label = Text("HDBSCAN: adapts to both densities", font_size=24, color=GREEN).next_to(axes2, DOWN, buff=0.2)
         self.play(FadeIn(hdb_label))
         self.wait(1.5)
-        self.play(FadeOut(hdbscan_dots), FadeOut(hdb_label), FadeOut(axes2), FadeOut(sec11))
+        self.play(FadeOut(gps_dots), FadeOut(hdb_label), FadeOut(axes2), FadeOut(sec11))
 
         # 12. Advantages HDBSCAN
         sec12 = Text("12. Advantages of HDBSCAN", font_size=30, color=GREEN).next_to(title, DOWN, buff=0.5)
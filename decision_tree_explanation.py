@@ -1,5 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Text, VGroup,
+    FadeIn, FadeOut, GrowArrow,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, GREY_B, RED, WHITE, YELLOW
+)
 import numpy as np
+from data_table import Table
 
 class DecisionTreeExplanation(Scene):
     def construct(self):
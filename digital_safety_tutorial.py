@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, ReplacementTransform, Write,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, RED, YELLOW
+)
 
 class DigitalSafetyTutorial(Scene):
     def construct(self):
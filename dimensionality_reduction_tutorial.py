@@ -1,6 +1,14 @@
-from manim import *
+from manim import (
+    ThreeDScene,
+    Arrow, Axes, DashedLine, Dot, MathTex, Rectangle, Text, ThreeDAxes, VGroup,
+    Create, FadeIn, FadeOut, ReplacementTransform, Transform, Write,
+    BOLD, DEGREES, DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, BLUE_A, BLUE_E, GREEN, RED, WHITE, YELLOW
+)
 import numpy as np
 
+from point_cloud import PointCloud3D, gradient_rgbas
+
 class DimensionalityReductionTutorial(ThreeDScene):
     def construct(self):
         # Part 1: Introduction (2 scenes)
@@ -49,7 +57,7 @@ class DimensionalityReductionTutorial(ThreeDScene):
     def scene1a_intro_graph(self):
         # Create a more spread out 3D point cloud
         np.random.seed(42)
-        n_points = 100
+        n_points = 10_000
         
         # Create points in a 3D plane with some noise
         t = np.linspace(-2, 2, n_points)
@@ -66,25 +74,9 @@ class DimensionalityReductionTutorial(ThreeDScene):
         )
         
         # Create 3D point cloud with depth shading
-        cloud_3d = VGroup(*[
-            Dot3D(
-                point=[x[i], y[i], z[i]],
-                color=interpolate_color(BLUE_E, BLUE_A, (z[i] + 1.5)/3),
-                radius=0.04,
-                resolution=8
-            )
-            for i in range(n_points)
-        ])
-        
-        # Create 2D projection (onto xy-plane)
-        cloud_2d = VGroup(*[
-            Dot(
-                point=[x[i], y[i], 0],
-                color=GREEN,
-                radius=0.04
-            )
-            for i in range(n_points)
-        ])
+        xyz = np.column_stack([x, y, z])
+        cloud_3d = PointCloud3D(xyz, gradient_rgbas(z, BLUE_E, BLUE_A, -1.5, 1.5), radius=0.02)
+        cloud_3d.add_depth_sorting(self.renderer.camera)
         
         # Add explanation text
         explanation = Text("3D Data with Clear Dimensional Structure", font_size=28)
@@ -97,7 +89,7 @@ class DimensionalityReductionTutorial(ThreeDScene):
         self.play(Write(explanation))
         self.play(
             Create(axes),
-            LaggedStart(*[GrowFromCenter(dot) for dot in cloud_3d], lag_ratio=0.01),
+            Create(cloud_3d),
             run_time=2
         )
         
@@ -120,7 +112,8 @@ class DimensionalityReductionTutorial(ThreeDScene):
             Transform(explanation, new_explanation)
         )
         
-        # Animate projection to 2D
+        # Animate projection to 2D (onto xy-plane)
+        cloud_2d = cloud_3d.projected(color=GREEN)
         self.play(
             Transform(cloud_3d, cloud_2d),
             FadeOut(plane),
@@ -1,5 +1,14 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Circle, Line, MathTex, SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, Flash, GrowFromCenter, LaggedStart, ReplacementTransform,
+    Write,
+    DOWN, UP,
+    BLUE, BLUE_C, GREEN, PINK, PURPLE, RED, WHITE, YELLOW,
+    there_and_back
+)
 import numpy as np
+from scatter import Scatter
 
 class EDUERAIntro(Scene):
     def construct(self):
@@ -38,7 +47,7 @@ class EDUERAIntro(Scene):
         np.random.seed(42)
         x_vals = np.linspace(1, 9, 12)
         y_vals = 1.2 * x_vals + 2 + np.random.normal(0, 0.8, len(x_vals))
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=YELLOW) for x, y in zip(x_vals, y_vals)])
+        dots = Scatter(np.column_stack([x_vals, y_vals]), axes, colors=YELLOW)
         
         # Best fit line
         line = axes.plot(lambda x: 1.2 * x + 2, color=GREEN)
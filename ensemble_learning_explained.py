@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, BulletedList, Circle, Dot, Rectangle, Text, VGroup,
+    Create, FadeIn, FadeOut,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, GREY, ORANGE, PURPLE, WHITE, YELLOW
+)
+from data_table import Table
 
 class EnsembleLearningExplained(Scene):
     def construct(self):
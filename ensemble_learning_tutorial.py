@@ -1,8 +1,35 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Axes, Circle, Dot, Line, MathTex, Rectangle, SurroundingRectangle, VGroup,
+    Create, FadeIn, FadeOut, LaggedStart, Transform, Write,
+    DOWN, LEFT, PI, RIGHT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
 import numpy as np
 from manim.mobject.geometry.tips import ArrowTriangleFilledTip
+from coordinates import segments
+from data_table import Table
+from glyph_cache import Text
+from scatter import Scatter
+from sectioned_scene import SectionedScene
+
+class EnsembleLearningTutorial(SectionedScene, Scene):
+    sections = (
+        "scene1_intro",
+        "scene2_what_is_ensemble",
+        "scene3a_bagging_concept",
+        "scene3b_bagging_visual",
+        "scene4a_boosting_concept",
+        "scene4b_student_analogy",
+        "scene4c_boosting_math",
+        "scene4d_boosting_visual",
+        "scene5a_stacking_concept",
+        "scene5b_sports_analogy",
+        "scene5c_stacking_visual",
+        "scene6_comparison",
+        "scene7_outro",
+    )
 
-class EnsembleLearningTutorial(Scene):
     def create_point_with_icon(self, icon, text, color=WHITE):
         return VGroup(
             Text(icon, font_size=28).set_color(color),
@@ -43,46 +70,7 @@ class EnsembleLearningTutorial(Scene):
             tree.add(level)
         
         return tree
-    def construct(self):
-        # Scene 1: Introduction
-        self.scene1_intro()
-        self.clear()
-        
-        # Scene 2: What is Ensemble Learning?
-        self.scene2_what_is_ensemble()
-        self.clear()
-        
-        # Scene 3: Bagging
-        self.scene3a_bagging_concept()
-        self.clear()
-        self.scene3b_bagging_visual()
-        self.clear()
-        
-        # Scene 4: Boosting
-        self.scene4a_boosting_concept()
-        self.clear()
-        self.scene4b_student_analogy()
-        self.clear()
-        self.scene4c_boosting_math()
-        self.clear()
-        self.scene4d_boosting_visual()
-        self.clear()
-        
-        # Scene 5: Stacking
-        self.scene5a_stacking_concept()
-        self.clear()
-        self.scene5b_sports_analogy()
-        self.clear()
-        self.scene5c_stacking_visual()
-        self.clear()
-        
-        # Scene 6: Comparison
-        self.scene6_comparison()
-        self.clear()
-        
-        # Scene 7: Outro
-        self.scene7_outro()
-    
+
     def scene1_intro(self):
         # Title and hook
         title = Text("Ensemble Learning", font_size=60, color=BLUE)
@@ -570,7 +558,7 @@ class EnsembleLearningTutorial(Scene):
         axes.scale(0.8).to_edge(LEFT, buff=1)
         
         # Create scatter plot
-        dots = VGroup(*[Dot(axes.c2p(xi, yi), color=BLUE, radius=0.05) for xi, yi in zip(x, y)])
+        dots = Scatter(np.column_stack([x, y]), axes, colors=BLUE, radius=0.05)
         
         # Initial prediction (mean)
         mean_y = np.mean(y)
@@ -589,15 +577,13 @@ class EnsembleLearningTutorial(Scene):
         )
         
         # Show residuals
-        residuals = VGroup()
-        for xi, yi in zip(x, y):
-            line = Line(
-                axes.c2p(xi, mean_y, 0),
-                axes.c2p(xi, yi, 0),
-                color=YELLOW,
-                stroke_width=2
-            )
-            residuals.add(line)
+        residuals = segments(
+            axes,
+            np.column_stack([x, np.full_like(x, mean_y)]),
+            np.column_stack([x, y]),
+            color=YELLOW,
+            stroke_width=2
+        )
         
         self.play(
             Create(residuals),
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Text, VGroup,
+    FadeIn, FadeOut,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, YELLOW
+)
+from data_table import Table
 
 class EntropyInfoGainGiniGym(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, MathTex, Text, VGroup,
+    FadeIn, FadeOut, GrowArrow,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, ORANGE, PURPLE, WHITE, YELLOW
+)
 
 class EntropyInfoGainGiniTreeScript(Scene):
     def construct(self):
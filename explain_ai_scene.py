@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, Arrow, Circle, Rectangle, RoundedRectangle, Text, Triangle, VGroup,
+    FadeIn, FadeOut, GrowArrow, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE_E, GREEN_E, GREY, ORANGE, WHITE, YELLOW
+)
 
 class ExplainAIScene(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, Arrow, Rectangle, Text, VGroup,
+    FadeIn, FadeOut, GrowArrow, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE, BLUE_E, GREEN_E, GREY, ORANGE, RED, WHITE, YELLOW
+)
 
 class ExplainMachineLearningScene(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Dot, Rectangle, Square, Text, VGroup,
+    FadeIn, FadeOut, GrowArrow, Write,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE_E, GREEN_E, GREY, ORANGE, PURPLE, YELLOW
+)
 
 class ExplainTypesOfMLScene(Scene):
     def construct(self):
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Line, Rectangle, RoundedRectangle, SurroundingRectangle, Text,
+    Triangle, VGroup,
+    Create, FadeIn, FadeOut, GrowArrow, GrowFromCenter, ReplacementTransform, Transform,
+    Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UL, UP,
+    BLACK, BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
 
 class ForLoopTutorial(Scene):
     def construct(self):
@@ -436,17 +444,3 @@ print(next(iterator))  # 3
         self.play(Write(final))
         self.wait(2)
         self.clear()
-
-# Simple teacher class using basic shapes
-class Teacher(VGroup):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Head
-        head = Circle(radius=0.5, color=BLUE, fill_opacity=0.5)
-        # Body
-        body = Rectangle(height=1, width=0.8, color=BLUE, fill_opacity=0.5).next_to(head, DOWN, buff=0)
-        # Pointer (hand)
-        pointer = Line(ORIGIN, RIGHT*1.5, color=RED, stroke_width=8, tip_length=0.2).add_tip()
-        pointer.next_to(body, RIGHT, buff=0.1)
-        
-        self.add(head, body, pointer)
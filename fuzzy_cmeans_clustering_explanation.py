@@ -1,5 +1,24 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Circle, Dot, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut, Transform,
+    interpolate_color,
+    DOWN, LEFT, ORIGIN, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
+from clustering import fuzzy_cmeans
+from data_table import Table
+from scatter import Scatter
+from tutorial_animations import StaggeredRecolor
+
+def membership_colors(memberships, palette):
+    """Blend the cluster colours of each point by its membership degrees."""
+    return [
+        interpolate_color(interpolate_color(palette[0], palette[1], u[1] / max(u[0] + u[1], 1e-9)), palette[2], u[2])
+        for u in memberships
+    ]
+
 
 class FuzzyCMeansClusteringExplanation(Scene):
     def construct(self):
@@ -67,18 +86,32 @@ class FuzzyCMeansClusteringExplanation(Scene):
         ])
         axes2 = Axes(x_range=[0, 10], y_range=[0, 8], x_length=6, y_length=4, axis_config={"font_size": 20})
         axes2.next_to(sec4, DOWN, buff=0.6)
-        dots2 = VGroup(*[Dot(axes2.c2p(x, y), color=WHITE, radius=0.09) for x, y in pts])
+        dots2 = Scatter(pts, axes2, colors=WHITE, radius=0.09)
         self.play(Create(axes2), FadeIn(dots2))
-        # Simulate soft memberships (for visualization)
-        memberships = np.clip(np.random.dirichlet([2,2,2], len(pts)), 0.05, 0.95)
-        centroids = np.array([[2,2],[5,6],[8,3]])
-        for i, dot in enumerate(dots2):
-            color = interpolate_color(YELLOW, BLUE, memberships[i,1])
-            color = interpolate_color(color, GREEN, memberships[i,2])
-            self.play(dot.animate.set_color(color), run_time=0.03)
-        centroid_dots = VGroup(*[Dot(axes2.c2p(*c), color=col, radius=0.15) for c, col in zip(centroids, [YELLOW, BLUE, GREEN])])
-        self.play(FadeIn(centroid_dots))
+        # Run the solver and replay its membership matrices iteration by iteration
+        result = fuzzy_cmeans(pts, 3, m=2.0, seed=0)
+        palette = [YELLOW, BLUE, GREEN]
+        # Match the colours to the clusters that were generated around (2,2), (5,6), (8,3)
+        order = np.argsort(result.centroids[:, 0])
+
+        def centroid_group(cs):
+            return VGroup(*[Dot(axes2.c2p(*cs[k]), color=col, radius=0.15) for k, col in zip(order, palette)])
+
+        first = result.trace[0]
+        self.play(StaggeredRecolor(dots2, membership_colors(first.memberships[:, order], palette), per_element_delay=0.03))
+        centroid_dots = centroid_group(first.centroids)
+        iteration = Text("Iteration 1", font_size=22).next_to(axes2, DOWN, buff=0.2)
+        self.play(FadeIn(centroid_dots), FadeIn(iteration))
+        for i, step in enumerate(result.trace[1:], start=2):
+            self.play(
+                dots2.animate(run_time=0.4).set_colors(membership_colors(step.memberships[:, order], palette)),
+                Transform(centroid_dots, centroid_group(step.centroids), run_time=0.4),
+                Transform(iteration, Text(f"Iteration {i}", font_size=22).move_to(iteration), run_time=0.4),
+            )
+        done = Text(f"Converged after {result.n_iter} iterations", font_size=22, color=GREEN).move_to(iteration)
+        self.play(Transform(iteration, done))
         self.wait(1.5)
+        self.play(FadeOut(iteration))
         self.play(FadeOut(axes2), FadeOut(dots2), FadeOut(centroid_dots), FadeOut(sec4))
 
         # 5. Comparison Table
@@ -104,11 +137,17 @@ class FuzzyCMeansClusteringExplanation(Scene):
         axes3 = Axes(x_range=[20, 80], y_range=[100, 300], x_length=6, y_length=4, axis_config={"font_size": 20})
         axes3.next_to(sec6, DOWN, buff=0.6)
         np.random.seed(1)
-        age = np.concatenate([np.random.normal(25, 4, 12), np.random.normal(50, 6, 12), np.random.normal(70, 5, 12)])
-        chol = np.concatenate([np.random.normal(160, 12, 12), np.random.normal(220, 18, 12), np.random.normal(270, 10, 12)])
-        memberships2 = np.clip(np.random.dirichlet([3,2,1], len(age)), 0.05, 0.95)
-        colors3 = [interpolate_color(GREEN, YELLOW, memberships2[i,1]) for i in range(len(age))]
-        dots3 = VGroup(*[Dot(axes3.c2p(a, c), color=col, radius=0.1) for a, c, col in zip(age, chol, colors3)])
+        n = 1000
+        age = np.concatenate([np.random.normal(25, 4, n), np.random.normal(50, 6, n), np.random.normal(70, 5, n)])
+        chol = np.concatenate([np.random.normal(160, 12, n), np.random.normal(220, 18, n), np.random.normal(270, 10, n)])
+        patients = np.column_stack([np.clip(age, 20, 80), np.clip(chol, 100, 300)])
+        # Standardise so age and cholesterol weigh equally in the distances
+        scaled = (patients - patients.mean(axis=0)) / patients.std(axis=0)
+        risk = fuzzy_cmeans(scaled, 3, m=2.0, seed=1)
+        # Low, medium and high risk ordered by age
+        order = np.argsort(risk.centroids[:, 0])
+        colors3 = membership_colors(risk.memberships[:, order], [GREEN, YELLOW, RED])
+        dots3 = Scatter(patients, axes3, colors=colors3, radius=0.03)
         self.play(Create(axes3), FadeIn(dots3))
         self.wait(2)
         self.play(FadeOut(axes3), FadeOut(dots3), FadeOut(sec6))
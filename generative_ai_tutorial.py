@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Dot, Line, Rectangle, Square, Text, VGroup,
+    Create, DrawBorderThenFill, FadeIn, LaggedStart, Write,
+    BOLD, DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, BLUE_C, GRAY, GREEN, RED, WHITE, YELLOW
+)
 
 class GenerativeAITutorial(Scene):
     def construct(self):
@@ -0,0 +1,147 @@
+"""Process-wide and on-disk cache for Text and MarkupText glyphs.
+
+Building a ``Text`` runs Pango, parses the SVG it writes and closes every
+glyph outline in Python; that dominates construction time in the text-heavy
+tutorials. The ``Text`` and ``MarkupText`` classes here are drop-in
+subclasses: the first time a string is built with a given font, size and
+style the finished mobject is kept as a template (in memory, and pickled to
+``.glyph_cache/``), and every later call returns a copy of it.
+
+For plain ``Text`` the colour, fill opacity and stroke width are not part of
+the key; they are re-applied to the copy, so ``Text("Yes", color=GREEN)``
+and ``Text("Yes", color=RED)`` share one template. ``t2c``/``t2g``/
+``gradient`` and ``MarkupText`` colour per character, so there the colour
+is part of the key. Calls with extra Mobject keyword arguments bypass the
+cache. ``data_table.Table`` uses the same cache for whole tables.
+
+Usage (after the ``from manim import ...`` list):
+    from glyph_cache import Text, MarkupText
+"""
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+import manim
+import numpy as np
+from manim import VMobject, config
+from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
+
+from render_cache import manim_version
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = REPO_DIR / ".glyph_cache"
+STYLE_ARGS = ("color", "fill_opacity", "stroke_width")
+
+_templates = {}
+stats = {"hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0}
+cache_dir = Path(os.environ.get("GLYPH_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        return _freeze(value.tolist())
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if callable(value):
+        # Functions and classes by name; their repr holds a memory address
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    return str(value)
+
+
+class _GlyphCacheMeta(ConvertToOpenGL):
+    def __call__(cls, *args, **kwargs):
+        bound = cls._signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        if params.pop("kwargs") or not cls._cacheable(params):
+            stats["bypassed"] += 1
+            return super().__call__(*args, **kwargs)
+        recolor = cls._recolorable(params)
+        geometry = {k: v for k, v in params.items() if not (recolor and k in STYLE_ARGS)}
+        key = hashlib.sha256(repr((
+            cls.__name__, manim_version(), config.renderer, _freeze(geometry),
+        )).encode()).hexdigest()
+
+        template = _templates.get(key)
+        if template is not None:
+            stats["hits"] += 1
+        else:
+            template = _load(key)
+            if template is not None:
+                stats["disk_hits"] += 1
+            else:
+                stats["misses"] += 1
+                mob = super().__call__(*args, **kwargs)
+                template = mob.copy()
+                _store(key, template)
+                _templates[key] = template
+                return mob
+            _templates[key] = template
+        mob = template.copy()
+        if recolor:
+            color = params["color"]
+            mob.set_color(color if color else VMobject().color)
+            mob.set_fill(opacity=params["fill_opacity"])
+            mob.set_stroke(width=params["stroke_width"])
+        return mob
+
+
+def _init_signature(init):
+    """Signature of ``init`` without ``self``, used to normalise the call arguments."""
+    sig = inspect.signature(init)
+    return sig.replace(parameters=list(sig.parameters.values())[1:])
+
+
+def _path(key):
+    return cache_dir / key[:2] / f"{key}.pkl"
+
+
+def _load(key):
+    try:
+        with open(_path(key), "rb") as fh:
+            return pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _store(key, template):
+    path = _path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            pickle.dump(template, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        tmp.unlink(missing_ok=True)
+
+
+def clear(memory=True, disk=False):
+    """Drop the in-process templates and, with ``disk=True``, the files too."""
+    if memory:
+        _templates.clear()
+    if disk:
+        for path in cache_dir.glob("*/*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+class Text(manim.Text, metaclass=_GlyphCacheMeta):
+    _signature = _init_signature(manim.Text.__init__)
+    _cacheable = staticmethod(lambda params: True)
+
+    @staticmethod
+    def _recolorable(params):
+        return not (params["t2c"] or params["t2g"] or params["gradient"])
+
+
+class MarkupText(manim.MarkupText, metaclass=_GlyphCacheMeta):
+    _signature = _init_signature(manim.MarkupText.__init__)
+    _cacheable = staticmethod(lambda params: True)
+
+    @staticmethod
+    def _recolorable(params):
+        return False
@@ -1,6 +1,28 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Circle, Dot, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut, Transform,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, GREY, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
-from scipy.stats import norm
+from clustering import gaussian_mixture, mixture_densities, replay_indices
+from coordinates import coords_to_points
+from data_table import Table
+from scatter import Scatter
+
+def covariance_ellipse(axes, mean, cov, color, n_std=2):
+    """Ellipse covering ``n_std`` standard deviations of a 2D Gaussian, in scene coordinates."""
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    # Map both principal semi-axes through the axes, so unequal x and y units
+    # stretch the ellipse the same way they stretch the data
+    semi_axes = n_std * np.sqrt(eigvals) * eigvecs
+    center = coords_to_points(axes, mean)
+    ends = coords_to_points(axes, np.asarray(mean) + semi_axes.T)
+    matrix = np.eye(3)
+    matrix[:, :2] = (ends - center).T
+    return Circle(radius=1, color=color).apply_matrix(matrix).shift(center)
+
 
 class GMMCentralTendencyExplanation(Scene):
     def construct(self):
@@ -59,17 +81,19 @@ class GMMCentralTendencyExplanation(Scene):
         axes = Axes(x_range=[-4, 10], y_range=[0, 0.5], x_length=7, y_length=2.5, axis_config={"font_size": 20})
         axes.next_to(gmm1d_title, DOWN, buff=0.6)
         x = np.linspace(-4, 10, 400)
-        # Three Gaussians
-        mus = [0, 3, 6]
-        sigmas = [1, 0.8, 1.2]
-        pis = [0.3, 0.4, 0.3]
+        # Sample from three Gaussians and let EM recover them
+        np.random.seed(3)
+        samples = np.concatenate([np.random.normal(0, 1, 300), np.random.normal(3, 0.8, 400), np.random.normal(6, 1.2, 300)])
+        fit1d = gaussian_mixture(samples, 3, init=[[-1], [3], [7]])
+        order = np.argsort(fit1d.means[:, 0])
+        mus = fit1d.means[order, 0]
+        component_y = mixture_densities(x, fit1d.means, fit1d.covariances, fit1d.weights)[:, order]
         gauss_curves = []
-        for i, (mu, sigma, pi) in enumerate(zip(mus, sigmas, pis)):
-            y = pi * norm.pdf(x, mu, sigma)
-            curve = axes.plot_line_graph(x, y, add_vertex_dots=False, line_color=[YELLOW, BLUE, GREEN][i], stroke_width=4)
+        for i in range(3):
+            curve = axes.plot_line_graph(x, component_y[:, i], add_vertex_dots=False, line_color=[YELLOW, BLUE, GREEN][i], stroke_width=4)
             gauss_curves.append(curve)
         # Mixture
-        y_mix = sum(pi * norm.pdf(x, mu, sigma) for pi, mu, sigma in zip(pis, mus, sigmas))
+        y_mix = component_y.sum(axis=1)
         mix_curve = axes.plot_line_graph(x, y_mix, add_vertex_dots=False, line_color=RED, stroke_width=5)
         # Show all
         self.play(Create(axes))
@@ -92,18 +116,30 @@ class GMMCentralTendencyExplanation(Scene):
             np.random.multivariate_normal([5, 5], [[0.9, -0.4],[-0.4, 0.7]], 60),
             np.random.multivariate_normal([3, 6], [[0.6, 0.1],[0.1, 0.6]], 40)
         ])
-        colors = [YELLOW]*60 + [BLUE]*60 + [GREEN]*40
-        dots = VGroup(*[Dot(axes2.c2p(x, y), color=col, radius=0.08) for (x, y), col in zip(points, colors)])
+        dots = Scatter(points, axes2, colors=WHITE, radius=0.08)
         self.play(Create(axes2), FadeIn(dots))
-        # Draw ellipses for GMM components
-        ellipse1 = Ellipse(width=2.2, height=1.3, color=YELLOW).move_to(axes2.c2p(1, 2))
-        ellipse2 = Ellipse(width=2.6, height=1.6, color=BLUE).move_to(axes2.c2p(5, 5)).rotate(-0.4)
-        ellipse3 = Ellipse(width=1.6, height=1.1, color=GREEN).move_to(axes2.c2p(3, 6)).rotate(0.2)
-        ellipses = [ellipse1, ellipse2, ellipse3]
-        for ell in ellipses:
-            self.play(Create(ell), run_time=0.5)
+        # Fit with EM from three rough starting means; animate the early iterations
+        # and then ever sparser ones, up to the converged fit
+        fit2d = gaussian_mixture(points, 3, init=[[0, 0], [6, 3], [2, 7]])
+        palette = [YELLOW, BLUE, GREEN]
+
+        def component_ellipses(step):
+            return VGroup(*[covariance_ellipse(axes2, m, c, col) for m, c, col in zip(step.means, step.covariances, palette)])
+
+        ellipses = component_ellipses(fit2d.trace[0])
+        iteration = Text("EM iteration 1", font_size=22).next_to(axes2, RIGHT, buff=0.3)
+        self.play(*[Create(ell) for ell in ellipses], FadeIn(iteration), run_time=0.8)
+        for i in replay_indices(len(fit2d.trace))[1:]:
+            self.play(
+                Transform(ellipses, component_ellipses(fit2d.trace[i])),
+                Transform(iteration, Text(f"EM iteration {i + 1}", font_size=22).move_to(iteration)),
+                run_time=0.4,
+            )
+        # Colour each point by its most likely component
+        self.play(dots.animate.set_colors([palette[k] for k in fit2d.responsibilities.argmax(axis=1)]), run_time=0.8)
         self.wait(2)
-        self.play(FadeOut(gmm2d_title), FadeOut(axes2), FadeOut(dots), *[FadeOut(ell) for ell in ellipses])
+        self.play(FadeOut(iteration))
+        self.play(FadeOut(gmm2d_title), FadeOut(axes2), FadeOut(dots), FadeOut(ellipses))
 
         # Central Tendency
         ct_title = Text("Central Tendency in GMM", font_size=32, color=ORANGE).next_to(title, DOWN, buff=0.5)
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Text, VGroup,
+    FadeIn, FadeOut,
+    DOWN, ORIGIN,
+    GREEN
+)
 
 class GradientDescentDerivation(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Axes, Dot, Text,
+    always_redraw, Create, FadeIn, FadeOut, MoveAlongPath, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
 import numpy as np
 
 class GradientDescentLogisticRegressionScene(Scene):
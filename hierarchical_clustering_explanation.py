@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Dot, Line, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GREEN, GREY, ORANGE, PURPLE, WHITE, YELLOW
+)
 import numpy as np
 
 class HierarchicalClusteringExplanation(Scene):
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Arrow, Circle, Dot, Line, Mobject, Polygon, Rectangle,
+    RoundedRectangle, Text, VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, GREEN_E, MAROON_E, PURPLE_E, TEAL_E, WHITE,
+    YELLOW, YELLOW_E
+)
 
 class IoTTutorial(Scene):
     def construct(self):
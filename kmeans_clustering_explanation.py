@@ -1,5 +1,14 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Dot, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut, Transform,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
+from clustering import kmeans
+from scatter import Scatter
+from tutorial_animations import StaggeredRecolor
 
 class KMeansClusteringExplanation(Scene):
     def construct(self):
@@ -28,7 +37,7 @@ class KMeansClusteringExplanation(Scene):
         ])
         axes = Axes(x_range=[0, 10], y_range=[0, 8], x_length=6, y_length=4, axis_config={"font_size": 20})
         axes.next_to(sec2, DOWN, buff=0.6)
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=WHITE, radius=0.09) for x, y in points])
+        dots = Scatter(points, axes, colors=WHITE, radius=0.09)
         self.play(Create(axes), FadeIn(dots))
         self.wait(0.8)
         # Step 1: Choose K
@@ -49,26 +58,41 @@ class KMeansClusteringExplanation(Scene):
         # Step 3: Assign points to nearest centroid
         step3 = Text("Step 3: Assign points to nearest centroid", font_size=26, color=YELLOW).next_to(axes, UP, buff=0.2)
         self.play(FadeIn(step3))
-        # Assign colors
-        assignments = np.argmin([np.linalg.norm(points - c, axis=1) for c in centroids], axis=0)
+        # Assign colors (run the real algorithm from the chosen centroids and replay its trace)
+        result = kmeans(points, 3, init=points[init_idx])
         cluster_colors = [YELLOW, BLUE, GREEN]
-        for i, dot in enumerate(dots):
-            self.play(dot.animate.set_color(cluster_colors[assignments[i]]), run_time=0.03)
+        self.play(StaggeredRecolor(dots, [cluster_colors[a] for a in result.trace[0].labels], per_element_delay=0.03))
         self.wait(1)
         self.play(FadeOut(step3))
+
+        def centroid_group(cs):
+            return VGroup(*[Dot(axes.c2p(*c), color=col, radius=0.18, fill_opacity=0.7) for c, col in zip(cs, cluster_colors)])
+
+        # Centroids after each update: trace[i].centroids were used for assignment i
+        centroid_history = [step.centroids for step in result.trace[1:]] + [result.centroids]
         # Step 4: Recalculate centroids
         step4 = Text("Step 4: Recalculate centroids (mean of cluster)", font_size=26, color=YELLOW).next_to(axes, UP, buff=0.2)
         self.play(FadeIn(step4))
-        new_centroids = [points[assignments == k].mean(axis=0) for k in range(3)]
-        new_centroid_dots = VGroup(*[Dot(axes.c2p(*c), color=col, radius=0.18, fill_opacity=0.7) for c, col in zip(new_centroids, cluster_colors)])
-        self.play(Transform(centroid_dots, new_centroid_dots))
+        self.play(Transform(centroid_dots, centroid_group(centroid_history[0])))
         self.wait(1)
         self.play(FadeOut(step4))
         # Step 5: Repeat
         step5 = Text("Step 5: Repeat until convergence!", font_size=26, color=YELLOW).next_to(axes, UP, buff=0.2)
-        self.play(FadeIn(step5))
+        iteration = Text("Iteration 1", font_size=22).next_to(axes, DOWN, buff=0.2)
+        self.play(FadeIn(step5), FadeIn(iteration))
+        # trace[i] is the assignment of iteration i + 1; one more entry, if
+        # present, is the final assignment to the converged centroids
+        for i in range(1, result.n_iter):
+            self.play(Transform(iteration, Text(f"Iteration {i + 1}", font_size=22).move_to(iteration)), run_time=0.3)
+            self.play(StaggeredRecolor(dots, [cluster_colors[a] for a in result.trace[i].labels], run_time=0.6))
+            self.play(Transform(centroid_dots, centroid_group(centroid_history[i])), run_time=0.6)
+        done = Text(f"Converged after {result.n_iter} iterations", font_size=22, color=GREEN).move_to(iteration)
+        if len(result.trace) > result.n_iter:
+            self.play(Transform(iteration, done), StaggeredRecolor(dots, [cluster_colors[a] for a in result.labels], run_time=0.6))
+        else:
+            self.play(Transform(iteration, done))
         self.wait(1.2)
-        self.play(FadeOut(step5))
+        self.play(FadeOut(step5), FadeOut(iteration))
         self.play(FadeOut(axes), FadeOut(dots), FadeOut(centroid_dots))
         self.play(FadeOut(sec2))
 
@@ -77,12 +101,18 @@ class KMeansClusteringExplanation(Scene):
         self.play(FadeIn(sec3))
         axes2 = Axes(x_range=[15, 70], y_range=[0, 110], x_length=6, y_length=4, axis_config={"font_size": 20}, x_axis_config={"numbers_to_include":[20,30,40,50,60]}, y_axis_config={"numbers_to_include":[20,40,60,80,100]})
         axes2.next_to(sec3, DOWN, buff=0.6)
-        # Simulate example data
+        # Simulate example data: a realistic-sized customer base, segmented by K-means
         np.random.seed(1)
-        age = np.concatenate([np.random.normal(22, 3, 15), np.random.normal(40, 5, 15), np.random.normal(58, 4, 15)])
-        score = np.concatenate([np.random.normal(30, 6, 15), np.random.normal(60, 8, 15), np.random.normal(90, 5, 15)])
-        colors2 = [YELLOW]*15 + [BLUE]*15 + [GREEN]*15
-        dots2 = VGroup(*[Dot(axes2.c2p(a, s), color=col, radius=0.1) for a, s, col in zip(age, score, colors2)])
+        n = 500
+        age = np.concatenate([np.random.normal(22, 3, n), np.random.normal(40, 5, n), np.random.normal(58, 4, n)])
+        score = np.concatenate([np.random.normal(30, 6, n), np.random.normal(60, 8, n), np.random.normal(90, 5, n)])
+        customers = np.column_stack([np.clip(age, 15, 70), np.clip(score, 0, 110)])
+        segments = kmeans(customers, 3, seed=1)
+        # Order the segments by age so the colours match the story (young, middle-aged, older)
+        rank = np.argsort(np.argsort(segments.centroids[:, 0]))
+        segment_colors = [YELLOW, BLUE, GREEN]
+        colors2 = [segment_colors[rank[label]] for label in segments.labels]
+        dots2 = Scatter(customers, axes2, colors=colors2, radius=0.03)
         self.play(Create(axes2), FadeIn(dots2))
         self.wait(2)
         self.play(FadeOut(axes2), FadeOut(dots2), FadeOut(sec3))
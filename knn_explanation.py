@@ -1,5 +1,14 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, BulletedList, Dot, Line, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
+from coordinates import coords_to_points, segments
+from data_table import Table
+from scatter import Scatter
 
 class KNNExplanation(Scene):
     def construct(self):
@@ -31,8 +40,8 @@ class KNNExplanation(Scene):
         apples = np.random.normal([3, 7], 0.7, (8, 2))
         pears = np.random.normal([7, 3], 0.7, (8, 2))
         test_pt = np.array([5.2, 5.2])
-        apple_dots = VGroup(*[Dot(axes.c2p(x, y), color=RED, radius=0.16) for x, y in apples])
-        pear_dots = VGroup(*[Dot(axes.c2p(x, y), color=GREEN, radius=0.16) for x, y in pears])
+        apple_dots = Scatter(apples, axes, colors=RED, radius=0.16)
+        pear_dots = Scatter(pears, axes, colors=GREEN, radius=0.16)
         test_dot = Dot(axes.c2p(*test_pt), color=YELLOW, radius=0.20)
         self.play(Create(axes), FadeIn(apple_dots), FadeIn(pear_dots), FadeIn(test_dot))
         # Draw lines to K=3 nearest
@@ -40,10 +49,11 @@ class KNNExplanation(Scene):
         all_labels = ["Apple"]*8 + ["Pear"]*8
         dists = np.linalg.norm(all_pts - test_pt, axis=1)
         idx = np.argsort(dists)[:3]
-        neighbor_lines = VGroup(*[Line(test_dot.get_center(), axes.c2p(*all_pts[i]), color=WHITE, stroke_width=3) for i in idx])
+        neighbor_lines = segments(axes, np.repeat([test_pt], len(idx), axis=0), all_pts[idx], color=WHITE, stroke_width=3)
         self.play(*[Create(line) for line in neighbor_lines])
         # Show neighbor labels
-        neighbor_labels = VGroup(*[Text(all_labels[i], font_size=28, color=RED if all_labels[i]=="Apple" else GREEN).next_to(axes.c2p(*all_pts[i]), DOWN) for i in idx])
+        neighbor_points = coords_to_points(axes, all_pts[idx])
+        neighbor_labels = VGroup(*[Text(all_labels[i], font_size=28, color=RED if all_labels[i]=="Apple" else GREEN).next_to(point, DOWN) for i, point in zip(idx, neighbor_points)])
         self.play(*[FadeIn(lbl) for lbl in neighbor_labels])
         maj_vote = Text("Majority vote: Apple!", font_size=32, color=RED).next_to(test_dot, RIGHT, buff=0.7)
         self.play(FadeIn(maj_vote))
@@ -0,0 +1,168 @@
+"""Import Manim's modules on first use instead of all at once.
+
+``import manim`` runs ``manim/__init__.py``, which star-imports more than
+eighty submodules: 3D and OpenGL mobjects, Typst and code blocks, vector
+fields, every camera and scene type, plugins and IPython hooks, whether the
+scene needs them or not. Importing any submodule runs it too.
+
+``install()`` registers ``manim`` as a package whose ``__init__`` has not
+run. Its attributes resolve through a symbol table (which submodule each
+public name comes from, read from Manim's sources with ``ast`` and kept in
+``.manim_symbols.json``), so ``from manim import Scene, Text, FadeIn``
+imports just the submodules behind those three names. ``from manim import *``
+still works and still imports everything, which is why the tutorials list
+their Manim imports explicitly. If a lazily imported submodule fails, the
+real ``__init__`` runs and the name is looked up again.
+
+Call ``install()`` before anything imports Manim; the render workers
+(``static_frames.py``, ``render_profile.py``) and ``preview_server.py`` do.
+"""
+import ast
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+SYMBOLS_PATH = REPO_DIR / ".manim_symbols.json"
+SYMBOLS_VERSION = 1
+
+
+def _source(root, module):
+    """Path of ``manim.<module>`` below the package directory ``root``."""
+    path = root.joinpath(*module.split("."))
+    return path / "__init__.py" if path.is_dir() else path.with_suffix(".py")
+
+
+def _literal_names(node):
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return None
+    return list(value) if isinstance(value, (list, tuple)) else None
+
+
+def _star_exports(root, module):
+    """Names that ``from manim.<module> import *`` binds."""
+    tree = ast.parse(_source(root, module).read_text(encoding="utf-8"))
+    exported, public = None, set()
+    package = module if _source(root, module).name == "__init__.py" else module.rpartition(".")[0]
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "__all__" for t in node.targets):
+            exported = _literal_names(node.value)
+        elif isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "__all__":
+            exported = _literal_names(node.value)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            public.add(node.name)
+        elif isinstance(node, ast.Assign):
+            public.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            public.add(node.target.id)
+        elif isinstance(node, ast.Import):
+            public.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module != "__future__":
+            if node.names[0].name == "*":
+                if node.level:
+                    parts = package.split(".") if package else []
+                    base = parts[: len(parts) - node.level + 1]
+                    public.update(_star_exports(root, ".".join(base + [node.module])))
+                elif node.module.startswith("manim."):
+                    public.update(_star_exports(root, node.module.removeprefix("manim.")))
+            else:
+                public.update(alias.asname or alias.name for alias in node.names if alias.name != "*")
+    if exported is not None:
+        return exported
+    return sorted(name for name in public if not name.startswith("_"))
+
+
+def build_symbols(root):
+    """Map every name ``manim/__init__.py`` binds to ``[module, attribute]``.
+
+    ``attribute`` is None when the name is a module itself (``np``,
+    ``rate_functions``, the ``animation`` subpackage).
+    """
+    tree = ast.parse((root / "__init__.py").read_text(encoding="utf-8"))
+    symbols = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1:
+            symbols.setdefault(node.module.split(".")[0], [f"manim.{node.module.split('.')[0]}", None])
+            owner = f"manim.{node.module}"
+            if node.names[0].name == "*":
+                for name in _star_exports(root, node.module):
+                    symbols[name] = [owner, name]
+            else:
+                for alias in node.names:
+                    symbols[alias.asname or alias.name] = [owner, alias.name]
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                symbols[alias.asname or alias.name] = [alias.name, None]
+    return symbols
+
+
+def load_symbols(root):
+    """Symbol table for the Manim sources in ``root``, cached per file modification time."""
+    stamp = (root / "__init__.py").stat().st_mtime_ns
+    try:
+        data = json.loads(SYMBOLS_PATH.read_text(encoding="utf-8"))
+        if data["version"] == SYMBOLS_VERSION and data["root"] == str(root) and data["mtime_ns"] == stamp:
+            return data["symbols"]
+    except (OSError, ValueError, KeyError):
+        pass
+    symbols = build_symbols(root)
+    tmp = SYMBOLS_PATH.with_name(f"{SYMBOLS_PATH.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": SYMBOLS_VERSION, "root": str(root), "mtime_ns": stamp, "symbols": symbols}), encoding="utf-8")
+    os.replace(tmp, SYMBOLS_PATH)
+    return symbols
+
+
+def install():
+    """Make ``manim`` a lazily populated package; a no-op once Manim is imported."""
+    if "manim" in sys.modules:
+        return sys.modules["manim"]
+    spec = importlib.util.find_spec("manim")
+    root = Path(spec.submodule_search_locations[0])
+    symbols = load_symbols(root)
+    package = importlib.util.module_from_spec(spec)
+
+    def resolve(name):
+        if name not in symbols:
+            raise AttributeError(f"module 'manim' has no attribute {name!r}")
+        module, attribute = symbols[name]
+        try:
+            value = importlib.import_module(module)
+            if attribute is not None:
+                try:
+                    value = getattr(value, attribute)
+                except AttributeError:
+                    value = importlib.import_module(f"{module}.{attribute}")
+        except ImportError:
+            # Fall back to Manim's own import order
+            symbols.clear()
+            spec.loader.exec_module(package)
+            if name not in package.__dict__:
+                raise
+            return package.__dict__[name]
+        setattr(package, name, value)
+        return value
+
+    try:
+        from importlib.metadata import version
+        package.__version__ = version("manim")
+    except Exception:
+        package.__version__ = "0.0.0+unknown"
+    package.__getattr__ = resolve
+    package.__dir__ = lambda: sorted(set(package.__dict__) | set(symbols))
+    package.__all__ = [name for name in symbols if not name.startswith("_")]
+    sys.modules["manim"] = package
+    # Manim imports its config before anything else
+    importlib.import_module("manim._config")
+    return package
+
+
+if __name__ == "__main__":
+    spec = importlib.util.find_spec("manim")
+    if spec is None:
+        sys.exit("Manim is not installed")
+    print(f"{len(load_symbols(Path(spec.submodule_search_locations[0])))} names in {SYMBOLS_PATH.name}")
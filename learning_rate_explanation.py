@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Dot, Text,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, ORIGIN, UP,
+    BLUE, GREEN, GREY, ORANGE, RED, YELLOW
+)
 import numpy as np
 
 class LearningRateExplanation(Scene):
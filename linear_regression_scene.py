@@ -1,4 +1,9 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Dot, Line, Text, VGroup,
+    Create, FadeIn, Write,
+    DEGREES, DOWN, LEFT, UP
+)
 import numpy as np
 
 # Simple color palette
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, MathTex, Text,
+    Create, Write,
+    DOWN, UP, UR,
+    BLUE, YELLOW
+)
+import numpy as np
 
 class LogisticFunctionExplanation(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, MathTex, Text,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
 import numpy as np
 
 class LogisticFunctionScene(Scene):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Text,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, RIGHT, UP,
+    BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
+from data_table import Table
 
 class LogisticRegressionHIVWorkflow(Scene):
     def construct(self):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, MathTex, Text, VGroup,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, WHITE, YELLOW
+)
+import numpy as np
 
 class LogisticRegressionExplanation(Scene):
     def construct(self):
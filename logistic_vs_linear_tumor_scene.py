@@ -1,5 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Dot, Text,
+    Create, FadeIn, FadeOut, Transform, Write,
+    DOWN, LEFT, PI, RIGHT, UP,
+    BLUE, GREEN, PURPLE, RED, WHITE, YELLOW
+)
 import numpy as np
+from scatter import Scatter
 
 class LogisticVsLinearTumor(Scene):
     def construct(self):
@@ -33,9 +40,7 @@ class LogisticVsLinearTumor(Scene):
         # Example data (tumor size vs malignant)
         x_data = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9])
         y_data = np.array([0, 0, 0, 0, 1, 1, 1, 1, 1])
-        dots = VGroup(*[
-            Dot(axes.c2p(x, y), color=YELLOW, radius=0.08) for x, y in zip(x_data, y_data)
-        ])
+        dots = Scatter(np.column_stack([x_data, y_data]), axes, colors=YELLOW, radius=0.08)
         self.play(FadeIn(dots))
         self.wait(1)
 
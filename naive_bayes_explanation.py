@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    BulletedList, MathTex, Text,
+    FadeIn, FadeOut,
+    DOWN, UP,
+    BLUE, GREEN, ORANGE, PURPLE, RED, YELLOW
+)
 
 class NaiveBayesExplanation(Scene):
     def construct(self):
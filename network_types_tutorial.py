@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Arrow, Circle, DashedLine, Dot, Line, Mobject, Polygon,
+    Rectangle, RoundedRectangle, Text, VGroup,
+    Create, FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE, GRAY, GREEN, MAROON_E, TEAL_E, WHITE, YELLOW
+)
 
 class NetworkTypesTutorial(Scene):
     def construct(self):
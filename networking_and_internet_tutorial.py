@@ -1,4 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Arrow, Circle, Dot, Line, Mobject, Rectangle,
+    RoundedRectangle, Text, VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, MAROON_E, ORANGE, PURPLE_E, RED, TEAL_E, WHITE,
+    YELLOW, YELLOW_E
+)
+from components import lock_icon, server_icon
 
 class NetworkingAndInternetTutorial(Scene):
     def construct(self):
@@ -33,7 +42,7 @@ class NetworkingAndInternetTutorial(Scene):
 
         # Visual chips
         client = self._badge("Client", self._icon_device(), BLUE_E)
-        server = self._badge("Server", self._icon_server(), TEAL_E)
+        server = self._badge("Server", server_icon(), TEAL_E)
         dns = self._badge("DNS", self._icon_dns(), YELLOW_E)
         router = self._badge("Router", self._icon_router(), PURPLE_E)
         row = VGroup(client, server, dns, router).arrange(RIGHT, buff=0.8).next_to(bullets, DOWN, buff=0.8)
@@ -50,7 +59,7 @@ class NetworkingAndInternetTutorial(Scene):
         dns = self._node_box("DNS", self._icon_dns())
         r1 = self._node_box("Router", self._icon_router())
         r2 = self._node_box("Router", self._icon_router())
-        server = self._node_box("Server", self._icon_server())
+        server = self._node_box("Server", server_icon())
 
         chain = VGroup(client, dns, r1, r2, server).arrange(RIGHT, buff=1.0).next_to(title, DOWN, buff=1.0)
         self.play(FadeIn(chain, shift=UP))
@@ -101,7 +110,7 @@ class NetworkingAndInternetTutorial(Scene):
         # Small visuals
         slow = self._badge("Slow Route", self._icon_path_variants(), GRAY)
         overload = self._badge("Overload", self._icon_server_hot(), MAROON_E)
-        lock = self._badge("Security", self._icon_lock(), TEAL_E)
+        lock = self._badge("Security", lock_icon(), TEAL_E)
         row = VGroup(slow, overload, lock).arrange(RIGHT, buff=0.8).next_to(bullets, DOWN, buff=0.8)
         self.play(FadeIn(row, shift=UP))
         self.wait(1.5)
@@ -143,16 +152,6 @@ class NetworkingAndInternetTutorial(Scene):
         base = Rectangle(width=0.4, height=0.06, color=WHITE).next_to(screen, DOWN, buff=0.06)
         return VGroup(screen, base)
 
-    def _icon_server(self) -> VGroup:
-        rack = VGroup(
-            RoundedRectangle(width=0.8, height=1.2, corner_radius=0.06, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(UP*0.25),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(DOWN*0.25)
-        )
-        leds = VGroup(*[Dot(radius=0.03, color=GREEN).shift(DOWN*0.4 + RIGHT*(i*0.08 - 0.2)) for i in range(5)])
-        return VGroup(rack, leds)
-
     def _icon_dns(self) -> VGroup:
         globe = Circle(radius=0.35, color=WHITE)
         lat = VGroup(Line(LEFT*0.3, RIGHT*0.3, color=WHITE).shift(UP*0.15), Line(LEFT*0.3, RIGHT*0.3, color=WHITE), Line(LEFT*0.3, RIGHT*0.3, color=WHITE).shift(DOWN*0.15))
@@ -173,17 +172,9 @@ class NetworkingAndInternetTutorial(Scene):
         return VGroup(path1, path2)
 
     def _icon_server_hot(self) -> VGroup:
-        rack = self._icon_server()
+        rack = server_icon()
         heat = VGroup(
             ArcBetweenPoints(ORIGIN, UP*0.4, angle=PI/3, color=RED).shift(RIGHT*0.3),
             ArcBetweenPoints(ORIGIN, UP*0.35, angle=PI/3, color=ORANGE).shift(RIGHT*0.5)
         )
         return VGroup(rack, heat)
-
-    def _icon_lock(self) -> VGroup:
-        lock = VGroup(
-            RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
-            ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
-            Dot(radius=0.05, color=WHITE)
-        )
-        return lock
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Circle, Polygon, Rectangle, Square, SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, GrowFromCenter, LaggedStart, Write,
+    DOWN, LEFT, RIGHT, UL, UP, UR,
+    BLACK, BLUE, BLUE_E, GREEN, RED, WHITE, YELLOW
+)
 
 class OOPTutorial(Scene):
     def construct(self):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Circle, Dot, Ellipse, Line, Mobject, Rectangle,
+    RoundedRectangle, Square, Text, VGroup,
+    FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, GREEN_E, RED, TEAL_E, WHITE, YELLOW, YELLOW_E
+)
 
 class OperatingSystemsTutorial(Scene):
     def construct(self):
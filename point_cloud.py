@@ -0,0 +1,58 @@
+"""Array-backed 3D point clouds.
+
+A ``VGroup`` of ``Dot3D`` spheres is one shaded mesh per point, so a 3D
+scatter plot costs hundreds of faces to sort and shade on every frame of a
+camera move. ``PointCloud3D`` keeps the whole cloud in one ``(N, 3)`` array
+of positions and one ``(N, 4)`` array of RGBA colours, which the Cairo camera
+projects and draws in a single vectorised pass. Colours are fixed per point
+(see ``gradient_rgbas`` for depth shading), and ``add_depth_sorting`` reorders
+both arrays back to front on every frame so near points cover far ones.
+
+Example:
+    cloud = PointCloud3D(xyz, gradient_rgbas(xyz[:, 2], BLUE_E, BLUE_A, -1.5, 1.5))
+    cloud.add_depth_sorting(self.renderer.camera)
+    self.play(Create(cloud))   # reveals the points in order
+"""
+import numpy as np
+from manim import WHITE, PMobject, color_to_rgba, config
+
+
+def gradient_rgbas(values, low_color, high_color, vmin, vmax):
+    """One RGBA row per value, as ``interpolate_color(low, high, (v - vmin) / (vmax - vmin))``."""
+    alphas = (np.asarray(values, dtype=float) - vmin) / (vmax - vmin)
+    low, high = color_to_rgba(low_color), color_to_rgba(high_color)
+    return low + (high - low) * alphas[:, None]
+
+
+class PointCloud3D(PMobject):
+    def __init__(self, points, rgbas=None, color=WHITE, radius=0.04, **kwargs):
+        # The camera draws each point as a square this many pixels wide
+        stroke_width = max(1, round(2 * radius * config.pixel_width / config.frame_width))
+        super().__init__(stroke_width=stroke_width, color=color, **kwargs)
+        self.radius = radius
+        self.add_points(np.asarray(points, dtype=float), rgbas=rgbas, color=color)
+
+    def sort_by_depth(self, camera):
+        """Reorder the points from farthest to nearest as seen by ``camera``."""
+        depth = self.points @ camera.get_rotation_matrix()[2]
+        order = np.argsort(depth, kind="stable")
+        self.points = self.points[order]
+        self.rgbas = self.rgbas[order]
+        return self
+
+    def add_depth_sorting(self, camera):
+        self.sort_by_depth(camera)
+        self.add_updater(lambda cloud: cloud.sort_by_depth(camera))
+        return self
+
+    def projected(self, color=None):
+        """A copy flattened onto the xy-plane, for ``Transform(self, ...)``.
+
+        Depth sorting reorders the points, so build the copy right before the
+        transform for the two orders to match.
+        """
+        flat = self.copy().clear_updaters()
+        flat.points[:, 2] = 0
+        if color is not None:
+            flat.set_color(color)
+        return flat
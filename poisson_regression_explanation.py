@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Text, VGroup,
+    FadeIn, FadeOut, Transform,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, GREY_B, PURPLE, YELLOW
+)
 
 class PoissonRegressionExplanation(Scene):
     def construct(self):
@@ -0,0 +1,297 @@
+"""Live preview of a scene that re-renders as soon as its file is saved.
+
+``manim -pql`` starts a new interpreter, imports Manim, compiles the scene's
+LaTeX, encodes a video and opens a player for every edit. This server pays
+the import once, keeps the LaTeX and glyph caches warm in memory, renders
+without writing any video and streams each frame as a JPEG to a browser tab
+(``http://localhost:8000``) in real time.
+
+The repository is polled through the static scene index (``scene_index.py``).
+When a file is saved, only the scene whose class body changed is rendered
+again; an edit outside any scene class (a helper function or an imported
+helper module) re-renders the scene being previewed. A render in progress is
+abandoned at the next frame, so the first new frame appears as soon as the
+scene reaches its first ``play``.
+
+Usage:
+    python preview_server.py regex_with_manim.py RegexExampleSlide1
+    python preview_server.py python_dictionaries_tutorial.py --port 8001 -q m
+"""
+import argparse
+import importlib.util
+import json
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+import lazy_manim
+from scene_index import REPO_DIR, SceneIndex
+
+QUALITIES = {"l": "low_quality", "m": "medium_quality"}
+POLL_INTERVAL = 0.2
+JPEG_QUALITY = 80
+
+PAGE = b"""<!doctype html>
+<title>Manim preview</title>
+<body style="margin:0;background:#111;color:#ccc;font:14px sans-serif">
+<img src="/stream" style="display:block;width:100vw;max-height:calc(100vh - 2em);object-fit:contain">
+<div id="status" style="padding:.4em"></div>
+<script>
+setInterval(async () => {
+  const s = await (await fetch("/status")).json();
+  document.getElementById("status").textContent =
+    `${s.scene || ""} ${s.state || ""} ${s.first_frame ? "first frame " + s.first_frame + " s" : ""} ${s.error || ""}`;
+}, 500);
+</script>
+"""
+
+
+class Reload(Exception):
+    """Raised inside a render when a watched file changes."""
+
+
+class FrameFeed:
+    """Latest JPEG frame and render status, shared with the HTTP threads."""
+
+    def __init__(self):
+        self.changed = threading.Condition()
+        self.jpeg = None
+        self.seq = 0
+        self.status = {}
+
+    def publish(self, jpeg):
+        with self.changed:
+            self.jpeg = jpeg
+            self.seq += 1
+            self.changed.notify_all()
+
+    def next_frame(self, seq, timeout=5.0):
+        """Block until a frame newer than ``seq`` exists; return ``(seq, jpeg)``."""
+        with self.changed:
+            self.changed.wait_for(lambda: self.seq > seq, timeout)
+            return self.seq, self.jpeg
+
+
+def make_handler(feed):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/":
+                self._send(200, "text/html", PAGE)
+            elif self.path == "/status":
+                self._send(200, "application/json", json.dumps(feed.status).encode())
+            elif self.path == "/stream":
+                self._stream()
+            else:
+                self._send(404, "text/plain", b"not found")
+
+        def _send(self, code, content_type, body):
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.end_headers()
+            seq = 0
+            try:
+                while True:
+                    new_seq, jpeg = feed.next_frame(seq)
+                    if new_seq == seq or jpeg is None:
+                        continue
+                    seq = new_seq
+                    self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n")
+                    self.wfile.write(f"Content-Length: {len(jpeg)}\r\n\r\n".encode())
+                    self.wfile.write(jpeg + b"\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class Watcher:
+    """Report which files and scene classes changed since the last poll."""
+
+    def __init__(self):
+        self.index = SceneIndex()
+        self.index.refresh()
+        self.files, self.classes = self._snapshot()
+        self.last_poll = time.perf_counter()
+        self.pending = None
+
+    def _snapshot(self):
+        files = {rel: entry["source_hash"] for rel, entry in self.index.files.items()}
+        classes = {(s["file"], s["scene"]): s["class_hash"] for s in self.index.scenes()}
+        return files, classes
+
+    def poll(self):
+        """Return ``(changed files, changed scenes)`` at most every POLL_INTERVAL, else None."""
+        if self.pending is not None:
+            return self.pending
+        now = time.perf_counter()
+        if now - self.last_poll < POLL_INTERVAL:
+            return None
+        self.last_poll = now
+        if not self.index.refresh():
+            return None
+        files, classes = self._snapshot()
+        changed_files = {rel for rel, digest in files.items() if self.files.get(rel) != digest}
+        changed_scenes = [key for key, digest in classes.items() if self.classes.get(key) != digest]
+        self.files, self.classes = files, classes
+        if changed_files:
+            self.pending = changed_files, changed_scenes
+        return self.pending
+
+    def take(self):
+        pending, self.pending = self.pending, None
+        return pending
+
+
+class Preview:
+    """Render scenes in this process and pace their frames onto the feed."""
+
+    def __init__(self, feed, watcher):
+        self.feed = feed
+        self.watcher = watcher
+        self.started = None
+        self.playing = False
+        self.clock = 0.0
+
+    def on_frame(self, frame, seconds):
+        from PIL import Image
+
+        if not self.playing:
+            now = time.perf_counter()
+            self.feed.status.update(state="playing", first_frame=round(now - self.started, 3))
+            self.started, self.playing = now, True
+        buffer = BytesIO()
+        Image.fromarray(frame[..., :3]).save(buffer, format="JPEG", quality=JPEG_QUALITY)
+        self.feed.publish(buffer.getvalue())
+        # Play back in real time, watching for edits while a frame is shown
+        self.clock += seconds
+        while True:
+            if self.watcher.poll() is not None:
+                raise Reload
+            delay = self.started + self.clock - time.perf_counter()
+            if delay <= 0:
+                return
+            time.sleep(min(delay, POLL_INTERVAL))
+
+    def render(self, rel, scene_name, changed_files):
+        from manim import config
+
+        self.started, self.playing, self.clock = time.perf_counter(), False, 0.0
+        scene_class = load_scene(rel, scene_name, changed_files)
+        config.input_file = str(REPO_DIR / rel)
+        self.feed.status = {"scene": f"{rel}::{scene_name}", "state": "rendering"}
+        scene_class().render()
+        self.feed.status["state"] = "done"
+
+
+def load_scene(rel, scene_name, changed_files):
+    """Execute ``rel`` afresh, dropping edited helper modules so they are imported again."""
+    changed = {(REPO_DIR / f).resolve() for f in changed_files}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and Path(path).resolve() in changed:
+            del sys.modules[name]
+    name = Path(rel).stem
+    spec = importlib.util.spec_from_file_location(name, REPO_DIR / rel)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def install_frame_hook(preview):
+    """Send every frame the Cairo renderer produces to ``preview``."""
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    add_frame = CairoRenderer.add_frame
+
+    def add_previewed_frame(renderer, frame, num_frames=1):
+        add_frame(renderer, frame, num_frames)
+        if not renderer.skip_animations:
+            preview.on_frame(frame, num_frames / renderer.camera.frame_rate)
+
+    CairoRenderer.add_frame = add_previewed_frame
+
+
+def next_target(current, changed_scenes):
+    """Scene to render after an edit: a changed scene, preferring the current file."""
+    if not changed_scenes:
+        return current
+    same_file = [key for key in changed_scenes if key[0] == current[0]]
+    return (same_file or changed_scenes)[0]
+
+
+def serve(rel, scene_name, port, quality):
+    lazy_manim.install()
+    import manim
+    from manim import config
+
+    import tex_cache
+
+    tex_cache.install()
+    config.quality = QUALITIES[quality]
+    config.format = "none"
+    config.disable_caching = True
+    config.progress_bar = "none"
+    config.verbosity = "WARNING"
+
+    feed = FrameFeed()
+    watcher = Watcher()
+    preview = Preview(feed, watcher)
+    install_frame_hook(preview)
+    if scene_name is None:
+        scenes = [key for key in watcher.classes if key[0] == rel]
+        if not scenes:
+            raise SystemExit(f"No scene found in {rel}")
+        scene_name = scenes[0][1]
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(feed))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Manim {manim.__version__} preview at http://127.0.0.1:{port}/ (Ctrl+C to stop)")
+
+    target, changed_files = (rel, scene_name), set()
+    try:
+        while True:
+            try:
+                preview.render(*target, changed_files)
+            except Reload:
+                pass
+            except Exception:
+                error = traceback.format_exc()
+                print(error, file=sys.stderr)
+                feed.status.update(state="failed", error=error.strip().splitlines()[-1])
+            while watcher.poll() is None:
+                time.sleep(POLL_INTERVAL)
+            changed_files, changed_scenes = watcher.take()
+            target = next_target(target, changed_scenes)
+            print(f"{', '.join(sorted(changed_files))} changed: rendering {target[0]}::{target[1]}")
+    except KeyboardInterrupt:
+        server.shutdown()
+        return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Preview a scene in the browser and re-render it on every save.")
+    parser.add_argument("file", help="tutorial module, relative to the repository")
+    parser.add_argument("scene", nargs="?", help="scene class (default: the first one in the file)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    args = parser.parse_args(argv)
+    rel = str(Path(args.file).resolve().relative_to(REPO_DIR))
+    return serve(rel, args.scene, args.port, args.quality)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
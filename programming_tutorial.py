@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Arrow, Circle, Dot, Line, Mobject, Polygon, Rectangle,
+    RoundedRectangle, Star, Text, VGroup,
+    Create, DrawBorderThenFill, FadeIn, GrowArrow, LaggedStart, Write,
+    DL, DOWN, DR, LEFT, ORIGIN, PI, RIGHT, UL, UP, UR,
+    BLACK, BLUE, BLUE_E, GOLD, GOLD_E, GREEN, GREEN_E, PURPLE_E, RED, RED_E, TEAL_E,
+    WHITE, YELLOW, YELLOW_E
+)
 
 class ProgrammingTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    RoundedRectangle, SurroundingRectangle, Text, VGroup,
+    Create, FadeOut, LaggedStart, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, WHITE, YELLOW
+)
 
 class PythonArgsKwargsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Rectangle, Text, VGroup,
+    FadeOut, ReplacementTransform, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
 
 class PythonCommentsTutorial(Scene):
     def construct(self):
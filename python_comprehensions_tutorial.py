@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Rectangle, Text, VGroup,
+    Create, LaggedStart, Write,
+    BOLD, DOWN, LEFT, RIGHT, UP,
+    BLUE, GRAY, GREEN, ORANGE, WHITE, YELLOW
+)
 
 class PythonComprehensionsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, RoundedRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GREEN, RED, WHITE, YELLOW
+)
 
 class DataTypesTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeOut, LaggedStart, ReplacementTransform, Write,
+    DOWN, LEFT, UP,
+    BLUE, BLUE_C, GRAY, GREEN, RED, WHITE, YELLOW
+)
 
 class DecoratorsTutorial(Scene):
     def construct(self):
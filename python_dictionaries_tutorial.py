@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, RoundedRectangle, Text, VGroup,
+    Create, FadeOut, LaggedStart, Transform, Write,
+    DOWN, ORIGIN, RIGHT, UP,
+    BLUE, GRAY, GREEN, WHITE, YELLOW
+)
 
 class PythonDictionariesTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeOut, LaggedStart, ReplacementTransform, Write,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
 
 class ExceptionHandlingTutorial(Scene):
     def construct(self):
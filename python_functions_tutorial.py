@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Rectangle, RoundedRectangle, SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, LaggedStart, ReplacementTransform, Transform, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GREEN, RED, WHITE, YELLOW
+)
 
 class FunctionsTutorial(Scene):
     def construct(self):
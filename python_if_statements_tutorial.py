@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Rectangle, Text, VGroup,
+    Create, GrowArrow, Transform, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GRAY, GREEN, RED, WHITE, YELLOW
+)
 
 class IfStatementsTutorial(Scene):
     def construct(self):
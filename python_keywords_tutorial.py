@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Text, VGroup,
+    FadeIn, FadeOut, LaggedStart, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
 
 class PythonKeywordsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, RoundedRectangle, Text, VGroup,
+    Create, FadeOut, Write,
+    DOWN, LEFT, UL, UP,
+    BLACK, BLUE, GRAY, GREEN, WHITE, YELLOW
+)
 
 class PythonLambdaTutorial(Scene):
     def construct(self):
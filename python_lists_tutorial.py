@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Rectangle, RoundedRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UL, UP,
+    BLACK, BLUE, GREEN, WHITE, YELLOW
+)
 
 class PythonListsTutorial(Scene):
     def construct(self):
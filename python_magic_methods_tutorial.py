@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Text, VGroup,
+    FadeOut, LaggedStart, Write,
+    DOWN, LEFT, UP,
+    BLUE, RED, WHITE, YELLOW
+)
 
 class MagicMethodsTutorial(Scene):
     def construct(self):
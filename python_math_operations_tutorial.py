@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Rectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, GrowArrow, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GREEN, PINK, WHITE, YELLOW
+)
 
 class MathOperationsTutorial(Scene):
     def construct(self):
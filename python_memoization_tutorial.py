@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Text, VGroup,
+    FadeOut, LaggedStart, Write,
+    DOWN, LEFT, UP,
+    BLUE, GRAY, GREEN, RED, WHITE, YELLOW
+)
 from functools import lru_cache
 
 class MemoizationTutorial(Scene):
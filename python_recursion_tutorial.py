@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Rectangle, Text, VGroup,
+    ApplyMethod, FadeIn, FadeOut, GrowFromEdge, LaggedStart, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, BLUE_C, BLUE_D, GREEN, RED, WHITE, YELLOW
+)
 
 class RecursionTutorial(Scene):
     def construct(self):
@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Ellipse, Rectangle, Text, VGroup,
+    Create, FadeOut, GrowFromCenter, LaggedStart, Transform, Write,
+    DOWN, LEFT, RIGHT, UL, UP,
+    BLACK, BLUE, GRAY, GREEN, WHITE, YELLOW
+)
+import numpy as np
 
 class PythonSetsTutorial(Scene):
     def construct(self):
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Line, Rectangle, SVGMobject, Text, VGroup,
+    Create, FadeIn, FadeOut, GrowArrow, LaggedStart, ReplacementTransform, Rotate,
+    Write,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW,
+    there_and_back
+)
 
 class ThreadingTutorial(Scene):
     def construct(self):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, RoundedRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UL, UP,
+    BLACK, BLUE, RED, WHITE, YELLOW
+)
 
 class PythonTuplesTutorial(Scene):
     def construct(self):
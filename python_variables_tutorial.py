@@ -1,4 +1,11 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Code, Line, Rectangle, RoundedRectangle, Square,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, Indicate, Transform,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, GREY_B, RED, WHITE, YELLOW
+)
 
 # Color palette
 CODE_COLOR = '#2d2d2d'
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, RoundedRectangle, SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, ReplacementTransform, Transform, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLACK, BLUE, GREEN, GREEN_E, GREY_B, GREY_E, ORANGE, WHITE, YELLOW, YELLOW_E
+)
 
 PRIMARY = BLUE
 ACCENT = YELLOW
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Text, VGroup,
+    FadeIn, FadeOut, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, BLUE_C, GREEN, LIGHT_GRAY, PURPLE, RED, TEAL, YELLOW
+)
 
 class QuantumComputingTutorial(Scene):
     def construct(self):
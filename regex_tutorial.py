@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, Write,
+    DOWN, LEFT, RIGHT,
+    BLACK, BLUE, GREEN, GREY, WHITE, YELLOW
+)
 import re
 
 class RegexTutorial(Scene):
@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    SurroundingRectangle, Text, VGroup,
+    Create, FadeIn, FadeOut, LaggedStart, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, WHITE, YELLOW
+)
 
 class RegexTutorial(Scene):
     def construct(self):
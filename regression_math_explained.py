@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    MathTex, Text, VGroup,
+    FadeOut, LaggedStart, Transform, Write,
+    DOWN, LEFT, UP,
+    BLUE, GREEN, WHITE, YELLOW
+)
 import numpy as np
 
 class LinearRegressionMath(Scene):
@@ -0,0 +1,186 @@
+"""Render every Scene in the repository in parallel.
+
+Scenes come from the static index in ``scene_index.py``. Each scene is
+rendered in its own ``manim`` process, so a crashed or hung render can be
+killed on timeout without taking the batch down with it. The pool size
+limits how many of those processes run at once.
+
+Usage:
+    python render_all.py                      # all scenes, low quality
+    python render_all.py -q h -j 8 --timeout 900
+    python render_all.py --filter kmeans --summary kmeans_summary.json
+    python render_all.py --list
+    python render_all.py --no-cache           # ignore the incremental build cache
+    python render_all.py --no-tex-cache       # compile LaTeX per worker as plain manim does
+    python render_all.py --profile media/profiles --filter DecisionTree
+    python render_all.py --stream             # one encoder per scene, no partial movie files
+    python render_all.py --pool               # fork every render from one warm interpreter
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+from render_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, RenderCache, scene_key
+from scene_index import discover_scenes
+from render_pool import ForkPool
+from render_profile import PROFILE_ENV
+from stream_output import STREAM_ENV
+from tex_cache import DEFAULT_CACHE_DIR as DEFAULT_TEX_CACHE_DIR
+
+REPO_DIR = Path(__file__).resolve().parent
+QUALITIES = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+# Manim's CLI with held frames encoded once (static_frames.py)
+MANIM = [sys.executable, str(REPO_DIR / "static_frames.py"), "--no-tex-cache", "manim"]
+# Same CLI, with the shared LaTeX cache installed in the worker
+TEX_CACHED_MANIM = [sys.executable, str(REPO_DIR / "static_frames.py"), "manim"]
+PROFILER = [sys.executable, str(REPO_DIR / "render_profile.py")]
+
+
+def output_path(job, quality, media_dir):
+    module = Path(job["file"]).stem
+    return Path(media_dir) / "videos" / module / QUALITIES[quality] / f"{job['scene']}.mp4"
+
+
+def render_scene(job, quality, timeout, media_dir, manim=TEX_CACHED_MANIM, env=None):
+    cmd = [
+        *manim, "render",
+        "-q", quality, "--media_dir", str(media_dir),
+        job["file"], job["scene"],
+    ]
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=REPO_DIR, capture_output=True, text=True, timeout=timeout, env=env)
+        status = "ok" if proc.returncode == 0 else "failed"
+        returncode = proc.returncode
+        log_tail = (proc.stdout + proc.stderr)[-2000:]
+    except subprocess.TimeoutExpired as exc:
+        status = "timeout"
+        returncode = None
+        log_tail = ((exc.stdout or b"").decode(errors="replace") + (exc.stderr or b"").decode(errors="replace"))[-2000:]
+    result = dict(job)
+    result.update({
+        "status": status,
+        "returncode": returncode,
+        "wall_time": round(time.perf_counter() - start, 3),
+        "output": str(output_path(job, quality, media_dir)),
+    })
+    if status != "ok":
+        result["log_tail"] = log_tail
+    return result
+
+
+def cached_render(cache, render):
+    """Wrap ``render`` so unchanged scenes reuse their cached video."""
+
+    def run(job, quality, timeout, media_dir):
+        start = time.perf_counter()
+        key = scene_key(job["file"], job["scene"], quality)
+        output = output_path(job, quality, media_dir)
+        if cache.restore(key, output):
+            result = dict(job)
+            result.update({
+                "status": "cached",
+                "returncode": 0,
+                "wall_time": round(time.perf_counter() - start, 3),
+                "output": str(output),
+            })
+            return result
+        result = render(job, quality, timeout, media_dir)
+        if result["status"] == "ok":
+            cache.store(key, output, job["file"], job["scene"])
+        return result
+
+    return run
+
+
+def render_all(jobs, quality="l", workers=None, timeout=None, media_dir="media", render=render_scene, cache=None):
+    workers = workers or os.cpu_count() or 1
+    if cache is not None:
+        render = cached_render(cache, render)
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render, job, quality, timeout, media_dir): job for job in jobs}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{result['status']:>7}] {result['wall_time']:8.1f}s  {result['file']}::{result['scene']}", flush=True)
+    order = {(job["file"], job["scene"]): i for i, job in enumerate(jobs)}
+    results.sort(key=lambda r: order[(r["file"], r["scene"])])
+    return results
+
+
+def write_summary(results, path, started, quality, workers):
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    summary = {
+        "quality": quality,
+        "workers": workers,
+        "total_wall_time": round(time.perf_counter() - started, 3),
+        "counts": counts,
+        "scenes": results,
+    }
+    Path(path).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every Scene subclass in the repository.")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="number of scenes rendered at once")
+    parser.add_argument("--timeout", type=float, default=None, help="per-scene timeout in seconds")
+    parser.add_argument("--filter", action="append", default=[], help="only render scenes whose file or class name contains this text")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--summary", default="render_summary.json", help="where to write the JSON summary")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 1024 ** 3, help="cache size cap in GiB")
+    parser.add_argument("--no-cache", action="store_true", help="render every scene even if unchanged")
+    parser.add_argument("--tex-cache-dir", default=str(DEFAULT_TEX_CACHE_DIR), help="LaTeX cache shared by the workers")
+    parser.add_argument("--no-tex-cache", action="store_true", help="let every worker compile its own LaTeX")
+    parser.add_argument("--profile", metavar="DIR", default=None, help="write a per-play timing report for every scene to DIR")
+    parser.add_argument("--stream", action="store_true", help="encode each scene into one stream instead of a file per play")
+    parser.add_argument("--pool", action="store_true", help="fork the renders from one interpreter with Manim already loaded")
+    parser.add_argument("--list", action="store_true", help="list the scenes that would be rendered and exit")
+    args = parser.parse_args(argv)
+    if args.pool and args.profile:
+        parser.error("--pool cannot be combined with --profile")
+
+    jobs = discover_scenes()
+    if args.filter:
+        jobs = [j for j in jobs if any(f.lower() in (j["file"] + j["scene"]).lower() for f in args.filter)]
+    if args.list:
+        for job in jobs:
+            print(f"{job['file']}::{job['scene']} ({job['base']})")
+        return 0
+
+    # A profile needs real renders, so it bypasses the build cache
+    cache = None if args.no_cache or args.profile else RenderCache(args.cache_dir, int(args.cache_size * 1024 ** 3))
+    manim = MANIM if args.no_tex_cache else TEX_CACHED_MANIM
+    if args.profile:
+        os.environ[PROFILE_ENV] = str(Path(args.profile).resolve())
+        manim = PROFILER + (["--no-tex-cache"] if args.no_tex_cache else []) + ["manim"]
+    if args.stream:
+        os.environ[STREAM_ENV] = "1"
+    render = partial(render_scene, manim=manim)
+    os.environ["TEX_CACHE_DIR"] = args.tex_cache_dir
+    started = time.perf_counter()
+    pool = ForkPool(use_tex_cache=not args.no_tex_cache) if args.pool else None
+    try:
+        render = pool.render if pool else render
+        results = render_all(jobs, args.quality, args.workers, args.timeout, REPO_DIR / args.media_dir, render=render, cache=cache)
+    finally:
+        if pool:
+            pool.close()
+    summary = write_summary(results, args.summary, started, args.quality, args.workers)
+    print(f"Rendered {len(results)} scenes in {summary['total_wall_time']:.1f}s: {summary['counts']}")
+    return 0 if all(r["status"] in ("ok", "cached") for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Render benchmark with regression gating.
+
+Renders a fixed, representative set of scenes one after another at a fixed
+quality through the profiler (``render_profile.py``) and records, per
+scene, frames per second inside play calls, construct time outside them,
+the whole construct time, wall time and peak memory. Each scene is rendered
+into a fresh media folder so Manim's partial-movie cache cannot help.
+
+The glyph and LaTeX caches are scratch folders too, so a result never
+depends on what earlier renders left in ``.glyph_cache/`` or
+``.tex_cache/``. With ``--cache-mode cold`` (the default) every render
+starts with empty caches. With ``--cache-mode warm`` one untimed render per
+scene fills them before the timed renders. The baseline records its mode
+and is only compared with runs in the same mode.
+
+Results are compared with ``bench_baseline.json`` in the repository; the
+run fails when a scene is slower or larger than its baseline by more than
+the threshold, and when there is no baseline to compare with. Re-record the baseline on the reference machine with
+``--update-baseline`` after an intended change.
+
+Usage:
+    python render_bench.py                    # compare with the baseline
+    python render_bench.py --repeat 3 --threshold 0.1
+    python render_bench.py --update-baseline
+    python render_bench.py --filter KMeans
+    python render_bench.py --cache-mode warm
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render_all import PROFILER, REPO_DIR, render_scene
+from render_cache import manim_version
+from render_profile import PROFILE_ENV
+
+BASELINE_PATH = REPO_DIR / "bench_baseline.json"
+QUALITY = "l"
+CACHE_MODES = ("cold", "warm")
+BENCH_SCENES = [
+    ("test_scene.py", "TestScene"),
+    ("kmeans_clustering_explanation.py", "KMeansClusteringExplanation"),
+    ("dimensionality_reduction_tutorial.py", "DimensionalityReductionTutorial"),
+    ("decision_tree_explanation.py", "DecisionTreeExplanation"),
+    ("while_loop_tutorial.py", "WhileLoopTutorial"),
+]
+# metric -> True when a larger value is better
+METRICS = {
+    "frames_per_second": True,
+    "outside_play_time": False,
+    "construct_time": False,
+    "peak_rss_mib": False,
+}
+
+
+def machine():
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "manim": manim_version(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def bench_scene(file, scene, timeout=None, cache_dir=None):
+    """Render ``scene`` once in a scratch media folder and return its metrics.
+
+    The glyph and LaTeX caches live in ``cache_dir``, or in empty scratch
+    folders when it is None.
+    """
+    scratch = Path(tempfile.mkdtemp(prefix="render_bench_"))
+    caches = Path(cache_dir) if cache_dir is not None else scratch / "caches"
+    try:
+        env = dict(os.environ, **{
+            PROFILE_ENV: str(scratch / "profile"),
+            "GLYPH_CACHE_DIR": str(caches / "glyphs"),
+            "TEX_CACHE_DIR": str(caches / "tex"),
+        })
+        result = render_scene({"file": file, "scene": scene}, QUALITY, timeout, scratch / "media", manim=PROFILER + ["manim"], env=env)
+        if result["status"] != "ok":
+            return {"status": result["status"], "log_tail": result.get("log_tail", "")}
+        summary = json.loads((scratch / "profile" / f"{scene}.summary.json").read_text(encoding="utf-8"))
+        summary.update(status="ok", wall_time=result["wall_time"])
+        return summary
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def run(scenes, repeat=1, timeout=None, cache_mode="cold"):
+    results = {}
+    for file, scene in scenes:
+        if cache_mode == "warm":
+            cache_dir = tempfile.mkdtemp(prefix="render_bench_caches_")
+            try:
+                # Untimed render that fills this scene's caches
+                bench_scene(file, scene, timeout, cache_dir)
+                runs = [bench_scene(file, scene, timeout, cache_dir) for _ in range(repeat)]
+            finally:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+        else:
+            runs = [bench_scene(file, scene, timeout) for _ in range(repeat)]
+        failed = [r for r in runs if r["status"] != "ok"]
+        if failed:
+            results[scene] = failed[0]
+        else:
+            # Median of every numeric metric across the repeats
+            results[scene] = {
+                key: statistics.median(r[key] for r in runs) if isinstance(runs[0][key], (int, float)) else runs[0][key]
+                for key in runs[0]
+                if runs[0][key] is not None
+            }
+        r = results[scene]
+        if r["status"] == "ok":
+            print(
+                f"{scene:<34} {r['frames_per_second']:8.1f} fps  construct {r.get('construct_time', float('nan')):7.2f}s"
+                f"  outside play {r.get('outside_play_time', float('nan')):6.2f}s  peak {r['peak_rss_mib']:6.0f} MiB",
+                flush=True,
+            )
+        else:
+            print(f"{scene:<34} {r['status']}", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for scene, current in results.items():
+        if current["status"] != "ok":
+            regressions.append(f"{scene}: render {current['status']}")
+            continue
+        reference = baseline.get("scenes", {}).get(scene)
+        if reference is None:
+            regressions.append(f"{scene}: no baseline (record one with --update-baseline)")
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in current or not reference.get(metric):
+                continue
+            change = (current[metric] - reference[metric]) / reference[metric]
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{scene}: {metric} {reference[metric]:.3f} -> {current[metric]:.3f} ({change:+.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark a fixed set of scenes and compare with the stored baseline.")
+    parser.add_argument("--repeat", type=int, default=1, help="renders per scene; the median is kept")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative regression (0.15 = 15%%)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-render timeout in seconds")
+    parser.add_argument("--filter", action="append", default=[], help="only benchmark scenes whose name contains this text")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default="cold", help="start every render with empty glyph and LaTeX caches, or warm them first")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--output", default=None, help="also write this run's results as JSON")
+    args = parser.parse_args(argv)
+
+    scenes = [s for s in BENCH_SCENES if not args.filter or any(f.lower() in s[1].lower() for f in args.filter)]
+    started = time.perf_counter()
+    results = run(scenes, args.repeat, args.timeout, args.cache_mode)
+    report = {"machine": machine(), "quality": QUALITY, "cache_mode": args.cache_mode, "repeat": args.repeat, "scenes": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Benchmarked {len(scenes)} scenes in {time.perf_counter() - started:.1f}s")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        if any(r["status"] != "ok" for r in results.values()):
+            print("Not updating the baseline: some renders failed", file=sys.stderr)
+            return 1
+        previous = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {"scenes": {}}
+        if previous.get("cache_mode") != args.cache_mode:
+            # Timings from the other mode are not comparable; start over
+            previous["scenes"] = {}
+        previous["scenes"].update(results)
+        previous.update(machine=report["machine"], quality=QUALITY, cache_mode=args.cache_mode)
+        baseline_path.write_text(json.dumps(previous, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"No readable baseline at {baseline_path}; run with --update-baseline to record one", file=sys.stderr)
+        return 1
+    if baseline.get("cache_mode") != args.cache_mode:
+        print(f"Baseline was recorded with --cache-mode {baseline.get('cache_mode')}, not {args.cache_mode}", file=sys.stderr)
+        return 1
+    if baseline.get("machine") != report["machine"]:
+        print(f"Warning: baseline was recorded on {baseline.get('machine')}", file=sys.stderr)
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
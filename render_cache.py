@@ -0,0 +1,146 @@
+"""Content-hash build cache for rendered scenes.
+
+A scene's key hashes its module source, the source of every local helper
+module it imports (transitively), the installed Manim version and the
+render quality. When the key is unchanged the previously rendered MP4 is
+copied back into place instead of rendering again. Cached videos are
+evicted least-recently-used first once the cache exceeds its size cap.
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = REPO_DIR / ".render_cache"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def local_imports(path, root=REPO_DIR):
+    """Return the repository modules imported by ``path``, transitively."""
+    found = []
+    pending = [Path(path)]
+    seen = {Path(path).resolve()}
+    while pending:
+        current = pending.pop()
+        try:
+            tree = ast.parse(current.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.append(node.module)
+        for name in names:
+            candidate = (root / (name.replace(".", "/") + ".py")).resolve()
+            if candidate.exists() and candidate not in seen:
+                seen.add(candidate)
+                found.append(candidate)
+                pending.append(candidate)
+    return sorted(found)
+
+
+def scene_key(file, scene, quality, root=REPO_DIR):
+    digest = hashlib.sha256()
+    digest.update(f"manim={manim_version()}\nquality={quality}\nscene={scene}\n".encode())
+    path = root / file
+    for source in [path] + local_imports(path, root):
+        digest.update(os.path.relpath(source, root).encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.index = {}
+
+    def _save(self):
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.index, indent=1), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def restore(self, key, output):
+        """Copy the cached video for ``key`` to ``output``; return True on a hit."""
+        with self._lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return False
+            cached = self.objects_dir / entry["object"]
+            if not cached.exists():
+                del self.index[key]
+                self._save()
+                return False
+            entry["last_used"] = time.time()
+            self._save()
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # copy2 carries the cached file's mtime over, so an output with the same
+        # size and mtime is this very object; anything else is replaced
+        try:
+            stat = cached.stat()
+            try:
+                current = output.stat()
+                fresh = (current.st_size, current.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                fresh = False
+            if not fresh:
+                shutil.copy2(cached, output)
+        except OSError:
+            # evicted by a concurrent store() after the lock was released
+            with self._lock:
+                if self.index.get(key) is entry:
+                    del self.index[key]
+                    self._save()
+            return False
+        return True
+
+    def store(self, key, output, file, scene):
+        output = Path(output)
+        if not output.exists():
+            return
+        name = f"{key}.mp4"
+        tmp = self.objects_dir / f"{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copy2(output, tmp)
+        os.replace(tmp, self.objects_dir / name)
+        with self._lock:
+            self.index[key] = {
+                "file": file,
+                "scene": scene,
+                "object": name,
+                "size": output.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            (self.objects_dir / entry["object"]).unlink(missing_ok=True)
+            total -= entry["size"]
+            del self.index[key]
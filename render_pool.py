@@ -0,0 +1,242 @@
+"""Render scenes in processes forked from one warm Manim interpreter.
+
+A worker started by ``render_all.py`` is a new interpreter: it imports
+Manim, loads fonts through Pango, builds the TeX template and imports the
+repository helpers before its scene's first frame. The pool does that once.
+``render_pool.py serve`` imports all of Manim and the helper modules the
+scenes use, installs the LaTeX and held-frame patches, renders a line of
+``Text`` and a formula, and then forks one child per scene. Each child
+shares the warm parent's memory copy-on-write and runs the usual
+``manim render`` command line in-process, so a scene's own state (config
+changes, module globals) still dies with its process.
+
+The server reads one JSON request per line on stdin and answers on stdout
+when the scene's process exits. ``ForkPool`` is the client that
+``render_all.py --pool`` uses in place of ``render_scene``.
+
+Usage:
+    python render_all.py --pool -j 8
+"""
+import importlib
+import itertools
+import json
+import os
+import selectors
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from render_cache import local_imports
+from scene_index import REPO_DIR
+from stream_output import STREAM_ENV
+
+POLL_INTERVAL = 0.05
+
+
+def warm_up(use_tex_cache=True):
+    """Import and initialise everything the scenes share; return the LaTeX cache."""
+    # All of Manim and its command line, before any fork
+    importlib.import_module("manim.__main__")
+    from manim import MathTex, Text, tempconfig
+
+    import static_frames
+    import stream_output
+    import tex_cache
+
+    cache = tex_cache.install() if use_tex_cache else None
+    static_frames.install()
+    if os.environ.get(STREAM_ENV):
+        stream_output.install()
+    with tempfile.TemporaryDirectory(prefix="render_pool_") as media_dir, tempconfig({"media_dir": media_dir}):
+        Text("Warm-up")
+        try:
+            MathTex(r"x^2")
+        except Exception as error:
+            print(f"TeX warm-up failed: {error}", file=sys.stderr)
+    if cache is not None:
+        cache.flush_stats()
+    return cache
+
+
+def import_helpers(files):
+    """Import the repository modules that ``files`` import, so children inherit them."""
+    for helper in sorted({path for file in files for path in local_imports(REPO_DIR / file)}):
+        try:
+            __import__(helper.stem)
+        except Exception as error:
+            print(f"Could not preload {helper.name}: {error}", file=sys.stderr)
+
+
+def render_child(request, log_path, cache):
+    """Body of a forked child: run ``manim render`` for one scene and exit."""
+    code = 1
+    try:
+        os.setpgid(0, 0)
+        log = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.dup2(log, 1)
+        os.dup2(log, 2)
+        from manim.__main__ import main as manim_main
+
+        args = ["render", "-q", request["quality"], "--media_dir", request["media_dir"], request["file"], request["scene"]]
+        manim_main(args=args, prog_name="manim")
+        code = 0
+    except SystemExit as error:
+        code = error.code if isinstance(error.code, int) else int(error.code is not None)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            if cache is not None:
+                cache.flush_stats()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def serve(use_tex_cache=True):
+    """Fork a child per request line on stdin; answer on stdout as they exit."""
+    # Keep the real stdout for replies; anything else printed goes to stderr
+    replies = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+    cache = warm_up(use_tex_cache)
+    log_dir = Path(tempfile.mkdtemp(prefix="render_pool_logs_"))
+    selector = selectors.DefaultSelector()
+    selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+    buffer, open_input, running, preloaded = b"", True, {}, set()
+
+    def start(request):
+        files = {request["file"]} - preloaded
+        if files:
+            import_helpers(files)
+            preloaded.update(files)
+        log_path = log_dir / f"{request['id']}.log"
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            selector.close()
+            render_child(request, log_path, cache)
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            pass  # the child already did
+        running[pid] = (request, time.monotonic(), log_path)
+
+    def reply(request, status, returncode, log_path):
+        try:
+            log_tail = log_path.read_text(errors="replace")[-2000:]
+            log_path.unlink()
+        except OSError:
+            log_tail = ""
+        replies.write(json.dumps({"id": request["id"], "status": status, "returncode": returncode, "log_tail": log_tail}) + "\n")
+
+    while open_input or running:
+        if open_input and selector.select(POLL_INTERVAL):
+            chunk = os.read(sys.stdin.fileno(), 65536)
+            if not chunk:
+                open_input = False
+                selector.unregister(sys.stdin.fileno())
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    start(json.loads(line))
+        elif not open_input:
+            time.sleep(POLL_INTERVAL)
+        while running:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            request, _, log_path = running.pop(pid)
+            returncode = os.waitstatus_to_exitcode(status)
+            reply(request, "timeout" if request.get("timed_out") else "ok" if returncode == 0 else "failed", returncode, log_path)
+        now = time.monotonic()
+        for pid, (request, started, _) in running.items():
+            if request.get("timeout") and not request.get("timed_out") and now - started > request["timeout"]:
+                request["timed_out"] = True
+                # The child leads its own process group, so LaTeX and friends go too
+                os.killpg(pid, signal.SIGKILL)
+    log_dir.rmdir()
+    return 0
+
+
+class ForkPool:
+    """Client for ``render_pool.py serve``; ``render`` is a drop-in for ``render_scene``."""
+
+    def __init__(self, use_tex_cache=True):
+        cmd = [sys.executable, str(REPO_DIR / "render_pool.py"), "serve"]
+        if not use_tex_cache:
+            cmd.append("--no-tex-cache")
+        self.proc = subprocess.Popen(cmd, cwd=REPO_DIR, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        self.ids = itertools.count()
+        self.lock = threading.Lock()
+        self.waiting = {}
+        self.reader = threading.Thread(target=self._read_replies, daemon=True)
+        self.reader.start()
+
+    def _read_replies(self):
+        for line in self.proc.stdout:
+            reply = json.loads(line)
+            with self.lock:
+                entry = self.waiting.pop(reply["id"])
+            entry["reply"] = reply
+            entry["done"].set()
+        # The server exited: fail everything still waiting
+        with self.lock:
+            waiting, self.waiting = self.waiting, {}
+        for entry in waiting.values():
+            entry["reply"] = {"status": "failed", "returncode": None, "log_tail": "render pool exited"}
+            entry["done"].set()
+
+    def render(self, job, quality, timeout, media_dir):
+        from render_all import output_path
+
+        entry = {"done": threading.Event()}
+        start = time.perf_counter()
+        with self.lock:
+            request_id = next(self.ids)
+            self.waiting[request_id] = entry
+            request = {
+                "id": request_id, "file": job["file"], "scene": job["scene"],
+                "quality": quality, "media_dir": str(media_dir), "timeout": timeout,
+            }
+            try:
+                self.proc.stdin.write(json.dumps(request) + "\n")
+                self.proc.stdin.flush()
+            except (BrokenPipeError, ValueError):
+                self.waiting.pop(request_id)
+                entry["reply"] = {"status": "failed", "returncode": None, "log_tail": "render pool exited"}
+                entry["done"].set()
+        entry["done"].wait()
+        reply = entry["reply"]
+        result = dict(job)
+        result.update({
+            "status": reply["status"],
+            "returncode": reply["returncode"],
+            "wall_time": round(time.perf_counter() - start, 3),
+            "output": str(output_path(job, quality, media_dir)),
+        })
+        if reply["status"] != "ok":
+            result["log_tail"] = reply["log_tail"]
+        return result
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] != ["serve"]:
+        sys.exit("usage: render_pool.py serve [--no-tex-cache]  (normally started by render_all.py --pool)")
+    return serve(use_tex_cache="--no-tex-cache" not in argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
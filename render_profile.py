@@ -0,0 +1,271 @@
+"""Opt-in per-play() profiling for scene renders.
+
+``install()`` wraps a few Manim internals so every ``play`` and ``wait``
+becomes one record: where it was called from, the animation types, how many
+mobjects were in the scene, how many frames it wrote and how its wall time
+split between interpolation (``Scene.update_to_time``), rasterisation
+(``CairoRenderer.update_frame``/``get_frame``) and encoding
+(``SceneFileWriter.write_frame``/``end_animation``; the encoder may run in
+the background, so the flush at the end of a play counts too). The
+process's peak RSS is sampled after each call, and each scene's
+``construct()`` is timed as a whole.
+
+When the process exits the records of each scene are written to the profile
+directory as ``<Scene>.json``, ``<Scene>.csv`` and ``<Scene>.folded``; the
+last is the folded-stack format read by ``flamegraph.pl`` and speedscope,
+with microseconds as sample counts. ``<Scene>.summary.json`` holds the
+totals: construct time, time spent in and outside play calls, frames and
+peak RSS.
+
+Usage:
+    python render_profile.py manim render -ql dimensionality_reduction_tutorial.py DimensionalityReductionTutorial
+    python render_profile.py --no-tex-cache manim render -ql decision_tree_explanation.py
+    python render_profile.py report media/profiles/DecisionTreeExplanation.json --sort rasterize --top 15
+    python render_all.py --profile media/profiles --filter DecisionTree
+"""
+import argparse
+import atexit
+import csv
+import functools
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+import lazy_manim
+
+REPO_DIR = Path(__file__).resolve().parent
+PROFILE_ENV = "RENDER_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = REPO_DIR / "media" / "profiles"
+PHASES = ("interpolate", "rasterize", "encode")
+FIELDS = [
+    "index", "kind", "scene", "function", "source", "animations", "mobjects",
+    "frames", "total", *PHASES, "other", "peak_rss_mib",
+]
+
+
+def peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 ** 2 if sys.platform == "darwin" else 1024), 1)
+
+
+def caller_location():
+    """File, line and function of the tutorial code that called play/wait."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        path = Path(frame.f_code.co_filename)
+        if path.name != Path(__file__).name and "site-packages" not in path.parts and path.is_relative_to(REPO_DIR):
+            return f"{path.relative_to(REPO_DIR)}:{frame.f_lineno}", frame.f_code.co_name
+        frame = frame.f_back
+    return "?", "?"
+
+
+def animation_names(args):
+    names = []
+    for arg in args:
+        if type(arg).__name__ == "_AnimationBuilder":
+            names.append("animate")
+        else:
+            names.append(type(arg).__name__)
+    return names
+
+
+class Profiler:
+    def __init__(self):
+        self.records = []
+        self.construct_times = {}
+        self.current = None
+        self._phase = None
+
+    def begin(self, scene, args):
+        source, function = caller_location()
+        names = animation_names(args)
+        self.current = {
+            "index": len(self.records),
+            "kind": "wait" if names and all(n == "Wait" for n in names) else "play",
+            "scene": type(scene).__name__,
+            "function": function,
+            "source": source,
+            "animations": "+".join(names),
+            "mobjects": len(scene.get_mobject_family_members()),
+            "frames": 0,
+            **dict.fromkeys(PHASES, 0.0),
+            "_start": time.perf_counter(),
+        }
+
+    def end(self):
+        record = self.current
+        self.current = None
+        record["total"] = time.perf_counter() - record.pop("_start")
+        record["other"] = max(record["total"] - sum(record[p] for p in PHASES), 0.0)
+        record["peak_rss_mib"] = peak_rss_mib()
+        for name in ("total", "other", *PHASES):
+            record[name] = round(record[name], 6)
+        self.records.append(record)
+
+    def timed(self, phase, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if self.current is None or self._phase is not None:
+                return fn(*args, **kwargs)
+            self._phase = phase
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.current[phase] += time.perf_counter() - start
+                self._phase = None
+
+        return wrapper
+
+    def timed_construct(self, scene):
+        """Replace ``scene.construct`` on the instance with a timed version."""
+        construct = scene.construct
+
+        @functools.wraps(construct)
+        def wrapper():
+            start = time.perf_counter()
+            try:
+                return construct()
+            finally:
+                self.construct_times[type(scene).__name__] = time.perf_counter() - start
+
+        scene.construct = wrapper
+
+    def by_scene(self):
+        scenes = {}
+        for record in self.records:
+            scenes.setdefault(record["scene"], []).append(record)
+        return scenes
+
+    def summary(self, scene, records):
+        play_time = sum(r["total"] for r in records)
+        construct_time = self.construct_times.get(scene)
+        frames = sum(r["frames"] for r in records)
+        return {
+            "scene": scene,
+            "plays": len(records),
+            "frames": frames,
+            "construct_time": None if construct_time is None else round(construct_time, 6),
+            "play_time": round(play_time, 6),
+            # Building mobjects and other Python work between plays
+            "outside_play_time": None if construct_time is None else round(max(construct_time - play_time, 0.0), 6),
+            "frames_per_second": round(frames / play_time, 3) if play_time else None,
+            "peak_rss_mib": max((r["peak_rss_mib"] for r in records), default=peak_rss_mib()),
+            **{phase: round(sum(r[phase] for r in records), 6) for phase in PHASES},
+        }
+
+    def write(self, out_dir):
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for scene, records in self.by_scene().items():
+            write_json(records, out_dir / f"{scene}.json")
+            write_csv(records, out_dir / f"{scene}.csv")
+            write_folded(records, out_dir / f"{scene}.folded")
+            write_json(self.summary(scene, records), out_dir / f"{scene}.summary.json")
+
+
+def write_json(records, path):
+    Path(path).write_text(json.dumps(records, indent=1), encoding="utf-8")
+
+
+def write_csv(records, path):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_folded(records, path):
+    """scene;function;play@source;phase <microseconds> per line."""
+    lines = []
+    for r in records:
+        stack = f"{r['scene']};{r['function']};{r['kind']} {r['animations']} @{r['source']}"
+        for phase in (*PHASES, "other"):
+            micros = int(r[phase] * 1e6)
+            if micros:
+                lines.append(f"{stack};{phase} {micros}")
+    Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def install(out_dir=None):
+    """Instrument Manim in this process and write the report at exit."""
+    from manim import Scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    profiler = Profiler()
+    play = Scene.play
+
+    @functools.wraps(play)
+    def profiled_play(scene, *args, **kwargs):
+        if profiler.current is not None:
+            return play(scene, *args, **kwargs)
+        profiler.begin(scene, args)
+        try:
+            return play(scene, *args, **kwargs)
+        finally:
+            profiler.end()
+
+    setup = Scene.setup
+
+    @functools.wraps(setup)
+    def profiled_setup(scene, *args, **kwargs):
+        profiler.timed_construct(scene)
+        return setup(scene, *args, **kwargs)
+
+    write_frame = SceneFileWriter.write_frame
+
+    @functools.wraps(write_frame)
+    def counted_write_frame(writer, *args, **kwargs):
+        if profiler.current is not None:
+            profiler.current["frames"] += kwargs.get("repeat", 1)
+        return write_frame(writer, *args, **kwargs)
+
+    Scene.setup = profiled_setup
+    Scene.play = profiled_play
+    Scene.update_to_time = profiler.timed("interpolate", Scene.update_to_time)
+    CairoRenderer.update_frame = profiler.timed("rasterize", CairoRenderer.update_frame)
+    CairoRenderer.get_frame = profiler.timed("rasterize", CairoRenderer.get_frame)
+    SceneFileWriter.write_frame = profiler.timed("encode", counted_write_frame)
+    SceneFileWriter.end_animation = profiler.timed("encode", SceneFileWriter.end_animation)
+    atexit.register(profiler.write, out_dir or os.environ.get(PROFILE_ENV, DEFAULT_PROFILE_DIR))
+    return profiler
+
+
+def report(path, sort="total", top=20):
+    records = json.loads(Path(path).read_text(encoding="utf-8"))
+    total = sum(r["total"] for r in records) or 1.0
+    records.sort(key=lambda r: r[sort], reverse=True)
+    print(f"{'total':>8} {'share':>6} {'interp':>8} {'raster':>8} {'encode':>8} {'frames':>6} {'mobs':>5}  source / animations")
+    for r in records[:top]:
+        print(
+            f"{r['total']:8.3f} {r['total'] / total:6.1%} {r['interpolate']:8.3f} {r['rasterize']:8.3f} "
+            f"{r['encode']:8.3f} {r['frames']:6d} {r['mobjects']:5d}  {r['source']} {r['kind']} {r['animations']}"
+        )
+    print(f"{len(records)} calls, {total:.2f}s in play/wait, peak RSS {max(r['peak_rss_mib'] for r in records):.0f} MiB")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "manim" in argv[:2]:
+        lazy_manim.install()
+        install()
+        from static_frames import main as static_frames_main
+        return static_frames_main(argv)
+
+    parser = argparse.ArgumentParser(description="Show a per-play profile written by a profiled render.")
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("profile", help="a <Scene>.json written by a profiled render")
+    parser.add_argument("--sort", choices=["total", *PHASES, "frames", "mobjects", "peak_rss_mib", "index"], default="total")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+    report(args.profile, args.sort, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
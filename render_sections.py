@@ -0,0 +1,220 @@
+"""Render the sections of a SectionedScene in parallel and join them.
+
+The section list is read from the class's ``sections`` attribute with
+``ast``, so the parent never imports Manim. Every section is rendered by its
+own ``manim`` process into its own media folder (with ``RENDER_SECTIONS``
+naming the section), then the section videos are concatenated without
+re-encoding into the scene's usual output path.
+
+Finished sections are recorded in ``manifest.json`` next to the section
+folders together with a hash of their code, so a crashed or killed run
+picks up where it stopped: sections whose hash is unchanged and whose video
+still exists are reused, and a section that was interrupted half-way keeps
+its media folder, where Manim's own partial-movie cache skips the plays it
+already rendered.
+
+Usage:
+    python render_sections.py ensemble_learning_tutorial.py EnsembleLearningTutorial -j 13
+    python render_sections.py association_rule_learning_tutorial.py AssociationRuleLearningTutorial -q h
+    python render_sections.py while_loop_tutorial.py WhileLoopTutorial --fresh   # ignore the manifest
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from render_all import QUALITIES, REPO_DIR, output_path, render_scene
+from render_cache import local_imports, manim_version
+from sectioned_scene import SECTIONS_ENV
+
+
+def _scene_class(tree, file, scene):
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == scene:
+            return node
+    raise ValueError(f"No class {scene} in {file}")
+
+
+def find_sections(file, scene):
+    """Return the ``sections`` tuple declared on class ``scene`` in ``file``."""
+    node = _scene_class(ast.parse((REPO_DIR / file).read_text(encoding="utf-8")), file, scene)
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "sections" for t in stmt.targets):
+            return list(ast.literal_eval(stmt.value))
+    raise ValueError(f"{file}::{scene} does not declare sections")
+
+
+def section_hashes(file, scene, quality):
+    """Hash each section's method together with everything the sections share.
+
+    The shared part is the module with every section method cut out, its
+    local helper modules, the Manim version and the quality, so editing one
+    section only invalidates that section while editing a helper method or
+    an import invalidates them all.
+    """
+    path = REPO_DIR / file
+    source = path.read_text(encoding="utf-8")
+    sections = find_sections(file, scene)
+    node = _scene_class(ast.parse(source), file, scene)
+    lines = source.splitlines(keepends=True)
+    methods = {}
+    for stmt in node.body:
+        if isinstance(stmt, ast.FunctionDef) and stmt.name in sections:
+            # A later definition replaces an earlier one, as at runtime
+            methods[stmt.name] = "".join(lines[stmt.lineno - 1:stmt.end_lineno])
+            for i in range(stmt.lineno - 1, stmt.end_lineno):
+                lines[i] = "\n"
+
+    shared = hashlib.sha256()
+    shared.update(f"manim={manim_version()}\nquality={quality}\nscene={scene}\n".encode())
+    shared.update("".join(lines).encode())
+    for helper in local_imports(path):
+        shared.update(os.path.relpath(helper, REPO_DIR).encode())
+        shared.update(helper.read_bytes())
+    return {
+        name: hashlib.sha256((shared.hexdigest() + name + methods.get(name, "")).encode()).hexdigest()
+        for name in sections
+    }
+
+
+class Manifest:
+    """Completed sections of one scene, saved after every section."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self.sections = json.loads(self.path.read_text(encoding="utf-8"))["sections"]
+        except (OSError, ValueError, KeyError):
+            self.sections = {}
+
+    def completed(self, name, code_hash):
+        """The recorded result for ``name`` if it is still valid, else None."""
+        entry = self.sections.get(name)
+        if entry and entry["code_hash"] == code_hash and Path(entry["output"]).exists():
+            return entry
+        return None
+
+    def record(self, name, code_hash, result):
+        with self._lock:
+            if result["status"] == "ok":
+                self.sections[name] = {"code_hash": code_hash, "output": result["output"], "wall_time": result["wall_time"]}
+            else:
+                self.sections.pop(name, None)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"sections": self.sections}, indent=1), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+def scene_sections_dir(media_dir, file, scene):
+    return Path(media_dir) / "sections" / Path(file).stem / scene
+
+
+def section_media_dir(media_dir, file, scene, index, name):
+    return scene_sections_dir(media_dir, file, scene) / f"{index:02d}_{name}"
+
+
+def render_section(job, quality, timeout, media_dir):
+    env = dict(os.environ, **{SECTIONS_ENV: job["section"]})
+    result = render_scene(job, quality, timeout, media_dir, env=env)
+    result["media_dir"] = str(media_dir)
+    return result
+
+
+def concat_videos(inputs, output):
+    """Join MP4s that share one encoding by remuxing their packets (no re-encode)."""
+    import av
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    manifest = BytesIO("".join(f"file 'file:{Path(p).resolve().as_posix()}'\n" for p in inputs).encode())
+    with av.open(manifest, format="concat", options={"safe": "0", "an": "1"}) as source:
+        stream = source.streams.video[0]
+        with av.open(str(output), mode="w") as target:
+            out_stream = target.add_stream_from_template(template=stream)
+            for packet in source.demux(stream):
+                if packet.dts is None:
+                    continue
+                # dts restarts in every input; let libav recompute it
+                packet.dts = None
+                packet.stream = out_stream
+                target.mux(packet)
+
+
+def render_sections(file, scene, quality="l", workers=None, timeout=None, media_dir=REPO_DIR / "media", render=render_section, resume=True):
+    sections = find_sections(file, scene)
+    hashes = section_hashes(file, scene, quality)
+    manifest = Manifest(scene_sections_dir(media_dir, file, scene) / "manifest.json")
+    workers = workers or min(len(sections), os.cpu_count() or 1)
+
+    def run(job, section_dir):
+        start = time.perf_counter()
+        entry = manifest.completed(job["section"], hashes[job["section"]]) if resume else None
+        if entry is not None:
+            result = dict(job)
+            result.update(status="reused", returncode=0, wall_time=round(time.perf_counter() - start, 3), output=entry["output"])
+            return result
+        result = render(job, quality, timeout, section_dir)
+        manifest.record(job["section"], hashes[job["section"]], result)
+        return result
+
+    jobs = [
+        ({"file": file, "scene": scene, "section": name, "index": i}, section_media_dir(media_dir, file, scene, i, name))
+        for i, name in enumerate(sections)
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run, job, section_dir) for job, section_dir in jobs]
+        results = []
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            print(f"[{result['status']:>7}] {result['wall_time']:8.1f}s  {scene}::{result['section']}", flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the sections of a scene in parallel and join them.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="sections rendered at once (default: one per section, up to the CPU count)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-section timeout in seconds")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--summary", default=None, help="where to write a JSON summary")
+    parser.add_argument("--fresh", action="store_true", help="re-render every section even if the manifest has it")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    media_dir = REPO_DIR / args.media_dir
+    results = render_sections(args.file, args.scene, args.quality, args.workers, args.timeout, media_dir, resume=not args.fresh)
+    failed = [r for r in results if r["status"] not in ("ok", "reused")]
+    final = output_path({"file": args.file, "scene": args.scene}, args.quality, media_dir)
+    if not failed:
+        concat_videos([r["output"] for r in results], final)
+    summary = {
+        "file": args.file,
+        "scene": args.scene,
+        "quality": args.quality,
+        "output": None if failed else str(final),
+        "total_wall_time": round(time.perf_counter() - started, 3),
+        "sections": results,
+    }
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if failed:
+        print(f"{len(failed)} of {len(results)} sections failed; nothing joined", file=sys.stderr)
+        return 1
+    print(f"Rendered {len(results)} sections in {summary['total_wall_time']:.1f}s -> {final}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, Arrow, Circle, Line, Mobject, Rectangle,
+    RoundedRectangle, Square, Text, Triangle, VGroup,
+    FadeIn, GrowArrow, LaggedStart, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, GREEN_E, MAROON_E, PURPLE_E, TEAL_E, WHITE,
+    YELLOW, YELLOW_E
+)
+from components import lock_icon
 
 class RoboticsDrones3DPrintingTutorial(Scene):
     def construct(self):
@@ -79,7 +88,7 @@ class RoboticsDrones3DPrintingTutorial(Scene):
 
         icons = VGroup(
             self._badge("Cost", self._icon_money(), GRAY),
-            self._badge("Privacy", self._icon_lock(), TEAL_E),
+            self._badge("Privacy", lock_icon(), TEAL_E),
             self._badge("Materials", self._icon_cube(), BLUE_E),
             self._badge("Jobs", self._icon_people(), YELLOW_E)
         ).arrange(RIGHT, buff=0.6).next_to(bullets, DOWN, buff=0.8)
@@ -141,14 +150,6 @@ class RoboticsDrones3DPrintingTutorial(Scene):
         circle = Circle(radius=0.06, color=WHITE).move_to(bill.get_center())
         return VGroup(bill, circle)
 
-    def _icon_lock(self) -> VGroup:
-        lock = VGroup(
-            RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
-            ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
-            Dot(radius=0.05, color=WHITE)
-        )
-        return lock
-
     def _icon_cube(self) -> VGroup:
         sq = Square(0.25, color=WHITE)
         axes = VGroup(Line(ORIGIN, RIGHT*0.15, color=WHITE), Line(ORIGIN, UP*0.15, color=WHITE))
@@ -0,0 +1,73 @@
+"""Scatter plots built from one array of coordinates.
+
+``VGroup(*[Dot(axes.c2p(x, y)) for x, y in points])`` builds a fresh circle
+(arc maths, colour setup, bezier arrays) for every point and calls ``c2p``
+once per point. ``Scatter`` maps the whole ``(N, 2)`` array through the axes
+in one matrix product (``coordinates.coords_to_points``) and clones each dot
+from a unit circle by scaling and shifting its point array, so a
+thousand-point plot costs a thousand cheap copies.
+
+It is still a ``VGroup`` with one ``Dot`` per row, so ``scatter[i]``,
+``StaggeredRecolor`` and per-point ``.animate`` calls keep working, and the
+batch methods below are animatable through ``scatter.animate``.
+
+Example:
+    dots = Scatter(points, axes, colors=WHITE, radius=0.09)
+    self.play(dots.animate.set_colors([palette[label] for label in labels]))
+    self.play(dots.highlight([3, 17], color=RED))
+"""
+import numpy as np
+from manim import DEFAULT_DOT_RADIUS, WHITE, YELLOW, AnimationGroup, Dot, ManimColor, VGroup
+
+from coordinates import coords_to_points
+
+
+class Scatter(VGroup):
+    def __init__(self, coords, axes=None, colors=WHITE, radius=DEFAULT_DOT_RADIUS, fill_opacity=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.axes = axes
+        coords = np.array(coords, dtype=float).reshape(len(coords), -1)
+        n = len(coords)
+        colors = [colors] * n if not isinstance(colors, (list, tuple, np.ndarray)) else list(colors)
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), (n,))
+        if len(colors) != n:
+            raise ValueError(f"Expected {n} colours, got {len(colors)}")
+
+        # One unit circle per colour; every dot is a scaled, shifted copy
+        templates = {}
+        for center, color, r in zip(self.coords_to_points(coords), colors, radii):
+            color = ManimColor(color)
+            template = templates.get(color)
+            if template is None:
+                template = templates[color] = Dot(radius=1, color=color, fill_opacity=fill_opacity)
+            dot = template.copy()
+            dot.points = template.points * r + center
+            dot.radius, dot.arc_center = r, center
+            self.add(dot)
+
+    def coords_to_points(self, coords):
+        coords = np.atleast_2d(np.asarray(coords, dtype=float))
+        if self.axes is not None:
+            return coords_to_points(self.axes, coords)
+        return np.pad(coords, ((0, 0), (0, 3 - coords.shape[1])))
+
+    def set_colors(self, colors):
+        """Recolour every dot; ``colors`` is one colour or one per dot."""
+        if not isinstance(colors, (list, tuple, np.ndarray)):
+            colors = [colors] * len(self)
+        for dot, color in zip(self, colors):
+            dot.set_color(color)
+        return self
+
+    def move_to_coords(self, coords):
+        """Move every dot to new data coordinates, e.g. ``scatter.animate.move_to_coords(projected)``."""
+        for dot, point in zip(self, self.coords_to_points(coords)):
+            dot.move_to(point)
+        return self
+
+    def subset(self, indices):
+        return VGroup(*[self[i] for i in indices])
+
+    def highlight(self, indices, color=YELLOW, scale_factor=1.6, **kwargs):
+        """Animation enlarging and recolouring only the dots at ``indices``."""
+        return AnimationGroup(*[self[i].animate.set_color(color).scale(scale_factor) for i in indices], **kwargs)
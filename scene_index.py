@@ -0,0 +1,163 @@
+"""Static index of the Scene classes in the repository.
+
+Scenes are found by parsing each module with ``ast`` instead of importing
+it, so listing them never runs ``from manim import *``. The index is kept in
+``.scene_index.json`` and a file is only re-parsed when its size or
+modification time changes.
+
+Usage:
+    python scene_index.py            # print every scene
+    python scene_index.py --rebuild  # ignore the on-disk index
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+INDEX_PATH = REPO_DIR / ".scene_index.json"
+INDEX_VERSION = 1
+SCENE_BASES = ("Scene", "ThreeDScene")
+SKIP_DIRS = {"media", "venv", ".venv", "__pycache__"}
+
+
+def iter_source_files(root=REPO_DIR):
+    for path in sorted(root.rglob("*.py")):
+        rel = path.relative_to(root)
+        if any(part.startswith(".") or part in SKIP_DIRS for part in rel.parts[:-1]):
+            continue
+        yield path
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def parse_scenes(source, filename="<unknown>"):
+    """Return a record for each Scene subclass defined at module level in ``source``."""
+    try:
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError:
+        return []
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    bases = {name: [_base_name(b) for b in node.bases] for name, node in classes.items()}
+
+    def root_base(name, seen=()):
+        for base in bases.get(name, []):
+            if base in SCENE_BASES:
+                return base
+            if base in bases and base not in seen:
+                found = root_base(base, seen + (name,))
+                if found:
+                    return found
+        return None
+
+    scenes = []
+    for name, node in classes.items():
+        base = root_base(name)
+        if base:
+            segment = ast.get_source_segment(source, node) or ""
+            scenes.append({
+                "scene": name,
+                "base": base,
+                "line": node.lineno,
+                "class_hash": hashlib.sha256(segment.encode()).hexdigest(),
+            })
+    return scenes
+
+
+class SceneIndex:
+    def __init__(self, root=REPO_DIR, path=INDEX_PATH):
+        self.root = Path(root)
+        self.path = Path(path)
+        self.files = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION:
+                self.files = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def refresh(self):
+        """Re-parse changed files, drop deleted ones; return True if anything changed."""
+        changed = False
+        seen = set()
+        for path in iter_source_files(self.root):
+            rel = str(path.relative_to(self.root))
+            seen.add(rel)
+            stat = path.stat()
+            entry = self.files.get(rel)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry and entry["source_hash"] == digest:
+                entry["mtime_ns"] = stat.st_mtime_ns
+            else:
+                entry = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "source_hash": digest,
+                    "scenes": parse_scenes(data.decode("utf-8", errors="replace"), rel),
+                }
+                self.files[rel] = entry
+            changed = True
+        for rel in set(self.files) - seen:
+            del self.files[rel]
+            changed = True
+        if changed:
+            self.save()
+        return changed
+
+    def save(self):
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": self.files}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def scenes(self):
+        records = []
+        for rel in sorted(self.files):
+            entry = self.files[rel]
+            for scene in entry["scenes"]:
+                record = {"file": rel, "scene": scene["scene"], "base": scene["base"]}
+                record.update(line=scene["line"], source_hash=entry["source_hash"], class_hash=scene["class_hash"])
+                records.append(record)
+        return records
+
+
+def discover_scenes(root=REPO_DIR, index_path=INDEX_PATH):
+    index = SceneIndex(root, index_path)
+    index.refresh()
+    return index.scenes()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List the Scene classes in the repository without importing them.")
+    parser.add_argument("--rebuild", action="store_true", help="discard the on-disk index first")
+    parser.add_argument("--json", action="store_true", help="print the index as JSON")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        INDEX_PATH.unlink(missing_ok=True)
+    start = time.perf_counter()
+    scenes = discover_scenes()
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(scenes, indent=2))
+    else:
+        for scene in scenes:
+            print(f"{scene['file']}::{scene['scene']} ({scene['base']})")
+        print(f"{len(scenes)} scenes indexed in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
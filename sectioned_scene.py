@@ -0,0 +1,35 @@
+"""Mixin for tutorials built from independent parts.
+
+Several long tutorials are a sequence of methods separated by
+``self.clear()``. Listing those methods in ``sections`` lets
+``render_sections.py`` render each part in its own process and join the
+videos afterwards; a normal ``manim render`` still plays them all in order.
+
+Example:
+    class EnsembleLearningTutorial(SectionedScene, Scene):
+        sections = ("scene1_intro", "scene2_what_is_ensemble", ...)
+"""
+import os
+
+# Comma-separated section names; when set, construct() plays only those
+SECTIONS_ENV = "RENDER_SECTIONS"
+
+
+class SectionedScene:
+    sections = ()
+
+    def selected_sections(self):
+        wanted = os.environ.get(SECTIONS_ENV)
+        if not wanted:
+            return list(self.sections)
+        names = wanted.split(",")
+        unknown = [name for name in names if name not in self.sections]
+        if unknown:
+            raise ValueError(f"{type(self).__name__} has no section(s) {', '.join(unknown)}")
+        return [name for name in self.sections if name in names]
+
+    def construct(self):
+        for i, name in enumerate(self.selected_sections()):
+            if i:
+                self.clear()
+            getattr(self, name)()
@@ -1,5 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, DashedLine, Dot, Line, MathTex, Text, VGroup,
+    Create, FadeIn, Transform, Write,
+    DEGREES, DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, RED, WHITE, YELLOW
+)
 import numpy as np
+from coordinates import segments
 
 class SimpleRegression(Scene):
     def construct(self):
@@ -29,15 +36,14 @@ class SimpleRegression(Scene):
         )
         
         # Add minor ticks manually
-        minor_ticks = VGroup()
-        for x in [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5]:
-            tick = Line(
-                start=axes.c2p(x, -0.1),
-                end=axes.c2p(x, 0.1),
-                stroke_width=1,
-                color=BLUE
-            )
-            minor_ticks.add(tick)
+        minor_x = np.arange(0.5, 7, 1.0)
+        minor_ticks = segments(
+            axes,
+            np.column_stack([minor_x, np.full_like(minor_x, -0.1)]),
+            np.column_stack([minor_x, np.full_like(minor_x, 0.1)]),
+            stroke_width=1,
+            color=BLUE
+        )
         
         # Add 0 at the origin
         origin_label = Text("0", font_size=24, color=BLUE).next_to(
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, Arrow, Circle, Line, Polygon, Rectangle, RoundedRectangle, Square, Text,
+    VGroup,
+    Create, FadeIn, Rotate, Write,
+    BOLD, DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLUE, GRAY, GREEN, PURPLE, RED, TEAL, WHITE, YELLOW,
+    there_and_back
+)
 
 class SoftwareLicensesTutorial(Scene):
     def construct(self):
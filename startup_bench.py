@@ -0,0 +1,104 @@
+"""Worker start-up benchmark: eager ``import manim`` against ``lazy_manim``.
+
+Every render worker is a fresh interpreter that imports Manim and then the
+tutorial module. For each benchmarked scene this starts new interpreters
+that import the scene's module and look up the scene class, once with plain
+``manim`` and once with ``lazy_manim.install()`` first, and reports the
+median import time, process wall time and number of ``manim`` modules
+loaded.
+
+Usage:
+    python startup_bench.py
+    python startup_bench.py --repeat 10 --filter Regex --output startup.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from render_all import REPO_DIR
+from render_bench import BENCH_SCENES, machine
+
+STARTUP_SCENES = BENCH_SCENES + [
+    ("regex_with_manim.py", "RegexIntro"),
+    ("python_dictionaries_tutorial.py", "PythonDictionariesTutorial"),
+]
+MODES = ("eager", "lazy")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+if {lazy}:
+    import lazy_manim
+    lazy_manim.install()
+import importlib
+getattr(importlib.import_module({module!r}), {scene!r})
+print(json.dumps({{
+    "import_time": time.perf_counter() - started,
+    "manim_modules": sum(1 for name in sys.modules if name == "manim" or name.startswith("manim.")),
+}}))
+"""
+
+
+def probe(file, scene, mode):
+    """Import ``scene`` in a fresh interpreter; return its timings."""
+    code = PROBE.format(lazy=mode == "lazy", module=Path(file).stem, scene=scene)
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, capture_output=True, text=True)
+    wall_time = time.perf_counter() - start
+    if proc.returncode != 0:
+        return {"status": "failed", "log_tail": proc.stderr[-2000:]}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result.update(status="ok", wall_time=wall_time)
+    return result
+
+
+def run(scenes, repeat=5):
+    results = {}
+    for file, scene in scenes:
+        results[scene] = {}
+        for mode in MODES:
+            runs = [probe(file, scene, mode) for _ in range(repeat)]
+            failed = [r for r in runs if r["status"] != "ok"]
+            results[scene][mode] = failed[0] if failed else {
+                "status": "ok",
+                "import_time": statistics.median(r["import_time"] for r in runs),
+                "wall_time": statistics.median(r["wall_time"] for r in runs),
+                "manim_modules": runs[0]["manim_modules"],
+            }
+        eager, lazy = results[scene]["eager"], results[scene]["lazy"]
+        if eager["status"] == lazy["status"] == "ok":
+            print(
+                f"{scene:<34} import {eager['import_time']:6.2f}s -> {lazy['import_time']:6.2f}s"
+                f"  process {eager['wall_time']:6.2f}s -> {lazy['wall_time']:6.2f}s"
+                f"  modules {eager['manim_modules']:4d} -> {lazy['manim_modules']:4d}",
+                flush=True,
+            )
+        else:
+            print(f"{scene:<34} eager {eager['status']}, lazy {lazy['status']}", flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare worker start-up with eager and lazy Manim imports.")
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters per scene and mode; the median is kept")
+    parser.add_argument("--filter", action="append", default=[], help="only benchmark scenes whose name contains this text")
+    parser.add_argument("--output", default=None, help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    scenes = [s for s in STARTUP_SCENES if not args.filter or any(f.lower() in s[1].lower() for f in args.filter)]
+    if scenes:
+        # Build the symbol table once so no probe pays for it
+        probe(*scenes[0], "lazy")
+    results = run(scenes, args.repeat)
+    if args.output:
+        report = {"machine": machine(), "repeat": args.repeat, "scenes": results}
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0 if all(r["status"] == "ok" for modes in results.values() for r in modes.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Encode held frames once per hold instead of once per video frame.
+
+A ``wait`` with no updaters on the scene, no time-based updaters on any
+mobject and no stop condition is already rasterised a single time by
+Manim's Cairo renderer, which then hands the file writer that frame with
+``repeat=N``. The segment encoder still rebuilds a ``VideoFrame`` from the
+RGBA array and converts it to the output pixel format N times, which at
+1080p60 costs about as much as encoding. ``install()`` converts a repeated
+frame once and submits the same converted frame N times with increasing
+timestamps; the encoded video is unchanged (H.264 turns the duplicates into
+skip frames).
+
+Usage:
+    python static_frames.py manim render -ql regex_tutorial.py RegexIntro
+    python static_frames.py --no-tex-cache manim render -ql python_keywords_tutorial.py
+"""
+import functools
+import os
+import sys
+from fractions import Fraction
+
+import lazy_manim
+from stream_output import STREAM_ENV, install as install_stream_output
+
+
+def install():
+    """Make every segment encoder in this process convert a held frame only once."""
+    import av
+    from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+    write_frame = VideoSegmentEncoder.write_frame
+
+    @functools.wraps(write_frame)
+    def write_held_frame(encoder, pixels, *, repeat=1):
+        if repeat == 1:
+            return write_frame(encoder, pixels, repeat=repeat)
+        encoder._validate_frame(pixels, repeat)
+        rate = encoder.spec.frame_rate
+        time_base = Fraction(rate.denominator, rate.numerator)
+        try:
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgba").reformat(format=encoder.spec.pixel_format)
+            for _ in range(repeat):
+                frame.pts = encoder._next_pts
+                frame.time_base = time_base
+                encoder._next_pts += 1
+                for packet in encoder._stream.encode(frame):
+                    encoder._container.mux(packet)
+        except BaseException as error:
+            raise encoder._operation_error("encode", error) from error
+
+    VideoSegmentEncoder.write_frame = write_held_frame
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lazy_manim.install()
+    use_tex_cache = argv[0] != "--no-tex-cache"
+    argv = argv[argv.index("manim"):]
+    install()
+    if os.environ.get(STREAM_ENV):
+        install_stream_output()
+    if use_tex_cache:
+        from tex_cache import main as tex_cache_main
+        return tex_cache_main(argv)
+    from manim.__main__ import main as manim_main
+    return manim_main(args=argv[1:], prog_name="manim")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
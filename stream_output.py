@@ -0,0 +1,115 @@
+"""Stream a whole scene into one video file instead of one file per play.
+
+Manim encodes every ``play``/``wait`` into its own partial movie in
+``media/videos/<module>/<quality>/partial_movie_files/`` and, when the
+scene ends, remuxes them all into the final video. A scene built from
+dozens of short plays (``KMeansClusteringExplanation`` has over sixty)
+opens, finalises and re-reads a file for each of them.
+
+``install()`` gives each scene a single encoder that stays open from the
+first play to the end of the scene. Frames still go through Manim's bounded
+queue to a separate encoder thread, so rasterising the next frame overlaps
+with encoding the previous one; there are just no per-play files and no
+concat pass. Without sound the stream is renamed into place; with sound (or
+for a GIF) Manim's usual combine step runs once over the single stream.
+
+Streaming replaces Manim's per-play cache: every play is rendered again.
+Scenes written with ``--save_sections`` keep the per-play files because
+their sections are cut from them.
+
+Usage:
+    python render_all.py --stream --filter KMeansClusteringExplanation
+    RENDER_STREAM_OUTPUT=1 python static_frames.py manim render -ql kmeans_clustering_explanation.py
+"""
+import functools
+import os
+from contextlib import suppress
+
+STREAM_ENV = "RENDER_STREAM_OUTPUT"
+
+
+def _streams(writer):
+    return writer.output_spec.is_video and not writer.output_spec.save_sections
+
+
+def install():
+    """Make every scene in this process encode all of its plays into one stream."""
+    from manim import __version__
+    from manim.scene.scene_file_writer import SceneFileWriter, _PartialMovieEncodeJob
+    from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+    is_already_cached = SceneFileWriter.is_already_cached
+    begin_animation = SceneFileWriter.begin_animation
+    end_animation = SceneFileWriter.end_animation
+    abort_encode_jobs = SceneFileWriter.abort_encode_jobs
+    finish = SceneFileWriter.finish
+
+    def stream_path(writer):
+        movie = writer.movie_file_path
+        return movie.with_name(f".{movie.stem}.stream.{writer.video_encoder.container_format}")
+
+    def open_stream(writer, animation_index):
+        encoder = VideoSegmentEncoder(target=stream_path(writer), spec=writer.video_encoder)
+        encoder._container.metadata["comment"] = f"Rendered with Manim Community v{__version__}"
+        return _PartialMovieEncodeJob(
+            animation_index=animation_index,
+            encoder=encoder,
+            frame_queue_size=writer.settings.encoder_queue_size,
+        )
+
+    @functools.wraps(is_already_cached)
+    def never_cached(writer, hash_invocation):
+        # A cached play would leave a gap in the stream
+        return False if _streams(writer) else is_already_cached(writer, hash_invocation)
+
+    @functools.wraps(begin_animation)
+    def begin_streamed_animation(writer, allow_write=False, *, animation_index, file_path=None):
+        if not (allow_write and _streams(writer)):
+            return begin_animation(writer, allow_write, animation_index=animation_index, file_path=file_path)
+        if getattr(writer, "_stream_job", None) is None:
+            writer._stream_job = open_stream(writer, animation_index)
+        writer._current_encode_job = writer._stream_job
+
+    @functools.wraps(end_animation)
+    def end_streamed_animation(writer, allow_write=False):
+        if getattr(writer, "_stream_job", None) is None:
+            return end_animation(writer, allow_write)
+        # Keep the stream open for the next play
+        writer._current_encode_job = None
+
+    @functools.wraps(abort_encode_jobs)
+    def abort_stream(writer, reraise_encoder_failures=False):
+        job = getattr(writer, "_stream_job", None)
+        if job is not None:
+            # Let Manim abort it as the open job so its worker thread exits
+            writer._current_encode_job = job
+            writer._stream_job = None
+        return abort_encode_jobs(writer, reraise_encoder_failures)
+
+    @functools.wraps(finish)
+    def finish_stream(writer):
+        job = getattr(writer, "_stream_job", None)
+        if job is None:
+            return finish(writer)
+        writer._stream_job = None
+        job.seal()
+        job.join()
+        movie = writer.movie_file_path
+        if writer.includes_sound or writer.output_spec.is_gif:
+            writer.partial_movie_files = [str(job.path)]
+            try:
+                writer.combine_to_movie()
+            finally:
+                with suppress(OSError):
+                    job.path.unlink()
+        else:
+            os.replace(job.path, movie)
+            writer.print_file_ready_message(str(movie))
+        if writer.subcaptions:
+            writer.write_subcaption_file()
+
+    SceneFileWriter.is_already_cached = never_cached
+    SceneFileWriter.begin_animation = begin_streamed_animation
+    SceneFileWriter.end_animation = end_streamed_animation
+    SceneFileWriter.abort_encode_jobs = abort_stream
+    SceneFileWriter.finish = finish_stream
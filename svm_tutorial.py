@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from scatter import Scatter
 
 class SVMTutorial(Scene):
     def construct(self):
@@ -56,8 +57,8 @@ class SVMTutorial(Scene):
         class2 = np.random.randn(10, 2) + [-2, -2]
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
@@ -146,8 +147,8 @@ class SVMTutorial(Scene):
         class2 = np.random.randn(10, 2) * 0.5 + [-1, -1]
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
@@ -247,8 +248,8 @@ class SVMTutorial(Scene):
         class2 = np.vstack([class2, overlap2])
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
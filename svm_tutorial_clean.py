@@ -1,5 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Circle, Line, MathTex, ParametricFunction, Text, VGroup,
+    Create, FadeIn, LaggedStart, Transform, Write,
+    DOWN, LEFT, RIGHT, UP,
+    BLUE, GREEN, ORANGE, RED, WHITE, YELLOW
+)
 import numpy as np
+from scatter import Scatter
 
 class SVMTutorialClean(Scene):
     def construct(self):
@@ -51,8 +58,8 @@ class SVMTutorialClean(Scene):
         class2 = np.random.randn(10, 2) * 0.5 + [-1, -1]
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
@@ -129,8 +136,8 @@ class SVMTutorialClean(Scene):
         class2 = np.random.randn(10, 2) * 0.5 + [-1, -1]
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
@@ -222,8 +229,8 @@ class SVMTutorialClean(Scene):
         class2 = np.vstack([class2, overlap2])
         
         # Create scatter plot
-        dots1 = VGroup(*[Dot(point=[x, y, 0], color=BLUE) for x, y in class1])
-        dots2 = VGroup(*[Dot(point=[x, y, 0], color=RED) for x, y in class2])
+        dots1 = Scatter(class1, colors=BLUE)
+        dots2 = Scatter(class2, colors=RED)
         
         # Create axes
         axes = Axes(
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    ArcBetweenPoints, Circle, Dot, Line, Mobject, Polygon, Rectangle, RoundedRectangle,
+    Square, Text, Triangle, VGroup,
+    Create, FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GREEN, GREEN_E, MAROON_E, PURPLE_E, RED, TEAL_E, WHITE, YELLOW,
+    YELLOW_E
+)
 
 class SystemVsApplicationSoftwareTutorial(Scene):
     def construct(self):
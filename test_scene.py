@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Dot, Text,
+    Create, FadeIn, Write,
+    UP,
+    BLUE, YELLOW
+)
 
 class TestScene(Scene):
     def construct(self):
@@ -0,0 +1,198 @@
+"""Content-addressed LaTeX cache shared by concurrent render processes.
+
+Manim already skips a formula whose SVG sits in its own ``media/Tex``
+folder, but every fresh media folder, and every worker that reaches the same
+formula at the same moment, runs ``latex`` + ``dvisvgm`` again. This module
+wraps Manim's ``tex_to_svg_file`` with a store in ``.tex_cache/``: the key
+hashes the complete ``.tex`` source together with the compiler and output
+format, so any change to the template or preamble is a different entry.
+
+An ``flock`` on the key's bucket makes the first process compile while the
+others wait and then reuse its SVG; objects are written to a temporary name and
+renamed into place. Hits refresh the object's mtime, and once the store
+exceeds its size cap the least recently used SVGs are removed. Hit and miss
+counts of every process are added to ``stats.json`` when it exits.
+
+Usage:
+    python tex_cache.py manim render -ql regression_math_explained.py  # manim with the cache installed
+    python tex_cache.py stats
+    python tex_cache.py clear
+"""
+import argparse
+import atexit
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = REPO_DIR / ".tex_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+
+@contextmanager
+def file_lock(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class TexCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.locks_dir = self.cache_dir / "locks"
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(tex_source, compiler, output_format):
+        digest = hashlib.sha256()
+        digest.update(f"{compiler}\n{output_format}\n".encode())
+        digest.update(tex_source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def object_path(self, key):
+        return self.objects_dir / key[:2] / f"{key}.svg"
+
+    def fetch(self, key, svg_file, compile_svg):
+        """Put the SVG for ``key`` at ``svg_file``, calling ``compile_svg()`` only on a miss."""
+        cached = self.object_path(key)
+        if not cached.exists():
+            with file_lock(self.locks_dir / f"{key[:2]}.lock"):
+                # Another worker may have compiled it while we waited
+                if not cached.exists():
+                    self.stats["misses"] += 1
+                    compiled = Path(compile_svg())
+                    cached.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+                    shutil.copyfile(compiled, tmp)
+                    os.replace(tmp, cached)
+                    self.evict()
+                    if compiled != svg_file:
+                        shutil.copyfile(cached, svg_file)
+                    return svg_file
+        self.stats["hits"] += 1
+        try:
+            os.utime(cached)
+            shutil.copyfile(cached, svg_file)
+        except FileNotFoundError:
+            # Evicted by another process between the check and the copy
+            self.stats["hits"] -= 1
+            return self.fetch(key, svg_file, compile_svg)
+        return svg_file
+
+    def objects(self):
+        return list(self.objects_dir.glob("*/*.svg"))
+
+    def size(self):
+        return sum(path.stat().st_size for path in self.objects())
+
+    def evict(self):
+        with file_lock(self.cache_dir / "evict.lock"):
+            entries = []
+            for path in self.objects():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.stats["evictions"] += 1
+
+    def flush_stats(self):
+        """Add this process's counters to the shared totals in ``stats.json``."""
+        if not any(self.stats.values()):
+            return
+        path = self.cache_dir / "stats.json"
+        with file_lock(self.cache_dir / "stats.lock"):
+            try:
+                totals = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                totals = {}
+            for name, count in self.stats.items():
+                totals[name] = totals.get(name, 0) + count
+            path.write_text(json.dumps(totals, indent=1), encoding="utf-8")
+        self.stats = dict.fromkeys(self.stats, 0)
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+
+def install(cache=None):
+    """Route every Tex/MathTex compilation in this process through ``cache``."""
+    from manim import config
+    from manim.mobject.text import tex_mobject
+    from manim.utils import tex_file_writing
+
+    if cache is None:
+        cache = TexCache(
+            os.environ.get("TEX_CACHE_DIR", DEFAULT_CACHE_DIR),
+            int(os.environ.get("TEX_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        )
+    original = tex_file_writing.tex_to_svg_file
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        tex_file = tex_file_writing.generate_tex_file(expression, environment, tex_template)
+        svg_file = tex_file.with_suffix(".svg")
+        if svg_file.exists():
+            return svg_file
+        key = cache.key(
+            tex_file.read_text(encoding="utf-8"),
+            tex_template.tex_compiler,
+            tex_template.output_format,
+        )
+        return cache.fetch(key, svg_file, lambda: original(expression, environment, tex_template))
+
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    atexit.register(cache.flush_stats)
+    return cache
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["manim"]:
+        install()
+        from manim.__main__ import main as manim_main
+        return manim_main(args=argv[1:], prog_name="manim")
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the shared LaTeX cache.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--cache-dir", default=os.environ.get("TEX_CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+    args = parser.parse_args(argv)
+
+    cache = TexCache(args.cache_dir)
+    if args.command == "clear":
+        cache.clear()
+        return 0
+    try:
+        totals = json.loads((cache.cache_dir / "stats.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        totals = {}
+    hits, misses = totals.get("hits", 0), totals.get("misses", 0)
+    ratio = hits / (hits + misses) if hits + misses else 0.0
+    print(f"{len(cache.objects())} formulas, {cache.size() / 1024 ** 2:.1f} MiB")
+    print(f"hits {hits}, misses {misses}, evictions {totals.get('evictions', 0)} (hit rate {ratio:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
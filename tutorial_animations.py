@@ -0,0 +1,25 @@
+"""Reusable animations shared by the tutorial scenes."""
+from manim import LaggedStart
+
+
+class StaggeredRecolor(LaggedStart):
+    """Recolour every member of ``group`` one after another in a single ``play`` call.
+
+    ``colors`` is either one colour for the whole group or one colour per
+    member. Each member takes ``per_element_delay`` seconds, so with the default
+    ``lag_ratio=1`` the sweep looks like a loop of tiny ``play`` calls but
+    produces one partial movie file instead of one per member.
+
+    Example:
+        self.play(StaggeredRecolor(dots, [YELLOW, BLUE, GREEN, ...]))
+    """
+
+    def __init__(self, group, colors, per_element_delay=0.03, lag_ratio=1, **kwargs):
+        members = list(group)
+        if not isinstance(colors, (list, tuple)):
+            colors = [colors] * len(members)
+        if len(colors) != len(members):
+            raise ValueError(f"Expected {len(members)} colours, got {len(colors)}")
+        animations = [member.animate.set_color(color) for member, color in zip(members, colors)]
+        kwargs.setdefault("run_time", per_element_delay * (1 + (len(members) - 1) * lag_ratio))
+        super().__init__(*animations, lag_ratio=lag_ratio, **kwargs)
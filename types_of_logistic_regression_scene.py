@@ -1,4 +1,10 @@
-from manim import *
+from manim import (
+    Scene,
+    Text, VGroup,
+    FadeIn, FadeOut, Write,
+    DOWN, LEFT, ORIGIN, UP,
+    BLUE, GREEN, ORANGE, WHITE, YELLOW
+)
 
 class TypesOfLogisticRegression(Scene):
     def construct(self):
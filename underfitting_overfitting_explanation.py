@@ -1,5 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    Axes, Text, VGroup,
+    FadeIn, FadeOut,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLUE, GREEN, GREY, ORANGE, PURPLE, WHITE, YELLOW
+)
 import numpy as np
+from data_table import Table
+from scatter import Scatter
 
 class UnderfittingOverfittingExplanation(Scene):
     def construct(self):
@@ -46,7 +54,7 @@ class UnderfittingOverfittingExplanation(Scene):
         # Example data
         x = np.linspace(0.5, 7.5, 8)
         y = 2 + 0.6*x + 0.5*np.sin(x)
-        scatter = VGroup(*[Dot(axes.c2p(xi, yi), color=WHITE, radius=0.09) for xi, yi in zip(x, y)])
+        scatter = Scatter(np.column_stack([x, y]), axes, colors=WHITE, radius=0.09)
         # Underfit: straight line
         underfit_curve = axes.plot(lambda x: 2 + 0.6*x, color=YELLOW, x_range=[0, 8], stroke_width=4)
         # Good fit: smooth curve
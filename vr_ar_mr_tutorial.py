@@ -1,4 +1,13 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Circle, Dot, Line, Mobject, Polygon, Rectangle,
+    RoundedRectangle, Square, Text, Triangle, VGroup,
+    FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GRAY, GREEN, MAROON_E, PURPLE_E, TEAL_E, WHITE, YELLOW,
+    YELLOW_E
+)
+from components import lock_icon
 
 class VRARMRTutorial(Scene):
     def construct(self):
@@ -77,7 +86,7 @@ class VRARMRTutorial(Scene):
         icons = VGroup(
             self._badge("Cost", self._icon_money(), GRAY),
             self._badge("Comfort", self._icon_face_dizzy(), YELLOW_E),
-            self._badge("Privacy", self._icon_lock(), TEAL_E),
+            self._badge("Privacy", lock_icon(), TEAL_E),
             self._badge("Content", self._icon_box_apps(), BLUE_E)
         ).arrange(RIGHT, buff=0.6).next_to(bullets, DOWN, buff=0.8)
         self.play(FadeIn(icons, shift=UP))
@@ -149,14 +158,6 @@ class VRARMRTutorial(Scene):
         mouth = ArcBetweenPoints(LEFT*0.08, RIGHT*0.08, angle=-PI/4, color=WHITE)
         return VGroup(face, eyes, mouth)
 
-    def _icon_lock(self) -> VGroup:
-        lock = VGroup(
-            RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
-            ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
-            Dot(radius=0.05, color=WHITE)
-        )
-        return lock
-
     def _icon_box_apps(self) -> VGroup:
         grid = VGroup(*[Square(0.14, color=WHITE) for _ in range(6)]).arrange_in_grid(rows=2, cols=3, buff=0.06)
         return grid
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Arc, ArcBetweenPoints, Arrow, Circle, Dot, Ellipse, Line, Mobject, Rectangle,
+    RoundedRectangle, Text, VGroup,
+    FadeIn, FadeOut, GrowArrow, Write,
+    DOWN, LEFT, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_D, BLUE_E, GREEN, GREEN_D, MAROON_A, PURPLE, PURPLE_D, TEAL_E,
+    WHITE, YELLOW, YELLOW_D
+)
 
 class WhatIsComputerTutorial(Scene):
     def construct(self):
@@ -1,15 +1,25 @@
-from manim import *
+from manim import (
+    Scene,
+    Arrow, Circle, Line, Rectangle, RoundedRectangle, SurroundingRectangle, Text,
+    VGroup,
+    Create, FadeOut, GrowArrow, Transform, Write,
+    DOWN, LEFT, ORIGIN, RIGHT, UP,
+    BLACK, BLUE, BLUE_C, BLUE_E, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW
+)
+from sectioned_scene import SectionedScene
 
-class WhileLoopTutorial(Scene):
-    def construct(self):
+class WhileLoopTutorial(SectionedScene, Scene):
+    sections = (
         # Scene 1: Introduction
-        self.intro_scene()
-        
+        "intro_scene",
         # Scene 2: Syntax
-        self.syntax_scene()
-        
+        "syntax_scene",
         # Scene 3: Under the Hood
-        self.under_the_hood_scene()
+        "condition_checking",
+        "water_bottle_example",
+        "guard_analogy",
+        "show_final_message",
+    )
     
     def intro_scene(self):
         # Title
@@ -186,19 +196,6 @@ while count < 5:    # Condition
         self.wait(2)
         self.play(*[FadeOut(mob) for mob in self.mobjects])
     
-    def under_the_hood_scene(self):
-        # Scene 1: Condition Checking
-        self.condition_checking()
-        
-        # Scene 2: Water Bottle Example
-        self.water_bottle_example()
-        
-        # Scene 3: Guard Analogy
-        self.guard_analogy()
-        
-        # Final message
-        self.show_final_message()
-    
     def condition_checking(self):
         # Title
         title = Text("🔄 How While Loops Work", font_size=42, color=ORANGE)
@@ -519,8 +516,3 @@ print("Bottle is full!")'''
         self.play(Write(final))
         self.wait(2)
         self.clear()
-
-# For the person SVG (fallback if not available)
-class Person(Circle):
-    def __init__(self, **kwargs):
-        super().__init__(radius=0.5, color=WHITE, fill_opacity=1, **kwargs)
@@ -1,4 +1,12 @@
-from manim import *
+from manim import (
+    Scene,
+    Circle, Line, Mobject, RoundedRectangle, Text,
+    VGroup,
+    FadeIn, Write,
+    DOWN, LEFT, ORIGIN, PI, RIGHT, UP,
+    BLACK, BLUE, BLUE_E, GREEN, PURPLE_E, TEAL_E, WHITE, YELLOW, YELLOW_E
+)
+from components import browser_icon, lock_icon, server_icon
 
 class WorldWideWebTutorial(Scene):
     def construct(self):
@@ -28,7 +36,7 @@ class WorldWideWebTutorial(Scene):
 
         # Visuals: servers (books), browser, search engine
         servers = self._server_row()
-        browser = self._badge("Browser", self._icon_browser(), TEAL_E)
+        browser = self._badge("Browser", browser_icon(), TEAL_E)
         search = self._badge("Search Engine", self._icon_search(), YELLOW_E)
         visuals = VGroup(servers, VGroup(browser, search).arrange(RIGHT, buff=0.8)).arrange(DOWN, buff=0.8).next_to(bullets, DOWN, buff=0.8)
         self.play(FadeIn(visuals, shift=UP))
@@ -52,9 +60,9 @@ class WorldWideWebTutorial(Scene):
         self.play(Write(bullets))
 
         row = VGroup(
-            self._badge("Browser", self._icon_browser(), BLUE_E),
+            self._badge("Browser", browser_icon(), BLUE_E),
             self._badge("Search Engine", self._icon_search(), TEAL_E),
-            self._badge("HTTPS", self._icon_lock(), PURPLE_E)
+            self._badge("HTTPS", lock_icon(), PURPLE_E)
         ).arrange(RIGHT, buff=0.8).next_to(bullets, DOWN, buff=0.8)
         self.play(FadeIn(row, shift=UP))
         self.wait(1.5)
@@ -82,35 +90,11 @@ class WorldWideWebTutorial(Scene):
 
     def _server_row(self) -> VGroup:
         # Row of server racks to represent many websites/pages on servers
-        racks = VGroup(*[self._icon_server() for _ in range(4)]).arrange(RIGHT, buff=0.5)
+        racks = VGroup(*[server_icon() for _ in range(4)]).arrange(RIGHT, buff=0.5)
         label = Text("Servers hosting websites", font_size=22, color=WHITE).next_to(racks, DOWN, buff=0.2)
         return VGroup(racks, label)
 
-    def _icon_server(self) -> VGroup:
-        rack = VGroup(
-            RoundedRectangle(width=0.8, height=1.2, corner_radius=0.06, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(UP*0.25),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE),
-            Line(LEFT*0.25, RIGHT*0.25, color=WHITE).shift(DOWN*0.25)
-        )
-        leds = VGroup(*[Dot(radius=0.03, color=GREEN).shift(DOWN*0.4 + RIGHT*(i*0.08 - 0.2)) for i in range(5)])
-        return VGroup(rack, leds)
-
-    def _icon_browser(self) -> VGroup:
-        window = RoundedRectangle(width=1.6, height=1.0, corner_radius=0.08, color=WHITE)
-        tab = Rectangle(width=0.6, height=0.15, color=WHITE).next_to(window, UP, buff=0)
-        buttons = VGroup(*[Dot(radius=0.04, color=c) for c in (RED, YELLOW, GREEN)]).arrange(RIGHT, buff=0.06).next_to(window.get_top(), DOWN, buff=0.02)
-        return VGroup(window, tab, buttons)
-
     def _icon_search(self) -> VGroup:
         circle = Circle(radius=0.2, color=WHITE)
         handle = Line(ORIGIN, RIGHT*0.25, color=WHITE).rotate(PI/4).next_to(circle, RIGHT, buff=0.02)
         return VGroup(circle, handle)
-
-    def _icon_lock(self) -> VGroup:
-        lock = VGroup(
-            RoundedRectangle(width=0.7, height=0.7, corner_radius=0.12, color=WHITE),
-            ArcBetweenPoints(LEFT*0.25, RIGHT*0.25, angle=PI/1.2, color=WHITE).shift(UP*0.5),
-            Dot(radius=0.05, color=WHITE)
-        )
-        return lock